@@ -4,11 +4,15 @@ from datetime import datetime, timedelta
 import random
 import json
 import os
+from janus_formulas import FORMULAS
+from janus_persistence import writer
 
 # Battle System Setup
 BATTLE_COOLDOWN = timedelta(hours=24)
 BATTLES_PER_DAY = 10
 CHARACTER_DB = "characters.json"
+CHARACTER_FORMULAS = FORMULAS["autobattle"]
+ENEMY_FORMULAS = FORMULAS["autobattle_enemy"]
 
 class Character:
     def __init__(self, name, level=1):
@@ -18,12 +22,7 @@ class Character:
         self.next_level_exp = 100 * level
         self.last_battle_time = None
         self.battles_today = 0
-        self.stats = {
-            "ATK": 5 + level * 2,
-            "DEF": 3 + level * 1.5,
-            "HP": 50 + level * 10,
-            "DEX": 5 + level * 1.2
-        }
+        self.stats = CHARACTER_FORMULAS(level=level)
     
     def to_dict(self):
         return {
@@ -67,24 +66,16 @@ class Character:
             self.level += 1
             self.exp -= self.next_level_exp
             self.next_level_exp = 100 * self.level
-            self.stats = {
-                "ATK": 5 + self.level * 2,
-                "DEF": 3 + self.level * 1.5,
-                "HP": 50 + self.level * 10,
-                "DEX": 5 + self.level * 1.2
-            }
+            self.stats = CHARACTER_FORMULAS(level=self.level)
             return True
         return False
 
-def load_characters():
-    if os.path.exists(CHARACTER_DB):
-        with open(CHARACTER_DB, "r") as f:
-            return {name: Character.from_dict(data) for name, data in json.load(f).items()}
-    return {}
+async def load_characters():
+    data = await writer.read_json(CHARACTER_DB, default={})
+    return {name: Character.from_dict(char_data) for name, char_data in data.items()}
 
-def save_characters(characters):
-    with open(CHARACTER_DB, "w") as f:
-        json.dump({name: char.to_dict() for name, char in characters.items()}, f, indent=2)
+async def save_characters(characters):
+    await writer.write_json(CHARACTER_DB, {name: char.to_dict() for name, char in characters.items()})
 
 # Discord Bot Setup
 intents = discord.Intents.default()
@@ -104,21 +95,28 @@ async def on_ready():
 @bot.tree.command(name="autobattle", description="Start an auto-battle sequence")
 @app_commands.describe(character="Your character's name")
 async def autobattle(interaction: discord.Interaction, character: str):
-    characters = load_characters()
+    # Load -> battle -> save runs under the file lock, so two overlapping
+    # battles can't each save over the other's result. The reply is sent
+    # after the lock is released so no battle waits on another's network I/O.
+    async with writer.lock(CHARACTER_DB):
+        reply = await run_autobattle(character)
+    await interaction.response.send_message(**reply)
+
+async def run_autobattle(character: str):
+    """Fight one battle and save the result; returns the `send_message` arguments for the reply"""
+    characters = await load_characters()
     
     if character not in characters:
-        await interaction.response.send_message(f"❌ Character {character} doesn't exist!", ephemeral=True)
-        return
+        return {"content": f"❌ Character {character} doesn't exist!", "ephemeral": True}
     
     char = characters[character]
     
     if not char.can_battle():
         cooldown = char.time_until_next_battle()
-        await interaction.response.send_message(
-            f"⏳ {character} has battled too much today! Next battle available in: {cooldown}",
-            ephemeral=True
-        )
-        return
+        return {
+            "content": f"⏳ {character} has battled too much today! Next battle available in: {cooldown}",
+            "ephemeral": True
+        }
     
     # Generate enemy based on character level
     enemy_level = max(1, char.level + random.randint(-2, 2))
@@ -129,11 +127,7 @@ async def autobattle(interaction: discord.Interaction, character: str):
     enemy_type = random.choice(enemy_types)
     
     # Calculate battle stats
-    enemy_stats = {
-        "HP": 30 + enemy_level * 8,
-        "ATK": 5 + enemy_level * 3,
-        "DEF": 2 + enemy_level * 2
-    }
+    enemy_stats = ENEMY_FORMULAS(level=enemy_level)
     
     player_dmg = max(1, char.stats["ATK"] - enemy_stats["DEF"] // 2)
     enemy_dmg = max(1, enemy_stats["ATK"] - char.stats["DEF"] // 2)
@@ -195,7 +189,7 @@ async def autobattle(interaction: discord.Interaction, character: str):
     # Update character
     char.battles_today += 1
     char.last_battle_time = datetime.now()
-    save_characters(characters)
+    await save_characters(characters)
     
     # Create battle embed
     embed = discord.Embed(
@@ -217,25 +211,27 @@ async def autobattle(interaction: discord.Interaction, character: str):
              f"Next battle: {char.time_until_next_battle()}"
     )
     
-    await interaction.response.send_message(embed=embed)
+    return {"embed": embed}
 
 @bot.tree.command(name="create_character", description="Create a new character")
 @app_commands.describe(name="Your character's name")
 async def create_character(interaction: discord.Interaction, name: str):
-    characters = load_characters()
+    async with writer.lock(CHARACTER_DB):
+        characters = await load_characters()
+        exists = name in characters
+        if not exists:
+            characters[name] = Character(name)
+            await save_characters(characters)
     
-    if name in characters:
+    if exists:
         await interaction.response.send_message(f"❌ Character {name} already exists!", ephemeral=True)
         return
-    
-    characters[name] = Character(name)
-    save_characters(characters)
     await interaction.response.send_message(f"✅ Created new character: {name} (Level 1)")
 
 @bot.tree.command(name="character_info", description="View character stats")
 @app_commands.describe(name="Your character's name")
 async def character_info(interaction: discord.Interaction, name: str):
-    characters = load_characters()
+    characters = await load_characters()
     
     if name not in characters:
         await interaction.response.send_message(f"❌ Character {name} doesn't exist!", ephemeral=True)
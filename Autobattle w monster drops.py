@@ -8,6 +8,9 @@ import json
 import os
 from typing import Dict, List, Tuple, Optional
 
+from janus_loot import LootTable
+from janus_persistence import writer
+
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
@@ -25,10 +28,9 @@ def load_data():
             return json.load(f)
     return {}
 
-# Save player data
-def save_data():
-    with open(DATA_FILE, 'w') as f:
-        json.dump({k: v.__dict__ for k, v in players.items()}, f, indent=2)
+# Save player data (snapshot now, serialize and write on the writer thread)
+async def save_data():
+    await writer.write_json(DATA_FILE, {k: v.to_dict() for k, v in players.items()})
 
 # Game classes
 class Player:
@@ -68,7 +70,7 @@ class Player:
             'alive': self.alive,
             'last_battle_time': self.last_battle_time.isoformat() if self.last_battle_time else None,
             'cooldown_complete': self.cooldown_complete,
-            'equipment': self.equipment,
+            'equipment': dict(self.equipment),
             'gold': self.gold,
             'kills': self.kills,
             'deaths': self.deaths
@@ -133,15 +135,18 @@ class Monster:
         self.exp = exp
         self.drops = drops
         self.gold_range = gold_range
+        # Compiled once; drop chances are percentages
+        self.loot = LootTable((item_name, drop_chance / 100, min_qty, max_qty) for item_name, min_qty, max_qty, drop_chance in drops)
+        self.gold = LootTable([("gold", 1.0, *gold_range)])
     
     def calculate_drops(self) -> Tuple[List[Tuple[str, int]], int]:
-        drops = []
-        for item_name, min_qty, max_qty, drop_chance in self.drops:
-            if random.random() * 100 <= drop_chance:
-                quantity = random.randint(min_qty, max_qty)
-                drops.append((item_name, quantity))
-        gold = random.randint(*self.gold_range)
+        drops = list(self.loot.roll().items())
+        gold = self.gold.roll()["gold"]
         return drops, gold
+    
+    def calculate_drops_batch(self, n: int) -> Tuple[Dict[str, int], int]:
+        """Total drops and gold from `n` kills in one vectorized roll"""
+        return self.loot.roll_batch(n), self.gold.roll_batch(n).get("gold", 0)
 
 # Item database
 ITEM_STATS = {
@@ -298,7 +303,7 @@ async def daily_auto_battle(ctx: commands.Context):
         embed.add_field(name="Status", value="You almost died in battle but managed to run away! Use `!rest` to recover.", inline=False)
     
     await ctx.send(embed=embed)
-    save_data()
+    await save_data()
 
 @bot.command(name="profile", help="View your player profile")
 async def player_profile(ctx: commands.Context):
@@ -396,7 +401,7 @@ async def equip_item(ctx: commands.Context, *, item_name: str):
         color=discord.Color.green()
     )
     await ctx.send(embed=embed)
-    save_data()
+    await save_data()
 
 @bot.command(name="rest", help="Rest to reset your daily battles and heal")
 async def rest(ctx: commands.Context):
@@ -409,7 +414,7 @@ async def rest(ctx: commands.Context):
         color=discord.Color.green()
     )
     await ctx.send(embed=embed)
-    save_data()
+    await save_data()
 
 @bot.command(name="help", help="Show all available commands")
 async def show_help(ctx: commands.Context):
@@ -436,7 +441,7 @@ async def show_help(ctx: commands.Context):
 # Background tasks
 @tasks.loop(minutes=5)
 async def auto_save():
-    save_data()
+    await save_data()
     print("Player data saved.")
 
 @bot.event
@@ -1,17 +1,386 @@
-import json
-import os
+import asyncio
 import discord
 from discord.ext import commands
+from janus_cache import LRUCache
+from janus_character_store import CharacterStore
+from janus_formulas import FORMULAS
+from janus_persistence import writer
+from janus_progression import ASCENSION_LEVELS, PROGRESSION, STATUS_POINTS_PER_LEVEL
+from janus_prompts import PromptDispatcher
+from typing import Dict, NamedTuple, Tuple
+
+# Lets `!grant` target roles. Also turn on Server Members Intent in the developer portal before enabling
+GRANT_ROLE_TARGETS = False
 
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+intents.members = GRANT_ROLE_TARGETS
+
+class GrowthBot(commands.Bot):
+    async def close(self):
+        # Write back edits made since the last save before the connection goes away
+        try:
+            await characters.flush()
+            await writer.run(character_store.close)
+        finally:
+            await super().close()
+
+bot = GrowthBot(command_prefix='!', intents=intents)
+# Replies to multi-step commands, routed by (channel, author)
+prompts = PromptDispatcher()
+
+GROWTH_FORMULAS = FORMULAS["growth"]
+
+class LevelUpResult(NamedTuple):
+    old_level: int
+    new_level: int
+    exp_added: int
+    points_gained: int
+    # Levels of every ascension crossed, in order
+    ascension_levels: Tuple[int, ...]
+    # Base HP/MP/ATK/DEF before the EXP was added
+    old_stats: Dict[str, float]
+
+# Discord allows at most 10 embeds per message
+MAX_EMBEDS_PER_MESSAGE = 10
+PROGRESSION_PAGE_SIZE = 10
+# Menus stay usable this long after the command that opened them
+MENU_TIMEOUT = 300
+
+# Status points fields in allocation order: (label, Character attribute)
+ALLOCATION_STATS = (("VIT", "vit"), ("INT", "int"), ("STR", "str"), ("DEF", "def_stat"), ("AGI", "agi"))
+# Equipment slot -> (bonus key, label, numeric)
+EQUIPMENT_FIELDS = {
+    "weapon": ("attack", "Attack bonus", True),
+    "armor": ("defense", "Defense bonus", True),
+    "accessory": ("effect", "Effect", False),
+}
+
+def level_base_stats(level, ascended=True):
+    """Base HP/MP/ATK/DEF at `level`, with or without that level's own ascension applied"""
+    level_stats = PROGRESSION[level]
+    if ascended or level == 1:
+        return {"HP": level_stats.base_hp, "MP": level_stats.base_mp, "ATK": level_stats.base_atk, "DEF": level_stats.base_def}
+    multiplier = PROGRESSION[level - 1].ascension_multiplier
+    return {
+        "HP": int(round(level_stats.raw_hp * multiplier)),
+        "MP": round(level_stats.raw_mp * multiplier, 1),
+        "ATK": round(level_stats.raw_atk * multiplier, 1),
+        "DEF": round(level_stats.raw_def * multiplier, 1),
+    }
+
+class ProgressionEvent(NamedTuple):
+    kind: str  # "level", "ascension" or "points"
+    level: int
+    # stat -> (before, after)
+    changes: Dict[str, Tuple[float, float]]
+
+class ProgressionEvents:
+    """Collects the level-ups, ascensions and status point rewards of EXP grants.
+    
+    Everything is rendered as one summary message (at most 10 embeds) instead
+    of a message per level. Per-level events are only expanded when the detail
+    pages are requested.
+    """
+    def __init__(self, character):
+        self.character = character
+        self.results = []
+        self._events = None
+    
+    def collect(self, result):
+        self.results.append(result)
+        self._events = None
+    
+    @property
+    def old_level(self):
+        return self.results[0].old_level
+    
+    @property
+    def new_level(self):
+        return self.results[-1].new_level
+    
+    @property
+    def levels_gained(self):
+        return self.new_level - self.old_level if self.results else 0
+    
+    @property
+    def ascension_levels(self):
+        return tuple(level for result in self.results for level in result.ascension_levels)
+    
+    @property
+    def points_gained(self):
+        return sum(result.points_gained for result in self.results)
+    
+    @property
+    def events(self):
+        """Every level-up, ascension and point reward in order"""
+        if self._events is None:
+            events = []
+            points = self.character.unallocated_points - self.points_gained
+            for level in range(self.old_level + 1, self.new_level + 1):
+                before = level_base_stats(level - 1)
+                reached = level_base_stats(level, ascended=False)
+                events.append(ProgressionEvent("level", level, {stat: (before[stat], reached[stat]) for stat in before}))
+                if level in ASCENSION_LEVELS:
+                    ascended = level_base_stats(level)
+                    events.append(ProgressionEvent("ascension", level, {stat: (reached[stat], ascended[stat]) for stat in reached}))
+                events.append(ProgressionEvent("points", level, {"Points": (points, points + STATUS_POINTS_PER_LEVEL)}))
+                points += STATUS_POINTS_PER_LEVEL
+            self._events = events
+        return self._events
+    
+    def summary_embeds(self):
+        """One level-up embed, one per ascension and one status point embed"""
+        character = self.character
+        old_stats = self.results[0].old_stats
+        new_stats = character.base_stats()
+        
+        embed = discord.Embed(
+            title="Level Up!",
+            description=f"Level {self.old_level} {character.name} levels up to level {self.new_level}!",
+            color=0xffd700
+        )
+        embed.add_field(name="Increasing base stats", value="\u200b", inline=False)
+        for stat, old_value in old_stats.items():
+            embed.add_field(name=stat, value=f"{old_value} → {new_stats[stat]}", inline=True)
+        if self.levels_gained > 1:
+            embed.set_footer(text=f"+{self.levels_gained} levels. Press Details for a level-by-level breakdown.")
+        embeds = [embed]
+        
+        for level in self.ascension_levels:
+            before = level_base_stats(level, ascended=False)
+            after = level_base_stats(level)
+            ascension_embed = discord.Embed(
+                title=f"**{character.name.upper()} IS ASCENDING!**",
+                description=f"**{character.name} felt their power increasing...**\nYour base stats received +10% boost in all stats except speed through your ascension.",
+                color=0xff00ff
+            )
+            for stat in before:
+                ascension_embed.add_field(name=stat, value=f"{before[stat]} → {after[stat]}", inline=True)
+            ascension_embed.set_footer(text=f"Ascension {PROGRESSION[level].ascension} at level {level}")
+            embeds.append(ascension_embed)
+        
+        stats_embed = discord.Embed(
+            title="Status Points Applied",
+            color=0x00ff00
+        )
+        stats = character.derived_stats()
+        stats_embed.add_field(name="VIT", value=f"{character.vit}\t\tHP: {stats['modified_hp']}", inline=False)
+        stats_embed.add_field(name="INT", value=f"{character.int}\t\tMP: {stats['modified_mp']}", inline=False)
+        stats_embed.add_field(name="STR", value=f"{character.str}\t\tATK: {stats['modified_atk']}", inline=False)
+        stats_embed.add_field(name="DEF", value=f"{character.def_stat}\t\tDEF: {stats['modified_def']}", inline=False)
+        stats_embed.add_field(name="AGI", value=f"{character.agi}\t\tSpeed: {stats['modified_speed']}", inline=False)
+        stats_embed.add_field(
+            name="Reward",
+            value=f"You have been rewarded with +{self.points_gained} status points from leveling up.\nTotal unallocated points: {character.unallocated_points}",
+            inline=False
+        )
+        # Ascensions past the embed limit are still listed in the detail pages
+        return embeds[:MAX_EMBEDS_PER_MESSAGE - 1] + [stats_embed]
+    
+    def detail_pages(self, page_size=PROGRESSION_PAGE_SIZE):
+        """Per-level breakdown, `page_size` levels per embed"""
+        lines_by_level = {}
+        for event in self.events:
+            if event.kind == "level":
+                text = ", ".join(f"{stat} {before} → {after}" for stat, (before, after) in event.changes.items())
+                line = f"**Lv {event.level}:** {text}"
+            elif event.kind == "ascension":
+                text = ", ".join(f"{stat} {before} → {after}" for stat, (before, after) in event.changes.items())
+                line = f"✨ **Ascension {PROGRESSION[event.level].ascension}:** {text}"
+            else:
+                before, after = event.changes["Points"]
+                line = f"+{after - before} status points ({after} unallocated)"
+            lines_by_level.setdefault(event.level, []).append(line)
+        
+        levels = sorted(lines_by_level)
+        chunks = [levels[i:i + page_size] for i in range(0, len(levels), page_size)]
+        pages = []
+        for number, chunk in enumerate(chunks, 1):
+            page = discord.Embed(
+                title=f"{self.character.name}: Level {chunk[0] - 1} → {chunk[-1]}",
+                description="\n".join(line for level in chunk for line in lines_by_level[level]),
+                color=0xffd700
+            )
+            page.set_footer(text=f"Page {number}/{len(chunks)}")
+            pages.append(page)
+        return pages
+
+class ProgressionDetailView(discord.ui.View):
+    """Details button under a progression summary, paging through `ProgressionEvents.detail_pages`"""
+    def __init__(self, events, user_id, timeout=300):
+        super().__init__(timeout=timeout)
+        self.events = events
+        self.user_id = user_id
+        self.pages = None
+    
+    async def interaction_check(self, interaction):
+        return interaction.user.id == self.user_id
+    
+    @discord.ui.button(label="Details", style=discord.ButtonStyle.primary)
+    async def details(self, interaction, button):
+        self.pages = self.pages or self.events.detail_pages()
+        await interaction.response.send_message(embed=self.pages[0], view=ProgressionPageView(self.pages, self.user_id), ephemeral=True)
+
+class ProgressionPageView(discord.ui.View):
+    def __init__(self, pages, user_id, timeout=300):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.user_id = user_id
+        self.page = 0
+        self.update_buttons()
+    
+    def update_buttons(self):
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page >= len(self.pages) - 1
+    
+    async def interaction_check(self, interaction):
+        return interaction.user.id == self.user_id
+    
+    async def show(self, interaction):
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+    
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction, button):
+        self.page = max(0, self.page - 1)
+        await self.show(interaction)
+    
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction, button):
+        self.page = min(len(self.pages) - 1, self.page + 1)
+        await self.show(interaction)
+
+class AllocationView(discord.ui.View):
+    """Allocate button under `!allocate`, opening one modal for all five stats.
+    
+    Views and modals only keep the user ID and look the character up again
+    when used, so an edit made after the cache dropped the character still
+    lands on the copy the bot saves.
+    """
+    def __init__(self, user_id, timeout=MENU_TIMEOUT):
+        super().__init__(timeout=timeout)
+        self.user_id = user_id
+    
+    async def interaction_check(self, interaction):
+        return interaction.user.id == self.user_id
+    
+    @discord.ui.button(label="Allocate", style=discord.ButtonStyle.primary)
+    async def allocate(self, interaction, button):
+        character = await characters.get(str(self.user_id))
+        if character is None:
+            await interaction.response.send_message("You don't have a character anymore.", ephemeral=True)
+            return
+        if character.unallocated_points <= 0:
+            await interaction.response.send_message("No status points left to allocate.", ephemeral=True)
+            return
+        await interaction.response.send_modal(AllocationModal(character, self.user_id))
+
+class AllocationModal(discord.ui.Modal):
+    def __init__(self, character, user_id):
+        super().__init__(title=f"Allocate {character.unallocated_points} status points")
+        self.user_id = user_id
+        self.inputs = {}
+        for label, attribute in ALLOCATION_STATS:
+            field = discord.ui.TextInput(label=f"{label} (now {getattr(character, attribute)})", default="0", required=False, max_length=4)
+            self.inputs[label] = field
+            self.add_item(field)
+    
+    async def on_submit(self, interaction):
+        points = {}
+        for label, field in self.inputs.items():
+            value = field.value.strip() or "0"
+            if not value.isdigit():
+                await interaction.response.send_message(f"{label} must be a whole number of points.", ephemeral=True)
+                return
+            points[label] = int(value)
+        
+        character = await characters.get(str(self.user_id))
+        if character is None:
+            await interaction.response.send_message("You don't have a character anymore.", ephemeral=True)
+            return
+        total = sum(points.values())
+        if total > character.unallocated_points:
+            await interaction.response.send_message(
+                f"Not enough status points available (have {character.unallocated_points}, requested {total})",
+                ephemeral=True
+            )
+            return
+        
+        await interaction.response.defer()
+        # Looked up again after the defer, in case the cache dropped it meanwhile
+        character = await characters.get(str(self.user_id))
+        if character is None:
+            return
+        await character.allocate_stats(interaction.followup, points["VIT"], points["INT"], points["STR"], points["DEF"], points["AGI"])
+
+class EquipmentView(discord.ui.View):
+    """One button per slot under `!equip`; each opens a modal and updates the embed in place"""
+    def __init__(self, user_id, timeout=MENU_TIMEOUT):
+        super().__init__(timeout=timeout)
+        self.user_id = user_id
+    
+    async def interaction_check(self, interaction):
+        return interaction.user.id == self.user_id
+    
+    async def open_modal(self, interaction, slot):
+        character = await characters.get(str(self.user_id))
+        if character is None:
+            await interaction.response.send_message("You don't have a character anymore.", ephemeral=True)
+            return
+        await interaction.response.send_modal(EquipmentModal(character.equipment, self.user_id, slot))
+    
+    @discord.ui.button(label="Weapon", style=discord.ButtonStyle.secondary)
+    async def weapon(self, interaction, button):
+        await self.open_modal(interaction, "weapon")
+    
+    @discord.ui.button(label="Armor", style=discord.ButtonStyle.secondary)
+    async def armor(self, interaction, button):
+        await self.open_modal(interaction, "armor")
+    
+    @discord.ui.button(label="Accessory", style=discord.ButtonStyle.secondary)
+    async def accessory(self, interaction, button):
+        await self.open_modal(interaction, "accessory")
+
+class EquipmentModal(discord.ui.Modal):
+    def __init__(self, equipment, user_id, slot):
+        super().__init__(title=f"Edit {slot.title()}")
+        self.user_id = user_id
+        self.slot = slot
+        self.bonus_key, bonus_label, self.numeric = EQUIPMENT_FIELDS[slot]
+        item = getattr(equipment, slot)
+        self.name_input = discord.ui.TextInput(label="Name", default=item["name"], max_length=100)
+        self.bonus_input = discord.ui.TextInput(label=bonus_label, default=str(item[self.bonus_key]), max_length=10 if self.numeric else 200)
+        self.add_item(self.name_input)
+        self.add_item(self.bonus_input)
+    
+    async def on_submit(self, interaction):
+        bonus = self.bonus_input.value.strip()
+        if self.numeric:
+            try:
+                bonus = int(bonus)
+            except ValueError:
+                await interaction.response.send_message("Please enter a valid number. Equipment unchanged.", ephemeral=True)
+                return
+        
+        character = await characters.get(str(self.user_id))
+        if character is None:
+            await interaction.response.send_message("You don't have a character anymore.", ephemeral=True)
+            return
+        character.equipment.set_item(self.slot, name=self.name_input.value, **{self.bonus_key: bonus})
+        await interaction.response.edit_message(embed=character.equipment.get_equipment_embed())
 
 class Equipment:
     def __init__(self):
         self.weapon = {"name": "None", "attack": 0}
         self.armor = {"name": "None", "defense": 0}
         self.accessory = {"name": "None", "effect": "None"}
+        # Bumped on every change so characters know their stat snapshot is stale
+        self.version = 0
+    
+    def set_item(self, slot, **fields):
+        getattr(self, slot).update(fields)
+        self.version += 1
     
     def get_equipment_embed(self):
         embed = discord.Embed(title="Current Equipment", color=0x00ff00)
@@ -21,65 +390,7 @@ class Equipment:
         return embed
     
     async def edit_equipment(self, ctx):
-        def check(m):
-            return m.author == ctx.author and m.channel == ctx.channel
-        
-        while True:
-            embed = discord.Embed(title="Edit Equipment", color=0x00ff00)
-            embed.add_field(name="1", value="Weapon", inline=False)
-            embed.add_field(name="2", value="Armor", inline=False)
-            embed.add_field(name="3", value="Accessory", inline=False)
-            embed.add_field(name="4", value="Back to Menu", inline=False)
-            
-            await ctx.send(embed=embed)
-            
-            try:
-                choice_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                choice = choice_msg.content.strip()
-                
-                if choice == "1":
-                    await ctx.send("Enter weapon name:")
-                    name_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    self.weapon["name"] = name_msg.content
-                    
-                    await ctx.send("Enter attack bonus:")
-                    attack_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    try:
-                        self.weapon["attack"] = int(attack_msg.content)
-                    except ValueError:
-                        await ctx.send("Please enter a valid number. Setting attack to 0.")
-                        self.weapon["attack"] = 0
-                
-                elif choice == "2":
-                    await ctx.send("Enter armor name:")
-                    name_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    self.armor["name"] = name_msg.content
-                    
-                    await ctx.send("Enter defense bonus:")
-                    defense_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    try:
-                        self.armor["defense"] = int(defense_msg.content)
-                    except ValueError:
-                        await ctx.send("Please enter a valid number. Setting defense to 0.")
-                        self.armor["defense"] = 0
-                
-                elif choice == "3":
-                    await ctx.send("Enter accessory name:")
-                    name_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    self.accessory["name"] = name_msg.content
-                    
-                    await ctx.send("Enter accessory effect:")
-                    effect_msg = await bot.wait_for('message', timeout=30.0, check=check)
-                    self.accessory["effect"] = effect_msg.content
-                
-                elif choice == "4":
-                    break
-                else:
-                    await ctx.send("Invalid choice. Please select 1-4.")
-            
-            except asyncio.TimeoutError:
-                await ctx.send("You took too long to respond. Equipment editing cancelled.")
-                break
+        await ctx.send(embed=self.get_equipment_embed(), view=EquipmentView(ctx.author.id))
 
 class Character:
     def __init__(self, name):
@@ -89,10 +400,11 @@ class Character:
         self.exp_limit = self.calculate_exp_limit()
         
         # Base stats
-        self.base_hp = 100
-        self.base_mp = 23
-        self.base_atk = 8
-        self.base_def = 8
+        level_stats = PROGRESSION[self.level]
+        self.base_hp = level_stats.base_hp
+        self.base_mp = level_stats.base_mp
+        self.base_atk = level_stats.base_atk
+        self.base_def = level_stats.base_def
         self.base_speed = 10
         
         # Status points
@@ -109,144 +421,57 @@ class Character:
         # Ascension tracking
         self.ascension_count = 0
         
+        # Derived stats, rebuilt by `derived_stats` after `invalidate_stats` or an equipment change
+        self._stats = None
+        self._stats_equipment_version = None
+        
     def calculate_exp_limit(self):
-        if self.level <= 5:
-            return self.level * 500
-        elif self.level <= 10:
-            return self.level * 600
-        elif self.level <= 15:
-            return self.level * 700
-        elif self.level <= 20:
-            return self.level * 800
-        elif self.level <= 25:
-            return self.level * 900
-        elif self.level <= 30:
-            return self.level * 1000
-        elif self.level <= 35:
-            return self.level * 1100
-        elif self.level <= 40:
-            return self.level * 1200
-        elif self.level <= 45:
-            return self.level * 1300
-        elif self.level <= 50:
-            return self.level * 1400
-        elif self.level <= 55:
-            return self.level * 1500
-        elif self.level <= 60:
-            return self.level * 1600
-        elif self.level <= 65:
-            return self.level * 1700
-        elif self.level <= 70:
-            return self.level * 1800
-        elif self.level <= 75:
-            return self.level * 1900
-        elif self.level <= 80:
-            return self.level * 2000
-        elif self.level <= 85:
-            return self.level * 2100
-        elif self.level <= 90:
-            return self.level * 2200
-        elif self.level <= 95:
-            return self.level * 2300
-        else:
-            return self.level * 2500
+        return PROGRESSION[self.level].exp_limit
+    
+    def base_stats(self):
+        return {"HP": self.base_hp, "MP": self.base_mp, "ATK": self.base_atk, "DEF": self.base_def}
     
     def add_exp(self, amount):
-        self.exp += amount
-        while self.exp >= self.exp_limit:
-            self.level_up()
-    
-    async def level_up(self, ctx):
-        # Calculate excess EXP
-        excess_exp = self.exp - self.exp_limit
-        self.level += 1
-        self.exp = excess_exp
-        self.exp_limit = self.calculate_exp_limit()
+        """Add EXP and apply every level and ascension it reaches in one step"""
+        if amount < 0:
+            raise ValueError("EXP amount can't be negative")
         
-        # Store old stats for display
-        old_hp = self.base_hp
-        old_mp = self.base_mp
-        old_atk = self.base_atk
-        old_def = self.base_def
+        old_level = self.level
+        old_stats = self.base_stats()
+        total_exp = PROGRESSION[self.level].cumulative_exp + self.exp + amount
+        new_level, self.exp = PROGRESSION.level_for_exp(total_exp)
         
-        # Update base stats
-        self.base_hp = 100 * self.level
-        self.base_mp = 3 * self.level + 20
-        self.base_atk = 3 * self.level + 5
-        self.base_def = 3 * self.level + 5
+        if new_level > old_level:
+            level_stats = PROGRESSION[new_level]
+            self.level = new_level
+            self.exp_limit = self.calculate_exp_limit()
+            # Every ascension up to the new level is already folded into the table's base stats
+            self.ascension_count = level_stats.ascension
+            self.base_hp = level_stats.base_hp
+            self.base_mp = level_stats.base_mp
+            self.base_atk = level_stats.base_atk
+            self.base_def = level_stats.base_def
+            self.unallocated_points += STATUS_POINTS_PER_LEVEL * (new_level - old_level)
+            self.invalidate_stats()
         
-        # Create level up embed
-        embed = discord.Embed(
-            title=f"Level Up!",
-            description=f"Level {self.level-1} {self.name} levels up to level {self.level}!",
-            color=0xffd700
+        return LevelUpResult(
+            old_level=old_level,
+            new_level=self.level,
+            exp_added=amount,
+            points_gained=STATUS_POINTS_PER_LEVEL * (self.level - old_level),
+            ascension_levels=tuple(level for level in ASCENSION_LEVELS if old_level < level <= self.level),
+            old_stats=old_stats
         )
-        
-        embed.add_field(name="Increasing base stats", value="\u200b", inline=False)
-        embed.add_field(name="HP", value=f"{100*(self.level-1)} → {self.base_hp}", inline=True)
-        embed.add_field(name="MP", value=f"{3*(self.level-1)+20} → {self.base_mp}", inline=True)
-        embed.add_field(name="ATK", value=f"{3*(self.level-1)+5} → {self.base_atk}", inline=True)
-        embed.add_field(name="DEF", value=f"{3*(self.level-1)+5} → {self.base_def}", inline=True)
-        
-        await ctx.send(embed=embed)
-        
-        # Check for ascension
-        if self.level in [25, 50, 75, 100]:
-            await self.ascend(ctx)
-        
-        # Add 3 status points
-        self.unallocated_points += 3
-        
-        # Create stats embed
-        stats_embed = discord.Embed(
-            title="Status Points Applied",
-            color=0x00ff00
-        )
-        
-        stats_embed.add_field(name="VIT", value=f"{self.vit}\t\tHP: {self.base_hp + (self.vit * 30)}", inline=False)
-        stats_embed.add_field(name="INT", value=f"{self.int}\t\tMP: {round(self.base_mp + (self.int * 5), 1)}", inline=False)
-        stats_embed.add_field(name="STR", value=f"{self.str}\t\tATK: {round(self.base_atk + (self.str * 2), 1)}", inline=False)
-        stats_embed.add_field(name="DEF", value=f"{self.def_stat}\t\tDEF: {round(self.base_def + self.def_stat, 1)}", inline=False)
-        stats_embed.add_field(name="AGI", value=f"{self.agi}\t\tSpeed: {self.base_speed + self.agi}", inline=False)
-        
-        stats_embed.add_field(
-            name="Reward", 
-            value=f"You have been rewarded with +3 status points from leveling up.\nTotal unallocated points: {self.unallocated_points}",
-            inline=False
-        )
-        
-        await ctx.send(embed=stats_embed)
     
-    async def ascend(self, ctx):
-        self.ascension_count += 1
-        
-        # Store old base stats
-        old_hp = self.base_hp
-        old_mp = self.base_mp
-        old_atk = self.base_atk
-        old_def = self.base_def
-        
-        # Apply 10% boost
-        self.base_hp = int(self.base_hp * 1.1)
-        self.base_mp = round(self.base_mp * 1.1, 1)
-        self.base_atk = round(self.base_atk * 1.1, 1)
-        self.base_def = round(self.base_def * 1.1, 1)
-        
-        # Create ascension embed
-        embed = discord.Embed(
-            title=f"**{self.name.upper()} IS ASCENDING!**",
-            description=f"**{self.name} felt their power increasing...**\nYour base stats received +10% boost in all stats except speed through your ascension.",
-            color=0xff00ff
-        )
-        
-        embed.add_field(name="HP", value=f"{old_hp} → {self.base_hp}", inline=True)
-        embed.add_field(name="MP", value=f"{old_mp} → {self.base_mp}", inline=True)
-        embed.add_field(name="ATK", value=f"{old_atk} → {self.base_atk}", inline=True)
-        embed.add_field(name="DEF", value=f"{old_def} → {self.base_def}", inline=True)
-        
-        await ctx.send(embed=embed)
+    async def level_up(self, ctx, result):
+        """Announce the levels gained by `add_exp` in one message"""
+        events = ProgressionEvents(self)
+        events.collect(result)
+        view = ProgressionDetailView(events, ctx.author.id) if events.levels_gained > 1 else None
+        await ctx.send(embeds=events.summary_embeds(), view=view)
     
     async def allocate_stats(self, ctx, vit=0, int_stat=0, str_stat=0, def_stat=0, agi=0):
+        """Spend status points; `ctx` is anything with an async `send`, e.g. a command context or `interaction.followup`"""
         total_requested = vit + int_stat + str_stat + def_stat + agi
         if total_requested > self.unallocated_points:
             await ctx.send(f"Error: Not enough status points available (have {self.unallocated_points}, requested {total_requested})")
@@ -258,6 +483,8 @@ class Character:
         self.def_stat += def_stat
         self.agi += agi
         self.unallocated_points -= total_requested
+        self.invalidate_stats()
+        stats = self.derived_stats()
         
         # Create allocation embed
         embed = discord.Embed(
@@ -271,19 +498,17 @@ class Character:
         if def_stat > 0: embed.add_field(name="DEF", value=f"+{def_stat}", inline=True)
         if agi > 0: embed.add_field(name="AGI", value=f"+{agi}", inline=True)
         
-        await ctx.send(embed=embed)
-        
         # Create stats embed
         stats_embed = discord.Embed(
             title="New Stats",
             color=0x00ff00
         )
         
-        stats_embed.add_field(name="VIT", value=f"{self.vit}\t\tHP: {self.total_hp()}", inline=False)
-        stats_embed.add_field(name="INT", value=f"{self.int}\t\tMP: {self.total_mp()}", inline=False)
-        stats_embed.add_field(name="STR", value=f"{self.str}\t\tATK: {self.total_atk()}", inline=False)
-        stats_embed.add_field(name="DEF", value=f"{self.def_stat}\t\tDEF: {self.total_def()}", inline=False)
-        stats_embed.add_field(name="AGI", value=f"{self.agi}\t\tSpeed: {self.total_speed()}", inline=False)
+        stats_embed.add_field(name="VIT", value=f"{self.vit}\t\tHP: {stats['total_hp']}", inline=False)
+        stats_embed.add_field(name="INT", value=f"{self.int}\t\tMP: {stats['total_mp']}", inline=False)
+        stats_embed.add_field(name="STR", value=f"{self.str}\t\tATK: {stats['total_atk']}", inline=False)
+        stats_embed.add_field(name="DEF", value=f"{self.def_stat}\t\tDEF: {stats['total_def']}", inline=False)
+        stats_embed.add_field(name="AGI", value=f"{self.agi}\t\tSpeed: {stats['total_speed']}", inline=False)
         
         stats_embed.add_field(
             name="Remaining Points", 
@@ -293,24 +518,54 @@ class Character:
         
         stats_embed.set_footer(text=f"Level {self.level} {self.name} has now {self.exp}/{self.exp_limit} EXP")
         
-        await ctx.send(embed=stats_embed)
+        await ctx.send(embeds=[embed, stats_embed])
+    
+    def invalidate_stats(self):
+        """Call after changing level, status points or ascension (equipment is tracked on its own)"""
+        self._stats = None
+    
+    def derived_stats(self):
+        """Modified and total stats from the shared "growth" formulas in stat_formulas.json.
+        
+        Computed once and reused until `invalidate_stats` or an equipment
+        change; treat the returned dict as read-only.
+        """
+        if self._stats is not None and self._stats_equipment_version == self.equipment.version:
+            return self._stats
+        self._stats = GROWTH_FORMULAS(
+            base_hp=self.base_hp,
+            base_mp=self.base_mp,
+            base_atk=self.base_atk,
+            base_def=self.base_def,
+            base_speed=self.base_speed,
+            vit=self.vit,
+            int_stat=self.int,
+            str_stat=self.str,
+            def_stat=self.def_stat,
+            agi=self.agi,
+            weapon_attack=self.equipment.weapon["attack"],
+            armor_defense=self.equipment.armor["defense"]
+        )
+        self._stats_equipment_version = self.equipment.version
+        return self._stats
     
     def total_hp(self):
-        return self.base_hp + (self.vit * 30)
+        return self.derived_stats()["total_hp"]
     
     def total_mp(self):
-        return round(self.base_mp + (self.int * 5), 1)
+        return self.derived_stats()["total_mp"]
     
     def total_atk(self):
-        return round(self.base_atk + (self.str * 2) + self.equipment.weapon["attack"], 1)
+        return self.derived_stats()["total_atk"]
     
     def total_def(self):
-        return round(self.base_def + self.def_stat + self.equipment.armor["defense"], 1)
+        return self.derived_stats()["total_def"]
     
     def total_speed(self):
-        return self.base_speed + self.agi
+        return self.derived_stats()["total_speed"]
     
     async def show_stats(self, ctx):
+        stats = self.derived_stats()
         embed = discord.Embed(
             title=f"Character: {self.name}",
             description=f"Level: {self.level}\nEXP: {self.exp}/{self.exp_limit}\nAscensions: {self.ascension_count}\nUnallocated points: {self.unallocated_points}",
@@ -340,11 +595,11 @@ class Character:
             title="Modified Stats (with status points)",
             color=0x00ff00
         )
-        mod_embed.add_field(name="HP", value=self.base_hp + (self.vit * 30), inline=True)
-        mod_embed.add_field(name="MP", value=round(self.base_mp + (self.int * 5), 1), inline=True)
-        mod_embed.add_field(name="ATK", value=round(self.base_atk + (self.str * 2), 1), inline=True)
-        mod_embed.add_field(name="DEF", value=round(self.base_def + self.def_stat, 1), inline=True)
-        mod_embed.add_field(name="Speed", value=self.base_speed + self.agi, inline=True)
+        mod_embed.add_field(name="HP", value=stats["modified_hp"], inline=True)
+        mod_embed.add_field(name="MP", value=stats["modified_mp"], inline=True)
+        mod_embed.add_field(name="ATK", value=stats["modified_atk"], inline=True)
+        mod_embed.add_field(name="DEF", value=stats["modified_def"], inline=True)
+        mod_embed.add_field(name="Speed", value=stats["modified_speed"], inline=True)
         await ctx.send(embed=mod_embed)
         
         # Final stats
@@ -352,19 +607,19 @@ class Character:
             title="Final Stats (with equipment)",
             color=0x00ff00
         )
-        final_embed.add_field(name="HP", value=self.total_hp(), inline=True)
-        final_embed.add_field(name="MP", value=self.total_mp(), inline=True)
+        final_embed.add_field(name="HP", value=stats["total_hp"], inline=True)
+        final_embed.add_field(name="MP", value=stats["total_mp"], inline=True)
         final_embed.add_field(
             name="ATK", 
-            value=f"{self.total_atk()} (Base: {round(self.base_atk + (self.str * 2), 1)} + Weapon: {self.equipment.weapon['attack']})", 
+            value=f"{stats['total_atk']} (Base: {stats['modified_atk']} + Weapon: {self.equipment.weapon['attack']})", 
             inline=False
         )
         final_embed.add_field(
             name="DEF", 
-            value=f"{self.total_def()} (Base: {round(self.base_def + self.def_stat, 1)} + Armor: {self.equipment.armor['defense']})", 
+            value=f"{stats['total_def']} (Base: {stats['modified_def']} + Armor: {self.equipment.armor['defense']})", 
             inline=False
         )
-        final_embed.add_field(name="Speed", value=self.total_speed(), inline=True)
+        final_embed.add_field(name="Speed", value=stats["total_speed"], inline=True)
         await ctx.send(embed=final_embed)
         
         # Status points
@@ -396,10 +651,11 @@ class Character:
             "agi": self.agi,
             "unallocated_points": self.unallocated_points,
             "ascension_count": self.ascension_count,
+            # Copies, so snapshots of the saved state don't change with the equipment
             "equipment": {
-                "weapon": self.equipment.weapon,
-                "armor": self.equipment.armor,
-                "accessory": self.equipment.accessory
+                "weapon": dict(self.equipment.weapon),
+                "armor": dict(self.equipment.armor),
+                "accessory": dict(self.equipment.accessory)
             }
         }
     
@@ -420,32 +676,225 @@ class Character:
         char.agi = data["agi"]
         char.unallocated_points = data["unallocated_points"]
         char.ascension_count = data["ascension_count"]
-        char.equipment.weapon = data["equipment"]["weapon"]
-        char.equipment.armor = data["equipment"]["armor"]
-        char.equipment.accessory = data["equipment"]["accessory"]
+        char.equipment.weapon = dict(data["equipment"]["weapon"])
+        char.equipment.armor = dict(data["equipment"]["armor"])
+        char.equipment.accessory = dict(data["equipment"]["accessory"])
         char.exp_limit = char.calculate_exp_limit()
         return char
 
-# Global character storage
-characters = {}
+CHARACTER_DB = "characters.db"
+LEGACY_CHARACTER_DIR = "characters"
+# Characters kept in memory; the least recently used are written back and dropped
+CHARACTER_CACHE_SIZE = 1024
+# Only used from the writer thread once the bot is running
+character_store = CharacterStore(CHARACTER_DB, check_same_thread=False)
+# Import the old one-file-per-user saves the first time the database is used
+character_store.migrate_json(LEGACY_CHARACTER_DIR)
+
+async def save_character(user_id, character):
+    await writer.run(character_store.save, user_id, character.to_dict())
+    return CHARACTER_DB
 
-def save_character(user_id, character):
-    filename = f"characters/{user_id}.json"
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, 'w') as f:
-        json.dump(character.to_dict(), f, indent=2)
-    return filename
+async def save_characters(batch):
+    """Save many {user_id: Character} in one transaction"""
+    snapshot = [(user_id, character.to_dict()) for user_id, character in batch.items()]
+    return await writer.run(character_store.save_many, snapshot)
 
-def load_character(user_id):
-    filename = f"characters/{user_id}.json"
-    if not os.path.exists(filename):
+async def load_character(user_id):
+    data = await writer.run(character_store.load, user_id)
+    if data is None:
         return None
     
-    with open(filename, 'r') as f:
-        data = json.load(f)
     character = Character.from_dict(data)
     return character
 
+async def delete_saved_character(user_id):
+    return await writer.run(character_store.delete, user_id)
+
+class CharacterCache:
+    """Characters by user ID, loaded from the database on first use.
+    
+    Holds at most `maxsize` characters. A character counts as dirty while it
+    differs from what was last loaded or saved; dirty characters are written
+    back when they are evicted and by `flush`.
+    """
+    def __init__(self, maxsize=CHARACTER_CACHE_SIZE):
+        self._cache = LRUCache(maxsize=maxsize, on_evict=self._write_back)
+        self._saved = {}  # user_id -> to_dict() as last loaded/saved
+        self._loading = {}  # user_id -> in-flight load, shared by concurrent lookups
+        self.write_backs = 0
+    
+    def is_dirty(self, user_id):
+        character = self._cache.peek(user_id)
+        return character is not None and character.to_dict() != self._saved.get(user_id)
+    
+    def _write_back(self, user_id, character):
+        data = character.to_dict()
+        if data != self._saved.pop(user_id, None):
+            self.write_backs += 1
+            writer.submit(character_store.save, user_id, data)
+    
+    async def get(self, user_id):
+        """Cached character, loading it from the database on a miss; None if the user has none"""
+        character = self._cache.get(user_id)
+        if character is not None:
+            return character
+        
+        if user_id not in self._loading:
+            self._loading[user_id] = asyncio.ensure_future(writer.run(character_store.load, user_id))
+        try:
+            data = await asyncio.shield(self._loading[user_id])
+        finally:
+            self._loading.pop(user_id, None)
+        if data is None:
+            return None
+        # A concurrent lookup may have cached it while this one waited
+        if user_id not in self._cache:
+            self._saved[user_id] = data
+            self._cache.put(user_id, Character.from_dict(data))
+        return self._cache.peek(user_id)
+    
+    async def get_many(self, user_ids):
+        """{user_id: Character} for every ID that has a character; misses are loaded in one query"""
+        found = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            character = self._cache.get(user_id)
+            if character is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = character
+        if missing:
+            for user_id, data in (await writer.run(character_store.load_many, missing)).items():
+                # Cached meanwhile by a concurrent lookup? Keep that copy
+                if user_id not in self._cache:
+                    self._saved[user_id] = data
+                    self._cache.put(user_id, Character.from_dict(data))
+                found[user_id] = self._cache.peek(user_id) or Character.from_dict(data)
+        return found
+    
+    def put(self, user_id, character, saved=False):
+        """Cache a new or reloaded character; `saved` if it matches the database"""
+        self._saved.pop(user_id, None)
+        if saved:
+            self._saved[user_id] = character.to_dict()
+        self._cache.put(user_id, character)
+    
+    async def save(self, user_id):
+        character = self._cache.peek(user_id)
+        data = character.to_dict()
+        await writer.run(character_store.save, user_id, data)
+        self._saved[user_id] = data
+        return CHARACTER_DB
+    
+    async def save_many(self, batch):
+        """Save {user_id: Character} in one transaction"""
+        snapshot = [(user_id, character.to_dict()) for user_id, character in batch.items()]
+        await writer.run(character_store.save_many, snapshot)
+        for user_id, data in snapshot:
+            if self._cache.peek(user_id) is batch[user_id]:
+                self._saved[user_id] = data
+        return len(snapshot)
+    
+    async def flush(self):
+        """Write every dirty character in one transaction; returns how many were written"""
+        dirty = [(user_id, character.to_dict()) for user_id, character in self._cache.items()]
+        dirty = [(user_id, data) for user_id, data in dirty if data != self._saved.get(user_id)]
+        if dirty:
+            await writer.run(character_store.save_many, dirty)
+            self._saved.update(dirty)
+        return len(dirty)
+    
+    async def delete(self, user_id):
+        self._cache.pop(user_id)
+        self._saved.pop(user_id, None)
+        return await delete_saved_character(user_id)
+    
+    def __len__(self):
+        return len(self._cache)
+    
+    def info(self):
+        info = self._cache.info()
+        info["dirty"] = sum(1 for user_id in self._cache if self.is_dirty(user_id))
+        info["write_backs"] = self.write_backs
+        return info
+
+characters = CharacterCache()
+
+class GrantResult(NamedTuple):
+    exp: int
+    points: int
+    # user_id -> (character, what the EXP did)
+    granted: Dict[str, Tuple["Character", LevelUpResult]]
+    # Requested users without a character
+    missing: Tuple[str, ...]
+
+async def grant_rewards(user_ids, exp=0, points=0):
+    """Give `exp` EXP and `points` status points to every listed user's character.
+    
+    Level-ups are resolved through the progression table and every changed
+    character is saved in one transaction.
+    """
+    if exp < 0 or points < 0:
+        raise ValueError("EXP and points can't be negative")
+    user_ids = [str(user_id) for user_id in dict.fromkeys(user_ids)]
+    batch = await characters.get_many(user_ids)
+    
+    granted = {}
+    for user_id, character in batch.items():
+        result = character.add_exp(exp)
+        if points:
+            character.unallocated_points += points
+            character.invalidate_stats()
+        granted[user_id] = (character, result)
+    
+    if batch:
+        await characters.save_many(batch)
+    return GrantResult(exp, points, granted, tuple(user_id for user_id in user_ids if user_id not in batch))
+
+def grant_summary_embed(grant, max_lines=25, roles=()):
+    """One embed listing everyone who leveled up, for `!grant`.
+
+    `roles` is (role name, members resolved) for every role targeted.
+    """
+    rewards = " and ".join(
+        text for amount, text in ((grant.exp, f"{grant.exp:,} EXP"), (grant.points, f"{grant.points} status points")) if amount
+    )
+    embed = discord.Embed(
+        title="Rewards Granted",
+        description=f"{rewards} to {len(grant.granted)} character(s).",
+        color=0xffd700
+    )
+    
+    leveled = [
+        (character, result) for character, result in grant.granted.values() if result.new_level > result.old_level
+    ]
+    leveled.sort(key=lambda entry: entry[1].new_level, reverse=True)
+    lines = []
+    for character, result in leveled[:max_lines]:
+        line = f"{character.name}: Lv {result.old_level} → {result.new_level}"
+        if result.ascension_levels:
+            line += f" ✨ x{len(result.ascension_levels)}"
+        lines.append(line)
+    if len(leveled) > max_lines:
+        lines.append(f"... and {len(leveled) - max_lines} more")
+    if lines:
+        embed.add_field(name=f"Level Ups ({len(leveled)})", value="\n".join(lines)[:1024], inline=False)
+    if roles:
+        embed.add_field(
+            name="Roles",
+            value="\n".join(f"@{name}: {count} member(s)" for name, count in roles)[:1024],
+            inline=False
+        )
+    if grant.missing:
+        embed.add_field(name="Skipped", value=f"{len(grant.missing)} user(s) without a character", inline=False)
+    return embed
+
+@bot.listen('on_message')
+async def route_prompts(message):
+    if not message.author.bot:
+        prompts.dispatch(message)
+
 @bot.event
 async def on_ready():
     print(f'Logged in as {bot.user.name} ({bot.user.id})')
@@ -456,21 +905,18 @@ async def create_character(ctx):
     """Create a new character"""
     user_id = str(ctx.author.id)
     
-    if user_id in characters:
-        await ctx.send("You already have a character. Use `!load` to access it.")
+    if await characters.get(user_id) is not None:
+        await ctx.send("You already have a character. Use `!stats` to see it.")
         return
     
     await ctx.send("Enter your character's name:")
     
-    def check(m):
-        return m.author == ctx.author and m.channel == ctx.channel
-    
     try:
-        name_msg = await bot.wait_for('message', timeout=30.0, check=check)
+        name_msg = await prompts.wait_for(ctx, timeout=30.0)
         name = name_msg.content
         
         character = Character(name)
-        characters[user_id] = character
+        characters.put(user_id, character)
         
         embed = discord.Embed(
             title="New Character Created",
@@ -489,78 +935,94 @@ async def add_exp(ctx, amount: int):
     """Add EXP to your character"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    character = await characters.get(user_id)
+    if character is None:
         await ctx.send("You don't have a character yet. Use `!create` to make one.")
         return
     
-    character = characters[user_id]
-    character.add_exp(amount)
+    if amount <= 0:
+        await ctx.send("Please enter a positive amount of EXP.")
+        return
     
-    # Check if level up occurred (exp was spent)
-    if character.exp < amount:
-        # The level_up method will handle its own messaging
-        pass
+    result = character.add_exp(amount)
+    
+    if result.new_level > result.old_level:
+        await character.level_up(ctx, result)
     else:
         await ctx.send(f"Added {amount} EXP to {character.name}. Current EXP: {character.exp}/{character.exp_limit}")
 
+@bot.command(name='grant')
+@commands.guild_only()
+@commands.has_permissions(administrator=True)
+async def grant_rewards_cmd(ctx, exp: int, points: int, *targets: discord.Member | discord.Role):
+    """Admin: give EXP and status points to members and/or everyone in a role"""
+    if not targets:
+        await ctx.send("Usage: `!grant <exp> <points> <@members or @roles...>`")
+        return
+    if exp < 0 or points < 0 or exp + points == 0:
+        await ctx.send("Please enter a positive amount of EXP or points.")
+        return
+    
+    if any(isinstance(target, discord.Role) for target in targets):
+        if not ctx.bot.intents.members:
+            await ctx.send("Granting to roles needs the Server Members intent (GRANT_ROLE_TARGETS). Mention the members instead.")
+            return
+        # Role.members only sees cached members, so fetch the whole guild first
+        if not ctx.guild.chunked:
+            await ctx.guild.chunk()
+    
+    user_ids = []
+    roles = []
+    for target in targets:
+        members = [member for member in (target.members if isinstance(target, discord.Role) else [target]) if not member.bot]
+        if isinstance(target, discord.Role):
+            roles.append((target.name, len(members)))
+        user_ids.extend(member.id for member in members)
+    
+    grant = await grant_rewards(user_ids, exp, points)
+    await ctx.send(embed=grant_summary_embed(grant, roles=roles))
+
+@grant_rewards_cmd.error
+async def grant_rewards_error(ctx, error):
+    if isinstance(error, commands.NoPrivateMessage):
+        await ctx.send("Rewards can only be granted in a server.")
+    elif isinstance(error, commands.MissingPermissions):
+        await ctx.send("Only server administrators can grant rewards.")
+    elif isinstance(error, (commands.BadArgument, commands.MissingRequiredArgument)):
+        await ctx.send("Usage: `!grant <exp> <points> <@members or @roles...>`")
+    else:
+        raise error
+
 @bot.command(name='allocate')
 async def allocate_stats(ctx):
     """Allocate your status points"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    character = await characters.get(user_id)
+    if character is None:
         await ctx.send("You don't have a character yet. Use `!create` to make one.")
         return
     
-    character = characters[user_id]
     
     if character.unallocated_points <= 0:
         await ctx.send("No status points available to allocate (you may need to level up first).")
         return
     
-    await ctx.send(f"You have {character.unallocated_points} status points to allocate!")
-    
-    def check(m):
-        return m.author == ctx.author and m.channel == ctx.channel
-    
-    try:
-        await ctx.send("How many points in VIT? (0 if none)")
-        vit_msg = await bot.wait_for('message', timeout=30.0, check=check)
-        vit = int(vit_msg.content) if vit_msg.content.isdigit() else 0
-        
-        await ctx.send("How many points in INT? (0 if none)")
-        int_msg = await bot.wait_for('message', timeout=30.0, check=check)
-        int_stat = int(int_msg.content) if int_msg.content.isdigit() else 0
-        
-        await ctx.send("How many points in STR? (0 if none)")
-        str_msg = await bot.wait_for('message', timeout=30.0, check=check)
-        str_stat = int(str_msg.content) if str_msg.content.isdigit() else 0
-        
-        await ctx.send("How many points in DEF? (0 if none)")
-        def_msg = await bot.wait_for('message', timeout=30.0, check=check)
-        def_stat = int(def_msg.content) if def_msg.content.isdigit() else 0
-        
-        await ctx.send("How many points in AGI? (0 if none)")
-        agi_msg = await bot.wait_for('message', timeout=30.0, check=check)
-        agi = int(agi_msg.content) if agi_msg.content.isdigit() else 0
-        
-        await character.allocate_stats(ctx, vit, int_stat, str_stat, def_stat, agi)
-        
-    except asyncio.TimeoutError:
-        await ctx.send("You took too long to respond. Stat allocation cancelled.")
-    except ValueError as e:
-        await ctx.send(f"Error: {e}")
+    await ctx.send(
+        f"You have {character.unallocated_points} status points to allocate!",
+        view=AllocationView(ctx.author.id)
+    )
 
 @bot.command(name='equip')
 async def edit_equipment(ctx):
     """Edit your character's equipment"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    character = await characters.get(user_id)
+    if character is None:
         await ctx.send("You don't have a character yet. Use `!create` to make one.")
         return
     
-    character = characters[user_id]
     await character.equipment.edit_equipment(ctx)
 
 @bot.command(name='stats')
@@ -568,11 +1030,11 @@ async def show_stats(ctx):
     """Show your character's stats"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    character = await characters.get(user_id)
+    if character is None:
         await ctx.send("You don't have a character yet. Use `!create` to make one.")
         return
     
-    character = characters[user_id]
     await character.show_stats(ctx)
 
 @bot.command(name='save')
@@ -580,12 +1042,12 @@ async def save_character_cmd(ctx):
     """Save your character"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    character = await characters.get(user_id)
+    if character is None:
         await ctx.send("You don't have a character yet. Use `!create` to make one.")
         return
     
-    character = characters[user_id]
-    filename = save_character(user_id, character)
+    filename = await characters.save(user_id)
     await ctx.send(f"Character saved to {filename}")
 
 @bot.command(name='load')
@@ -593,21 +1055,36 @@ async def load_character_cmd(ctx):
     """Load your character"""
     user_id = str(ctx.author.id)
     
-    character = load_character(user_id)
+    character = await load_character(user_id)
     if not character:
         await ctx.send("No character found. Use `!create` to make a new one.")
         return
     
-    characters[user_id] = character
+    # Reloading discards unsaved changes
+    characters.put(user_id, character, saved=True)
     await ctx.send(f"Character {character.name} loaded successfully!")
     await character.show_stats(ctx)
 
+@bot.command(name='iostats')
+async def io_stats(ctx):
+    """Show save queue depth, write latency and character cache usage"""
+    info = writer.info()
+    cache = characters.info()
+    await ctx.send(
+        f"Saves queued: {info['queue_depth']} (peak {info['max_queue_depth']})\n"
+        f"Completed: {info['completed']}, failed: {info['failed']}\n"
+        f"Latency: avg {info['avg_latency_ms']:.1f} ms, max {info['max_latency_ms']:.1f} ms, last {info['last_latency_ms']:.1f} ms\n"
+        f"Characters in memory: {cache['size']}/{cache['maxsize']} ({cache['dirty']} unsaved), "
+        f"hit rate {cache['hit_rate']:.1%} ({cache['hits']} hits, {cache['misses']} misses), "
+        f"{cache['evictions']} evicted, {cache['write_backs']} written back"
+    )
+
 @bot.command(name='delete')
 async def delete_character(ctx):
     """Delete your character"""
     user_id = str(ctx.author.id)
     
-    if user_id not in characters:
+    if await characters.get(user_id) is None:
         await ctx.send("You don't have a character to delete.")
         return
     
@@ -615,19 +1092,17 @@ async def delete_character(ctx):
     await ctx.send("Are you sure you want to delete your character? This cannot be undone. Type 'YES' to confirm.")
     
     def check(m):
-        return m.author == ctx.author and m.channel == ctx.channel and m.content.upper() == 'YES'
+        return m.content.upper() == 'YES'
     
     try:
-        await bot.wait_for('message', timeout=30.0, check=check)
+        await prompts.wait_for(ctx, timeout=30.0, check=check)
         
-        # Delete from memory and file
-        filename = f"characters/{user_id}.json"
-        if os.path.exists(filename):
-            os.remove(filename)
-        del characters[user_id]
+        # Delete from memory and the database
+        await characters.delete(user_id)
         await ctx.send("Character deleted successfully.")
         
     except asyncio.TimeoutError:
         await ctx.send("Character deletion cancelled.")
 
-bot.run('YOUR_DISCORD_BOT_TOKEN')
\ No newline at end of file
+if __name__ == "__main__":
+    bot.run('YOUR_DISCORD_BOT_TOKEN')
@@ -1,9 +1,15 @@
 import discord
 from discord.ext import commands
+import asyncio
+import copy
 import random
 import json
 import os
 from datetime import datetime
+from janus_formulas import FORMULAS
+from janus_persistence import writer
+
+RP_FORMULAS = FORMULAS["rp"]
 
 class JanusPenthosRP:
     def __init__(self):
@@ -41,13 +47,17 @@ class JanusPenthosRP:
 
     def calculate_derived_stats(self):
         """Calculate stats including equipment bonuses"""
-        stats = {
-            "HP": max(1, self.base_hp + (self.stats["VIT"] * 5)),
-            "MP": max(0, self.base_mp + (self.stats["INT"] * 2)),
-            "ATK": max(1, 10 + self.stats["STR"] + self.equipment["Weapon"]["damage"]),
-            "DEF": self.stats["DEF"] + self.equipment["Armor"]["defense"],
-            "EVA": max(0, min(95, self.stats["AGI"] * 0.5))
-        }
+        stats = RP_FORMULAS(
+            base_hp=self.base_hp,
+            base_mp=self.base_mp,
+            vit=self.stats["VIT"],
+            int_stat=self.stats["INT"],
+            str_stat=self.stats["STR"],
+            def_stat=self.stats["DEF"],
+            agi=self.stats["AGI"],
+            weapon_damage=self.equipment["Weapon"]["damage"],
+            armor_defense=self.equipment["Armor"]["defense"]
+        )
         
         # Apply equipment bonuses
         for item in self.equipment.values():
@@ -57,30 +67,30 @@ class JanusPenthosRP:
                     
         return stats
 
-    def save_character(self, filename):
-        """Save character data to JSON file"""
+    async def save_character(self, filename):
+        """Save character data to JSON file (written on the persistence thread)"""
         data = {
             "name": self.character_name,
-            "stats": self.stats,
+            "stats": dict(self.stats),
             "level": self.level,
             "stat_points": self.stat_points,
             "exp": self.exp,
             "base_hp": self.base_hp,
             "base_mp": self.base_mp,
             "created": self.creation_date,
-            "equipment": self.equipment,
+            "equipment": copy.deepcopy(self.equipment),
             "next_level_exp": self.next_level_exp,
             "system": "Janus Penthos RP"
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        await writer.write_json(filename, data, indent=4)
 
-    def load_character(self, filename):
+    async def load_character(self, filename):
         """Load character from JSON file"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            data = await writer.read_json(filename)
+            if data is None:
+                return False
             
             if data.get("system") != "Janus Penthos RP":
                 return False
@@ -126,14 +136,27 @@ intents.message_content = True
 
 bot = commands.Bot(command_prefix='!', intents=intents)
 user_games = {}
+loading_games = {}  # user_id -> load in progress, shared by every command that needs it
 
-def get_user_game(user_id):
+async def load_user_game(user_id):
+    game = JanusPenthosRP()
+    # Try to load last save automatically
+    await game.load_character(f"data/champion_{user_id}.json")
+    return game
+
+async def get_user_game(user_id):
     if user_id not in user_games:
-        user_games[user_id] = JanusPenthosRP()
-        # Try to load last save automatically
-        if not os.path.exists('data'):
-            os.makedirs('data')
-        user_games[user_id].load_character(f"data/champion_{user_id}.json")
+        # Only publish the game once its save is loaded, otherwise a command
+        # arriving mid-load would get a blank game and save over the real one
+        if user_id not in loading_games:
+            loading_games[user_id] = asyncio.ensure_future(load_user_game(user_id))
+        load = loading_games[user_id]
+        try:
+            game = await asyncio.shield(load)
+        finally:
+            if load.done() and loading_games.get(user_id) is load:
+                del loading_games[user_id]
+        user_games.setdefault(user_id, game)
     return user_games[user_id]
 
 def create_stats_embed(character):
@@ -180,18 +203,18 @@ async def on_ready():
 @bot.command()
 async def character(ctx):
     """View your character sheet"""
-    game = get_user_game(ctx.author.id)
+    game = await get_user_game(ctx.author.id)
     embed = create_stats_embed(game)
     await ctx.send(embed=embed)
 
 @bot.command()
 async def create(ctx, *, name: str):
     """Create a new character"""
-    game = get_user_game(ctx.author.id)
+    game = await get_user_game(ctx.author.id)
     game.reset_character()
     game.character_name = name
     game.random_roll_stats()
-    game.save_character(f"data/champion_{ctx.author.id}.json")
+    await game.save_character(f"data/champion_{ctx.author.id}.json")
     
     embed = create_stats_embed(game)
     await ctx.send(f"Character {name} created!", embed=embed)
@@ -199,7 +222,7 @@ async def create(ctx, *, name: str):
 @bot.command()
 async def distribute(ctx, stat: str):
     """Distribute a stat point"""
-    game = get_user_game(ctx.author.id)
+    game = await get_user_game(ctx.author.id)
     stat = stat.upper()
     
     if game.stat_points <= 0:
@@ -212,7 +235,7 @@ async def distribute(ctx, stat: str):
     
     game.stats[stat] += 1
     game.stat_points -= 1
-    game.save_character(f"data/champion_{ctx.author.id}.json")
+    await game.save_character(f"data/champion_{ctx.author.id}.json")
     
     derived = game.calculate_derived_stats()
     await ctx.send(
@@ -224,7 +247,7 @@ async def distribute(ctx, stat: str):
 @bot.command()
 async def equip(ctx, slot: str, name: str, power: int = 0, stat: str = None, bonus: int = 0):
     """Equip an item"""
-    game = get_user_game(ctx.author.id)
+    game = await get_user_game(ctx.author.id)
     slot = slot.capitalize()
     
     if slot not in game.equipment:
@@ -245,7 +268,7 @@ async def equip(ctx, slot: str, name: str, power: int = 0, stat: str = None, bon
         else:
             await ctx.send("Invalid stat bonus! No bonus applied.")
     
-    game.save_character(f"data/champion_{ctx.author.id}.json")
+    await game.save_character(f"data/champion_{ctx.author.id}.json")
     await ctx.send(f"Equipped {name} in {slot} slot!")
 
 @bot.command()
@@ -259,7 +282,7 @@ async def admin_reset(ctx, user: discord.Member = None):
 @bot.command()
 async def roll(ctx):
     """Roll for a random event"""
-    game = get_user_game(ctx.author.id)
+    game = await get_user_game(ctx.author.id)
     events = [
         "You find a mysterious artifact",
         "A wandering merchant offers you a deal",
@@ -275,7 +298,7 @@ async def roll(ctx):
         change = random.choice([-1, 1])
         game.stats[stat] += change
         stat_change = f"\n\n{stat} changed by {change:+d} (now {game.stats[stat]})"
-        game.save_character(f"data/champion_{ctx.author.id}.json")
+        await game.save_character(f"data/champion_{ctx.author.id}.json")
     else:
         stat_change = ""
     
@@ -3,6 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
+from janus_persistence import writer
 
 # Define Item and CharacterInventory classes (same as before)
 class Item:
@@ -114,21 +115,18 @@ bot = commands.Bot(command_prefix='!', intents=intents)
 # Database to store character inventories
 CHARACTER_DB = "character_inventories.json"
 
-def load_inventories():
-    if os.path.exists(CHARACTER_DB):
-        with open(CHARACTER_DB, 'r') as f:
-            return {
-                name: CharacterInventory.from_dict(data)
-                for name, data in json.load(f).items()
-            }
-    return {}
+async def load_inventories():
+    data = await writer.read_json(CHARACTER_DB, default={})
+    return {
+        name: CharacterInventory.from_dict(inv_data)
+        for name, inv_data in data.items()
+    }
 
-def save_inventories(inventories):
-    with open(CHARACTER_DB, 'w') as f:
-        json.dump({
-            name: inv.to_dict()
-            for name, inv in inventories.items()
-        }, f, indent=2)
+async def save_inventories(inventories):
+    await writer.write_json(CHARACTER_DB, {
+        name: inv.to_dict()
+        for name, inv in inventories.items()
+    })
 
 # Bot Commands
 @bot.event
@@ -143,7 +141,7 @@ async def on_ready():
 @bot.tree.command(name="inventory", description="View your character's inventory")
 @app_commands.describe(character="Your character's name")
 async def inventory(interaction: discord.Interaction, character: str):
-    inventories = load_inventories()
+    inventories = await load_inventories()
     if character not in inventories:
         await interaction.response.send_message(f"Character {character} not found!", ephemeral=True)
         return
@@ -206,12 +204,13 @@ async def add_item(
         if slot:
             stats['slot'] = slot.lower()
     
-    inventories = load_inventories()
-    if character not in inventories:
-        inventories[character] = CharacterInventory()
-    
-    result = inventories[character].add_item(item_name, item_type, stats, quantity)
-    save_inventories(inventories)
+    async with writer.lock(CHARACTER_DB):
+        inventories = await load_inventories()
+        if character not in inventories:
+            inventories[character] = CharacterInventory()
+        
+        result = inventories[character].add_item(item_name, item_type, stats, quantity)
+        await save_inventories(inventories)
     
     await interaction.response.send_message(f"✅ {result}")
 
@@ -221,14 +220,16 @@ async def add_item(
     item_name="Name of the item to equip"
 )
 async def equip(interaction: discord.Interaction, character: str, item_name: str):
-    inventories = load_inventories()
-    if character not in inventories:
+    async with writer.lock(CHARACTER_DB):
+        inventories = await load_inventories()
+        found = character in inventories
+        if found:
+            result = inventories[character].equip(item_name)
+            await save_inventories(inventories)
+    if not found:
         await interaction.response.send_message(f"Character {character} not found!", ephemeral=True)
         return
     
-    result = inventories[character].equip(item_name)
-    save_inventories(inventories)
-    
     await interaction.response.send_message(f"🛡️ {result}")
 
 @bot.tree.command(name="use_potion", description="Use a potion from inventory")
@@ -237,14 +238,16 @@ async def equip(interaction: discord.Interaction, character: str, item_name: str
     potion_name="Name of the potion to use"
 )
 async def use_potion(interaction: discord.Interaction, character: str, potion_name: str):
-    inventories = load_inventories()
-    if character not in inventories:
+    async with writer.lock(CHARACTER_DB):
+        inventories = await load_inventories()
+        found = character in inventories
+        if found:
+            result, stats = inventories[character].use_potion(potion_name)
+            await save_inventories(inventories)
+    if not found:
         await interaction.response.send_message(f"Character {character} not found!", ephemeral=True)
         return
     
-    result, stats = inventories[character].use_potion(potion_name)
-    save_inventories(inventories)
-    
     if stats:
         effect = ", ".join(f"{k}: {v}" for k, v in stats.items())
         await interaction.response.send_message(f"🧪 {result}\n✨ Effect: {effect}")
@@ -1,11 +1,83 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import asyncio
+from janus_cache import LRUCache
+from janus_monsters import monster_family
+from janus_sessions import SessionStore
+from janus_stats import (
+    DEFAULT_PARAMETERS, DEFAULT_SUBSTAT_COSTS, MAX_STATUS_POINTS, OPTIMIZE_OBJECTIVES, POINT_PARAMETERS,
+    STAT_PARAMETERS, compute_stats_batch, normalize_params, optimize_allocation, optimize_substats, row,
+    simulate_damage, marginal_values, parameter_step, builds_to_columns, encode_build, decode_build,
+    time_to_kill, point_contributions
+)
+
+STAT_CACHE_SIZE = 512
+BUILD_CODE_CACHE_SIZE = 256
+SESSION_DB = "stat_sessions.db"
+MAX_RESIDENT_SESSIONS = 1000
+SESSION_TTL = 30 * 60  # seconds before an idle session is spilled to disk
+SESSION_SWEEP_INTERVAL = 5 * 60  # seconds between idle-session sweeps and flushes of changed sessions
+MAX_BUILDS = 25
+MAX_COMPARE = 5
+MAX_BUILD_NAME = 32
+
+# (label, parameter) of each status point stat, and the labels of the stats they feed
+POINT_LABELS = (("VIT", "vit_points"), ("DEF", "def_points"), ("STR", "str_points"), ("INT", "int_points"), ("AGI", "agi_points"))
+STAT_LABELS = {
+    "effective_hp": "HP", "effective_mp": "MP", "effective_atk": "ATK",
+    "effective_def": "DEF", "effective_speed": "Speed",
+}
+
+# (results key, label, format) rows of the comparison table
+COMPARE_ROWS = (
+    ("character_level", "Level", "{:g}"),
+    ("final_hp", "HP", "{:.1f}"),
+    ("final_mp", "MP", "{:.1f}"),
+    ("final_atk", "ATK", "{:.1f}"),
+    ("final_def", "DEF", "{:.1f}"),
+    ("final_speed", "Speed", "{:.1f}"),
+    ("final_crit_rate", "Crit Rate", "{:.1f}%"),
+    ("final_crit_dmg", "Crit DMG", "{:.1f}%"),
+    ("avg_damage", "Avg. DMG", "{:.1f}"),
+    ("total_damage", "Total DMG", "{:.1f}"),
+)
 
 class JanusPenthosStatBot(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.user_data = {}  # Stores user calculations
+        # Stores user calculations; idle ones are spilled to disk and reloaded on demand
+        self.user_data = SessionStore(SESSION_DB, max_resident=MAX_RESIDENT_SESSIONS, ttl=SESSION_TTL)
+        self.stat_cache = LRUCache(maxsize=STAT_CACHE_SIZE)  # (view, parameter tuple) -> (results, embed)
+        self.build_codes = LRUCache(maxsize=BUILD_CODE_CACHE_SIZE)  # build code -> decoded build
+    
+    async def cog_load(self):
+        self.sweep_sessions.start()
+    
+    def cog_unload(self):
+        self.sweep_sessions.cancel()
+        self.user_data.close()
+    
+    async def cog_before_invoke(self, ctx):
+        # Read a spilled session back on the session thread before the command uses it
+        await self.user_data.preload(ctx.author.id)
+    
+    @tasks.loop(seconds=SESSION_SWEEP_INTERVAL)
+    async def sweep_sessions(self):
+        """Spill idle sessions and write changed ones, so a crash loses at most one interval"""
+        self.user_data.evict_idle()
+        self.user_data.flush()
+    
+    def cached_view(self, key, build):
+        """Return the cached (results, embed) for `key`, building it on a miss.
+        
+        Keys are built from the input values, so an edit simply maps to a new
+        key and stale entries age out of the LRU on their own.
+        """
+        entry = self.stat_cache.get(key)
+        if entry is None:
+            entry = build()
+            self.stat_cache.put(key, entry)
+        return entry
     
     @commands.group(name="stats", invoke_without_command=True)
     async def stats_group(self, ctx):
@@ -22,6 +94,16 @@ class JanusPenthosStatBot(commands.Cog):
                 "`!stats calculate` - Calculate your stats\n"
                 "`!stats show` - Show current values\n"
                 "`!stats set <parameter> <value>` - Set a value\n"
+                "`!stats optimize <damage|ehp|mix>` - Best status point allocation\n"
+                "`!stats substats <budget> [costs...]` - Best crit/ATK%/elemental split\n"
+                "`!stats simulate <hits> [hp] [burst]` - Damage percentiles and kill chance\n"
+                "`!stats marginal` - Rank which stat to upgrade next\n"
+                "`!stats save/load/delete <name>` - Manage named builds\n"
+                "`!stats compare <build> <build> ...` - Compare builds side by side\n"
+                "`!stats ttk [monster level]` - Turns to kill/die against every monster\n"
+                "`!stats export [build]` / `!stats import <code>` - Share builds as codes\n"
+                "`!stats cache` - Show stat cache hit/miss counters\n"
+                "`!stats sessions` - Show session storage statistics\n"
                 "`!stats help` - Show detailed help"
             ),
             inline=False
@@ -32,39 +114,14 @@ class JanusPenthosStatBot(commands.Cog):
     @stats_group.command(name="new")
     async def new_calculation(self, ctx):
         """Start a new calculation"""
-        self.user_data[ctx.author.id] = {
-            # Character Progression
-            "character_level": 1,
-            "vit_points": 0,
-            "def_points": 0,
-            "str_points": 0,
-            "int_points": 0,
-            "agi_points": 0,
-            
-            # Attack & Defense Stats
-            "flat_weapon_atk": 0.0,
-            "atk_percent": 0.0,
-            "def_percent": 0.0,
-            "hp_percent": 0.0,
-            
-            # Critical Stats
-            "crit_rate_weapon": 0.0,
-            "crit_rate_armor": 0.0,
-            "crit_rate_substats": 0.0,
-            "crit_damage_weapon": 0.0,
-            "crit_damage_armor": 0.0,
-            "crit_damage_substats": 0.0,
-            
-            # Special Bonuses
-            "elemental_dmg_bonus": 0.0,
-            "speed_boots": 0.0,
-            "speed_substats": 0.0,
-            "mp_gear": 0.0,
-            "mp_substats": 0.0,
-            
+        previous = self.user_data.get(ctx.author.id, {})
+        self.user_data[ctx.author.id] = dict(
+            DEFAULT_PARAMETERS,
             # Results (will be calculated)
-            "results": {}
-        }
+            results={},
+            # Named builds survive a new calculation
+            builds=previous.get("builds", {})
+        )
         
         await ctx.send(f"New calculation started for {ctx.author.mention}! Use `!stats set` to configure your values.")
     
@@ -75,13 +132,7 @@ class JanusPenthosStatBot(commands.Cog):
             await ctx.send("Please start a new calculation with `!stats new` first.")
             return
         
-        valid_params = [
-            'character_level', 'vit_points', 'def_points', 'str_points', 'int_points', 'agi_points',
-            'flat_weapon_atk', 'atk_percent', 'def_percent', 'hp_percent',
-            'crit_rate_weapon', 'crit_rate_armor', 'crit_rate_substats',
-            'crit_damage_weapon', 'crit_damage_armor', 'crit_damage_substats',
-            'elemental_dmg_bonus', 'speed_boots', 'speed_substats', 'mp_gear', 'mp_substats'
-        ]
+        valid_params = list(STAT_PARAMETERS)
         
         if parameter not in valid_params:
             await ctx.send(f"Invalid parameter. Valid parameters are: {', '.join(valid_params)}")
@@ -98,188 +149,467 @@ class JanusPenthosStatBot(commands.Cog):
             return
         
         data = self.user_data[ctx.author.id]
-        results = {}
         
         try:
-            # Validate inputs first
-            level = max(1, min(data["character_level"], 100))
-            data["character_level"] = level
+            def build():
+                # One build is just a batch of one
+                results = row(compute_stats_batch({param: data[param] for param in STAT_PARAMETERS}))
+                return results, self.build_results_embed(results) if results["valid"] else None
             
-            # Get status points (ensured to be 0-300)
-            vit = max(0, min(data["vit_points"], 300))
-            defense = max(0, min(data["def_points"], 300))
-            strength = max(0, min(data["str_points"], 300))
-            intelligence = max(0, min(data["int_points"], 300))
-            agility = max(0, min(data["agi_points"], 300))
+            results, embed = self.cached_view(("calculate", normalize_params(data)), build)
             
             # Update data with validated values
-            data["vit_points"] = vit
-            data["def_points"] = defense
-            data["str_points"] = strength
-            data["int_points"] = intelligence
-            data["agi_points"] = agility
-            
-            # Calculate available and allocated SP
-            sp_available = min(3 * level, 300)
-            sp_allocated = vit + defense + strength + intelligence + agility
+            for param in ("character_level",) + POINT_PARAMETERS:
+                data[param] = results[param]
             
-            if sp_allocated > sp_available:
+            if not results["valid"]:
                 await ctx.send(
-                    f"Error: Total allocated status points ({sp_allocated}) exceed available points ({sp_available})"
+                    f"Error: Total allocated status points ({results['sp_allocated']:g}) exceed available points ({results['sp_available']:g})"
                 )
                 return
             
-            results["sp_available"] = f"{sp_available} (Max: 300)"
-            results["sp_allocated"] = f"{sp_allocated}"
-            
-            # Calculate base stats from level
-            base_hp = 100 * level
-            base_mp = 3 * level + 20
-            base_atk = 3 * level + 5
-            base_def = 3 * level + 5
-            base_speed = 10
-            
-            results["base_hp"] = f"{base_hp:.1f}"
-            results["base_mp"] = f"{base_mp:.1f}"
-            results["base_atk"] = f"{base_atk:.1f}"
-            results["base_def"] = f"{base_def:.1f}"
-            results["base_speed"] = f"{base_speed:.1f}"
-            
-            # Calculate ascension boost
-            ascension = 0
-            if level >= 25: ascension += 1
-            if level >= 50: ascension += 1
-            if level >= 75: ascension += 1
-            if level >= 100: ascension += 1
-            
-            ascension_percent = ascension * 0.10
-            results["ascension_boost"] = f"{ascension_percent*100:.0f}%"
-            
-            # Apply ascension to stats (except speed)
-            ascended_hp = base_hp * (1 + ascension_percent)
-            ascended_mp = base_mp * (1 + ascension_percent)
-            ascended_atk = base_atk * (1 + ascension_percent)
-            ascended_def = base_def * (1 + ascension_percent)
-            
-            # Apply status point bonuses
-            effective_hp = ascended_hp + (vit * 30)
-            effective_mp = ascended_mp + (intelligence * 5)
-            effective_atk = ascended_atk + (strength * 2) + (intelligence * 2)
-            effective_def = ascended_def + (defense * 1)
-            effective_speed = base_speed + (agility * 1)
-            
-            results["effective_hp"] = f"{effective_hp:.1f}"
-            results["effective_mp"] = f"{effective_mp:.1f}"
-            results["effective_atk"] = f"{effective_atk:.1f}"
-            results["effective_def"] = f"{effective_def:.1f}"
-            results["effective_speed"] = f"{effective_speed:.1f}"
-            
-            # Get equipment bonuses
-            weapon_atk = max(0.0, data["flat_weapon_atk"])
-            atk_percent = max(0.0, data["atk_percent"])
-            def_percent = max(0.0, data["def_percent"])
-            hp_percent = max(0.0, data["hp_percent"])
-            
-            # Calculate crit stats
-            crit_rate = (
-                max(0.0, data["crit_rate_weapon"]) +
-                max(0.0, data["crit_rate_armor"]) +
-                max(0.0, data["crit_rate_substats"])
-            )
-            
-            crit_dmg = (
-                max(0.0, data["crit_damage_weapon"]) +
-                max(0.0, data["crit_damage_armor"]) +
-                max(0.0, data["crit_damage_substats"])
-            )
-            
-            results["final_crit_rate"] = f"{crit_rate:.1f}%"
-            results["final_crit_dmg"] = f"{crit_dmg:.1f}%"
-            
-            # Calculate final ATK
-            total_atk = (effective_atk + weapon_atk) * (1 + atk_percent)
-            results["final_atk"] = f"{total_atk:.1f}"
-            
-            # Calculate average damage (including crit)
-            avg_damage = total_atk * (1 + (crit_rate/100) * (crit_dmg/100))
-            results["avg_damage"] = f"{avg_damage:.1f}"
-            
-            # Calculate final damage with elemental bonus
-            elemental_bonus = max(0.0, data["elemental_dmg_bonus"])
-            total_damage = avg_damage * (1 + elemental_bonus)
-            results["total_damage"] = f"{total_damage:.1f}"
-            
-            # Calculate defensive stats
-            results["final_def"] = f"{effective_def * (1 + def_percent):.1f}"
-            results["final_hp"] = f"{effective_hp * (1 + hp_percent):.1f}"
-            
-            # Calculate speed and MP
-            speed_bonus = max(0.0, data["speed_boots"]) + max(0.0, data["speed_substats"])
-            results["final_speed"] = f"{effective_speed + speed_bonus:.1f}"
-            
-            mp_bonus = max(0.0, data["mp_gear"]) + max(0.0, data["mp_substats"])
-            results["final_mp"] = f"{effective_mp + mp_bonus:.1f}"
-            
             # Store results
-            self.user_data[ctx.author.id]["results"] = results
+            data["results"] = dict(results)
             
-            # Create result embed
-            embed = discord.Embed(
-                title=f"Stat Calculation Results for {ctx.author.display_name}",
-                color=0x10b981
-            )
+            embed = embed.copy()
+            embed.title = f"Stat Calculation Results for {ctx.author.display_name}"
+            await ctx.send(embed=embed)
             
-            # Base Stats
+        except Exception as e:
+            await ctx.send(f"An error occurred during calculation: {str(e)}")
+    
+    def build_results_embed(self, results):
+        """Format a computed build as the calculation results embed (title is set per user)"""
+        # What each point stat adds, e.g. "VIT: 10 (+300 HP)"
+        gains = point_contributions(results)
+        point_lines = []
+        for label, param in POINT_LABELS:
+            added = ", ".join(f"+{amount:g} {STAT_LABELS[stat]}" for stat, amount in gains[param].items())
+            point_lines.append(f"**{label}:** {results[param]:g}" + (f" ({added})" if added else ""))
+        
+        embed = discord.Embed(color=0x10b981)
+        
+        # Base Stats
+        embed.add_field(
+            name="Base Stats",
+            value=(
+                f"**Level:** {results['character_level']:g}\n"
+                f"**HP:** {results['base_hp']:.1f}\n"
+                f"**MP:** {results['base_mp']:.1f}\n"
+                f"**ATK:** {results['base_atk']:.1f}\n"
+                f"**DEF:** {results['base_def']:.1f}\n"
+                f"**Speed:** {results['base_speed']:.1f}\n"
+                f"**Ascension:** {results['ascension_boost']*100:.0f}%"
+            ),
+            inline=False
+        )
+        
+        # Status Points
+        embed.add_field(
+            name="Status Points",
+            value=(
+                f"**Available:** {results['sp_available']:g} (Max: {MAX_STATUS_POINTS})\n"
+                f"**Allocated:** {results['sp_allocated']:g}\n" +
+                "\n".join(point_lines)
+            ),
+            inline=False
+        )
+        
+        # Final Stats
+        embed.add_field(
+            name="Final Stats",
+            value=(
+                f"**Total HP:** {results['final_hp']:.1f}\n"
+                f"**Total MP:** {results['final_mp']:.1f}\n"
+                f"**Total ATK:** {results['final_atk']:.1f}\n"
+                f"**Total DEF:** {results['final_def']:.1f}\n"
+                f"**Total Speed:** {results['final_speed']:.1f}\n"
+                f"**Crit Rate:** {results['final_crit_rate']:.1f}%\n"
+                f"**Crit Damage:** {results['final_crit_dmg']:.1f}%\n"
+                f"**Avg. Damage:** {results['avg_damage']:.1f}\n"
+                f"**Total Damage:** {results['total_damage']:.1f}"
+            ),
+            inline=False
+        )
+        
+        return embed
+    
+    @stats_group.command(name="optimize")
+    async def optimize_points(self, ctx, objective: str = "damage", damage_weight: float = 0.5):
+        """Find the best status point allocation for your current gear"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        objective = objective.lower()
+        if objective not in OPTIMIZE_OBJECTIVES:
+            await ctx.send(f"Invalid objective. Valid objectives are: {', '.join(OPTIMIZE_OBJECTIVES)}")
+            return
+        
+        data = self.user_data[ctx.author.id]
+        best = optimize_allocation(data, objective, damage_weight)
+        
+        title = {
+            "damage": "Maximum Total Damage",
+            "ehp": "Maximum Effective HP",
+            "mix": f"Damage/EHP Mix ({best['score']:.2f}x, {damage_weight:.0%} damage)"
+        }[objective]
+        
+        embed = discord.Embed(
+            title=f"Optimal Allocation: {title}",
+            description=f"Level {best['character_level']:g} with {best['sp_available']:g} status points and your current gear",
+            color=0x10b981
+        )
+        embed.add_field(
+            name="Status Points",
+            value=(
+                f"**VIT:** {best['vit_points']:g}\n"
+                f"**DEF:** {best['def_points']:g}\n"
+                f"**STR:** {best['str_points']:g}\n"
+                f"**INT:** {best['int_points']:g}\n"
+                f"**AGI:** {best['agi_points']:g}"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Result",
+            value=(
+                f"**Total HP:** {best['final_hp']:.1f}\n"
+                f"**Total DEF:** {best['final_def']:.1f}\n"
+                f"**Effective HP:** {best['ehp']:.1f}\n"
+                f"**Total ATK:** {best['final_atk']:.1f}\n"
+                f"**Total Damage:** {best['total_damage']:.1f}"
+            ),
+            inline=True
+        )
+        embed.set_footer(text="Effective HP = HP x (1 + DEF/100). INT gives the same ATK as STR plus MP, so STR is never picked.")
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="substats")
+    async def optimize_substat_budget(self, ctx, budget: float, crit_rate_cost: float = DEFAULT_SUBSTAT_COSTS["crit_rate"],
+                                      crit_damage_cost: float = DEFAULT_SUBSTAT_COSTS["crit_damage"],
+                                      atk_cost: float = DEFAULT_SUBSTAT_COSTS["atk_percent"],
+                                      elemental_cost: float = DEFAULT_SUBSTAT_COSTS["elemental"]):
+        """Split a substat budget for maximum damage"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        costs = {
+            "crit_rate": crit_rate_cost,
+            "crit_damage": crit_damage_cost,
+            "atk_percent": atk_cost,
+            "elemental": elemental_cost
+        }
+        
+        try:
+            solution = optimize_substats(self.user_data[ctx.author.id], budget, costs)
+        except ValueError as e:
+            await ctx.send(f"Error: {e}")
+            return
+        
+        best = solution["best"]
+        labels = {
+            "crit_rate": "Crit Rate",
+            "crit_damage": "Crit DMG",
+            "atk_percent": "ATK %",
+            "elemental": "Elemental DMG %"
+        }
+        
+        embed = discord.Embed(
+            title=f"Best Substat Split for a Budget of {budget:g}",
+            description=(
+                f"Total Damage **{best['baseline_damage']:.1f} → {best['total_damage']:.1f}** "
+                f"(+{(best['total_damage'] / best['baseline_damage'] - 1) * 100:.1f}%)"
+            ),
+            color=0x10b981
+        )
+        embed.add_field(
+            name="Split",
+            value="\n".join(
+                f"**{labels[name]}:** {best['split'][name]:g} budget → +{best['gains'][name]:.1f}% (cost {costs[name]:g}/%)"
+                for name in labels
+            ),
+            inline=False
+        )
+        
+        # Show up to 10 evenly spaced points along the frontier
+        frontier = solution["frontier"]
+        picks = sorted({round(i * (len(frontier) - 1) / 9) for i in range(10)})
+        embed.add_field(
+            name="Pareto Frontier (budget spent → best damage)",
+            value="\n".join(
+                f"`{frontier[i]['spent']:>7.1f}` → {frontier[i]['total_damage']:.1f} "
+                f"(CR {frontier[i]['gains']['crit_rate']:.0f} / CD {frontier[i]['gains']['crit_damage']:.0f} / "
+                f"ATK {frontier[i]['gains']['atk_percent']:.0f} / ELEM {frontier[i]['gains']['elemental']:.0f})"
+                for i in picks
+            ),
+            inline=False
+        )
+        embed.set_footer(text=f"Evaluated {solution['candidates']} splits on top of your current build")
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="simulate")
+    async def simulate_hits(self, ctx, hits: int, hp_threshold: float = None, burst: int = 1):
+        """Sample the damage distribution of your build"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        try:
+            sim = simulate_damage(self.user_data[ctx.author.id], hits, hp_threshold, burst)
+        except ValueError as e:
+            await ctx.send(f"Error: {e}")
+            return
+        
+        unit = "hit" if sim["burst"] == 1 else "burst"
+        embed = discord.Embed(
+            title=f"Damage Simulation for {ctx.author.display_name}",
+            description=(
+                f"{sim['hits']:,} hits sampled"
+                + (f" as {sim['bursts']:,} bursts of {sim['burst']} hits" if sim["burst"] > 1 else "")
+            ),
+            color=0x10b981
+        )
+        embed.add_field(
+            name="Per Hit",
+            value=(
+                f"**Normal:** {sim['normal_hit']:.1f}\n"
+                f"**Crit:** {sim['crit_hit']:.1f}\n"
+                f"**Crit Chance:** {sim['crit_chance']:.1%} (observed {sim['crit_rate_observed']:.2%})"
+            ),
+            inline=False
+        )
+        embed.add_field(
+            name=f"Damage per {unit}",
+            value=(
+                f"**Mean:** {sim['mean']:.1f} (expected {sim['expected']:.1f})\n"
+                f"**p50:** {sim['p50']:.1f}\n"
+                f"**p90:** {sim['p90']:.1f}\n"
+                f"**p99:** {sim['p99']:.1f}"
+            ),
+            inline=False
+        )
+        if hp_threshold is not None:
             embed.add_field(
-                name="Base Stats",
-                value=(
-                    f"**Level:** {level}\n"
-                    f"**HP:** {results['base_hp']}\n"
-                    f"**MP:** {results['base_mp']}\n"
-                    f"**ATK:** {results['base_atk']}\n"
-                    f"**DEF:** {results['base_def']}\n"
-                    f"**Speed:** {results['base_speed']}\n"
-                    f"**Ascension:** {results['ascension_boost']}"
-                ),
+                name=f"Kill Chance vs {hp_threshold:g} HP",
+                value=f"**{sim['kill_chance']:.2%}** of {unit}s deal at least {hp_threshold:g} damage",
                 inline=False
             )
-            
-            # Status Points
-            embed.add_field(
-                name="Status Points",
-                value=(
-                    f"**Available:** {results['sp_available']}\n"
-                    f"**Allocated:** {results['sp_allocated']}\n"
-                    f"**VIT:** {vit} (+{vit*30} HP)\n"
-                    f"**DEF:** {defense} (+{defense} DEF)\n"
-                    f"**STR:** {strength} (+{strength*2} ATK)\n"
-                    f"**INT:** {intelligence} (+{intelligence*5} MP, +{intelligence*2} ATK)\n"
-                    f"**AGI:** {agility} (+{agility} Speed)"
-                ),
-                inline=False
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="marginal")
+    async def marginal_report(self, ctx):
+        """Rank every input by how much one more point or percent is worth"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        ranking = marginal_values(self.user_data[ctx.author.id])
+        embed = discord.Embed(
+            title=f"Marginal Values for {ctx.author.display_name}",
+            description="Gain from one more point of each input (or 1% for percent bonuses)",
+            color=0x10b981
+        )
+        for target, label in (("total_damage", "Total Damage"), ("final_hp", "Total HP"), ("final_def", "Total DEF")):
+            lines = [
+                f"`{param}` +{gain:.2f} per {'level' if param == 'character_level' else '%' if parameter_step(param) < 1 else 'point'}"
+                for param, gain in ranking[target] if gain > 0
+            ]
+            embed.add_field(name=label, value="\n".join(lines[:8]) or "Nothing increases this stat", inline=False)
+        embed.set_footer(text="Level shows the gain from one more level. Status points assume you have one to spend.")
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="ttk")
+    async def time_to_kill_report(self, ctx, monster_level: int = None):
+        """Turns to kill and turns to die against every monster species"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        data = self.user_data[ctx.author.id]
+        # The full species x level matrix is computed once per build and reused for any monster level
+        matrix, _ = self.cached_view(("ttk", normalize_params(data)), lambda: (time_to_kill(data), None))
+        levels = matrix["levels"]
+        if monster_level is None:
+            monster_level = int(min(max(data.get("character_level", 1), 1), levels[-1]))
+        if not levels[0] <= monster_level <= levels[-1]:
+            await ctx.send(f"Monster level must be between {levels[0]} and {levels[-1]}.")
+            return
+        column = monster_level - levels[0]
+        
+        embed = discord.Embed(
+            title=f"Time to Kill for {ctx.author.display_name}",
+            description=f"Basic attacks against level {monster_level} monsters (you attack first)",
+            color=0x10b981
+        )
+        families = {}
+        for index, species in enumerate(matrix["species"]):
+            kill = matrix["turns_to_kill"][index, column]
+            die = matrix["turns_to_die"][index, column]
+            families.setdefault(monster_family(species), []).append(
+                f"{'✅' if matrix['wins'][index, column] else '❌'} `{species}` "
+                f"kill {kill:,.0f} / die {die:,.1f} turns · beats up to Lv {matrix['max_level'][index]}"
             )
-            
-            # Final Stats
+        for family, lines in families.items():
+            embed.add_field(name=family, value="\n".join(lines), inline=False)
+        footer = "Turns are expected values; damage rolls vary by ±10%."
+        if not matrix["valid"]:
+            footer += " Warning: this build allocates more status points than its level allows."
+        embed.set_footer(text=footer)
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="save")
+    async def save_build(self, ctx, name: str):
+        """Save the current values as a named build"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        data = self.user_data[ctx.author.id]
+        builds = data.setdefault("builds", {})
+        name = name.lower()
+        
+        if len(name) > MAX_BUILD_NAME or name == "current":
+            await ctx.send(f"Build names must be at most {MAX_BUILD_NAME} characters and can't be `current`.")
+            return
+        if name not in builds and len(builds) >= MAX_BUILDS:
+            await ctx.send(f"You already have {MAX_BUILDS} builds. Delete one with `!stats delete <name>` first.")
+            return
+        
+        builds[name] = {param: data[param] for param in STAT_PARAMETERS}
+        await ctx.send(f"Saved build `{name}` for {ctx.author.mention}")
+    
+    @stats_group.command(name="load")
+    async def load_build(self, ctx, name: str):
+        """Load a named build into the current values"""
+        data = self.user_data.get(ctx.author.id)
+        build = data.get("builds", {}).get(name.lower()) if data else None
+        if build is None:
+            await ctx.send(f"No build named `{name}`. Use `!stats builds` to list yours.")
+            return
+        
+        data.update(build)
+        await ctx.send(f"Loaded build `{name.lower()}` for {ctx.author.mention}")
+    
+    @stats_group.command(name="delete")
+    async def delete_build(self, ctx, name: str):
+        """Delete a named build"""
+        data = self.user_data.get(ctx.author.id)
+        if not data or data.get("builds", {}).pop(name.lower(), None) is None:
+            await ctx.send(f"No build named `{name}`.")
+            return
+        await ctx.send(f"Deleted build `{name.lower()}`.")
+    
+    @stats_group.command(name="builds")
+    async def list_builds(self, ctx):
+        """List your named builds"""
+        data = self.user_data.get(ctx.author.id)
+        builds = data.get("builds", {}) if data else {}
+        if not builds:
+            await ctx.send("You have no saved builds. Use `!stats save <name>` to save one.")
+            return
+        await ctx.send(f"Builds for {ctx.author.mention}: " + ", ".join(f"`{name}`" for name in sorted(builds)))
+    
+    @stats_group.command(name="compare")
+    async def compare_builds(self, ctx, *names: str):
+        """Compare named builds side by side"""
+        if ctx.author.id not in self.user_data:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        data = self.user_data[ctx.author.id]
+        builds = dict(data.get("builds", {}), current={param: data[param] for param in STAT_PARAMETERS})
+        names = [name.lower() for name in names]
+        
+        if not 2 <= len(names) <= MAX_COMPARE:
+            await ctx.send(f"Pick between 2 and {MAX_COMPARE} builds to compare (`current` is your working values).")
+            return
+        missing = [name for name in names if name not in builds]
+        if missing:
+            await ctx.send(f"Unknown builds: {', '.join(missing)}. Use `!stats builds` to list yours.")
+            return
+        
+        # Every selected build in a single batch
+        results = compute_stats_batch(builds_to_columns([builds[name] for name in names]))
+        
+        width = max(len(name) for name in names) + 10
+        lines = ["".ljust(10) + "".join(name.rjust(width) for name in names)]
+        for key, label, fmt in COMPARE_ROWS:
+            first = results[key][0]
+            cells = [fmt.format(results[key][0])]
+            for value in results[key][1:]:
+                change = f" ({(value / first - 1) * 100:+.0f}%)" if first else ""
+                cells.append(fmt.format(value) + change)
+            lines.append(label.ljust(10) + "".join(cell.rjust(width) for cell in cells))
+        
+        embed = discord.Embed(
+            title=f"Build Comparison for {ctx.author.display_name}",
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=0x4f46e5
+        )
+        invalid = [name for name, valid in zip(names, results["valid"]) if not valid]
+        if invalid:
             embed.add_field(
-                name="Final Stats",
-                value=(
-                    f"**Total HP:** {results['final_hp']}\n"
-                    f"**Total MP:** {results['final_mp']}\n"
-                    f"**Total ATK:** {results['final_atk']}\n"
-                    f"**Total DEF:** {results['final_def']}\n"
-                    f"**Total Speed:** {results['final_speed']}\n"
-                    f"**Crit Rate:** {results['final_crit_rate']}\n"
-                    f"**Crit Damage:** {results['final_crit_dmg']}\n"
-                    f"**Avg. Damage:** {results['avg_damage']}\n"
-                    f"**Total Damage:** {results['total_damage']}"
-                ),
+                name="Warning",
+                value=f"Too many status points allocated in: {', '.join(invalid)}",
                 inline=False
             )
-            
-            await ctx.send(embed=embed)
-            
-        except Exception as e:
-            await ctx.send(f"An error occurred during calculation: {str(e)}")
+        embed.set_footer(text=f"Differences are relative to {names[0]}")
+        await ctx.send(embed=embed)
+    
+    @stats_group.command(name="export")
+    async def export_build(self, ctx, name: str = None):
+        """Export the current values (or a named build) as a build code"""
+        data = self.user_data.get(ctx.author.id)
+        if data is None:
+            await ctx.send("Please start a new calculation with `!stats new` first.")
+            return
+        
+        build = data.get("builds", {}).get(name.lower()) if name else data
+        if build is None:
+            await ctx.send(f"No build named `{name}`. Use `!stats builds` to list yours.")
+            return
+        
+        code = encode_build(build)
+        self.build_codes.put(code, decode_build(code))
+        await ctx.send(f"Build code for {ctx.author.mention}: `{code}`\nImport it with `!stats import {code}`")
+    
+    @stats_group.command(name="import")
+    async def import_build(self, ctx, code: str):
+        """Load a build code into the current values and calculate it"""
+        build = self.build_codes.get(code)
+        if build is None:
+            try:
+                build = decode_build(code)
+            except ValueError as e:
+                await ctx.send(f"Error: {e}")
+                return
+            self.build_codes.put(code, build)
+        
+        previous = self.user_data.get(ctx.author.id, {})
+        data = dict(DEFAULT_PARAMETERS, results={}, builds=previous.get("builds", {}))
+        data.update(build)
+        self.user_data[ctx.author.id] = data
+        
+        # Popular codes are computed once and shared through the stat cache
+        def compute():
+            results = row(compute_stats_batch(build))
+            return results, self.build_results_embed(results) if results["valid"] else None
+        
+        results, embed = self.cached_view(("calculate", normalize_params(build)), compute)
+        data["results"] = dict(results)
+        
+        if embed is None:
+            await ctx.send(
+                f"Imported build for {ctx.author.mention}, but it allocates more status points "
+                f"({results['sp_allocated']:g}) than its level allows ({results['sp_available']:g})."
+            )
+            return
+        
+        embed = embed.copy()
+        embed.title = f"Imported Build for {ctx.author.display_name}"
+        await ctx.send(embed=embed)
     
     @stats_group.command(name="show")
     async def show_values(self, ctx):
@@ -289,10 +619,16 @@ class JanusPenthosStatBot(commands.Cog):
             return
         
         data = self.user_data[ctx.author.id]
-        embed = discord.Embed(
-            title=f"Current Values for {ctx.author.display_name}",
-            color=0x4f46e5
-        )
+        key = ("show", tuple(repr(data[param]) for param in STAT_PARAMETERS))
+        _, embed = self.cached_view(key, lambda: (None, self.build_values_embed(data)))
+        
+        embed = embed.copy()
+        embed.title = f"Current Values for {ctx.author.display_name}"
+        await ctx.send(embed=embed)
+    
+    def build_values_embed(self, data):
+        """Format a user's current inputs (title is set per user)"""
+        embed = discord.Embed(color=0x4f46e5)
         
         # Character Progression
         embed.add_field(
@@ -347,7 +683,29 @@ class JanusPenthosStatBot(commands.Cog):
             inline=False
         )
         
-        await ctx.send(embed=embed)
+        return embed
+    
+    @stats_group.command(name="cache")
+    async def cache_info(self, ctx):
+        """Show stat cache statistics"""
+        info = self.stat_cache.info()
+        codes = self.build_codes.info()
+        await ctx.send(
+            f"Stat cache: {info['size']}/{info['maxsize']} entries, "
+            f"{info['hits']} hits, {info['misses']} misses ({info['hit_rate']:.0%} hit rate), "
+            f"{info['evictions']} evictions\n"
+            f"Build codes: {codes['size']}/{codes['maxsize']} decoded, {codes['hit_rate']:.0%} hit rate"
+        )
+    
+    @stats_group.command(name="sessions")
+    async def session_info(self, ctx):
+        """Show calculator session storage statistics"""
+        info = self.user_data.info()
+        await ctx.send(
+            f"Sessions: {info['resident']}/{info['max_resident']} in memory "
+            f"(~{info['memory_bytes'] / 1024:.1f} KiB), {info['stored']} on disk, "
+            f"{info['loads']} loads, {info['spills']} spills"
+        )
     
     @stats_group.command(name="help")
     async def show_help(self, ctx):
@@ -364,7 +722,14 @@ class JanusPenthosStatBot(commands.Cog):
                 "1. Start a new calculation with `!stats new`\n"
                 "2. Set your values with `!stats set <parameter> <value>`\n"
                 "3. Calculate your stats with `!stats calculate`\n"
-                "4. View your current values with `!stats show`"
+                "4. View your current values with `!stats show`\n"
+                "5. Let the bot spend your points with `!stats optimize <damage|ehp|mix> [damage_weight]`\n"
+                "6. Split a substat budget with `!stats substats <budget> [crit_rate_cost] [crit_damage_cost] [atk_cost] [elemental_cost]`\n"
+                "7. Check burst damage with `!stats simulate <hits> [hp_threshold] [burst_size]`\n"
+                "8. See which upgrade is worth the most with `!stats marginal`\n"
+                "9. Keep gear sets with `!stats save <name>` and compare them with `!stats compare a b c` (`current` is your working values)\n"
+                "10. Check which monsters your build can beat with `!stats ttk`\n"
+                "11. Share a build with `!stats export`; others load it with `!stats import <code>`"
             ),
             inline=False
         )
@@ -403,5 +768,5 @@ class JanusPenthosStatBot(commands.Cog):
         
         await ctx.send(embed=embed)
 
-def setup(bot):
-    bot.add_cog(JanusPenthosStatBot(bot))
\ No newline at end of file
+async def setup(bot):
+    await bot.add_cog(JanusPenthosStatBot(bot))
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Small caching helpers shared by the Janus Penthos bots."""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry.
+
+    `get` counts hits and misses so callers can report how well the cache
+    is doing. `on_evict(key, value)` is called for every entry pushed out
+    by the size bound (not for explicit `pop`/`clear`).
+    """
+    def __init__(self, maxsize: int = 128, on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Look up without touching recency or the hit/miss counters"""
+        return self._data.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            old_key, old_value = self._data.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(old_key, old_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def items(self):
+        return list(self._data.items())
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self) -> Dict[str, float]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
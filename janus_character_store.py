@@ -0,0 +1,172 @@
+"""SQLite storage for the character growth bot.
+
+Characters live in one WAL-mode database with a typed column per field
+(equipment slots are stored as JSON text). Every statement is a fixed SQL
+string, so sqlite3 prepares it once per connection and reuses it, and
+`save_many` writes any number of characters in a single transaction.
+
+Run this file directly to import an existing `characters/*.json` folder:
+
+    python janus_character_store.py [characters_dir] [database]
+"""
+import glob
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+# (column, SQL type, key in Character.to_dict)
+COLUMNS = (
+    ("name", "TEXT NOT NULL", "name"),
+    ("level", "INTEGER NOT NULL", "level"),
+    ("exp", "INTEGER NOT NULL", "exp"),
+    ("base_hp", "INTEGER NOT NULL", "base_hp"),
+    ("base_mp", "REAL NOT NULL", "base_mp"),
+    ("base_atk", "REAL NOT NULL", "base_atk"),
+    ("base_def", "REAL NOT NULL", "base_def"),
+    ("base_speed", "INTEGER NOT NULL", "base_speed"),
+    ("vit", "INTEGER NOT NULL", "vit"),
+    ("int_stat", "INTEGER NOT NULL", "int"),
+    ("str_stat", "INTEGER NOT NULL", "str"),
+    ("def_stat", "INTEGER NOT NULL", "def_stat"),
+    ("agi", "INTEGER NOT NULL", "agi"),
+    ("unallocated_points", "INTEGER NOT NULL", "unallocated_points"),
+    ("ascension_count", "INTEGER NOT NULL", "ascension_count"),
+)
+EQUIPMENT_SLOTS = ("weapon", "armor", "accessory")
+
+_COLUMN_NAMES = [column for column, _, _ in COLUMNS] + [f"{slot}_json" for slot in EQUIPMENT_SLOTS]
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS characters ("
+    "user_id TEXT PRIMARY KEY, "
+    + ", ".join(f"{column} {sql_type}" for column, sql_type, _ in COLUMNS)
+    + ", " + ", ".join(f"{slot}_json TEXT NOT NULL" for slot in EQUIPMENT_SLOTS)
+    + ", updated REAL NOT NULL)"
+)
+_CREATE_META = "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+_UPSERT = (
+    f"INSERT INTO characters (user_id, {', '.join(_COLUMN_NAMES)}, updated) "
+    f"VALUES (?, {', '.join('?' for _ in _COLUMN_NAMES)}, ?) "
+    "ON CONFLICT(user_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _COLUMN_NAMES + ["updated"])
+)
+_SELECT = f"SELECT {', '.join(_COLUMN_NAMES)} FROM characters WHERE user_id = ?"
+# The ID list is passed as one JSON array so the statement text never changes
+_SELECT_MANY = f"SELECT user_id, {', '.join(_COLUMN_NAMES)} FROM characters WHERE user_id IN (SELECT value FROM json_each(?))"
+_DELETE = "DELETE FROM characters WHERE user_id = ?"
+_COUNT = "SELECT COUNT(*) FROM characters"
+_USER_IDS = "SELECT user_id FROM characters ORDER BY user_id"
+_GET_META = "SELECT value FROM meta WHERE key = ?"
+_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+
+class CharacterStore:
+    """Character dicts (as produced by `Character.to_dict`) keyed by user ID"""
+    def __init__(self, path: str = "characters.db", check_same_thread: bool = True):
+        """Pass `check_same_thread=False` to hand the store to a writer thread after opening it"""
+        self.path = path
+        self._db = sqlite3.connect(path, cached_statements=32, check_same_thread=check_same_thread)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints, safe in WAL mode
+        self._db.execute(_CREATE_TABLE)
+        self._db.execute(_CREATE_META)
+        self._db.commit()
+
+    # ---------------------------
+    # Rows
+    # ---------------------------
+    @staticmethod
+    def _to_row(user_id: str, data: Mapping[str, Any], updated: float) -> Tuple:
+        values = [data[key] for _, _, key in COLUMNS]
+        values += [json.dumps(data["equipment"][slot], separators=(",", ":")) for slot in EQUIPMENT_SLOTS]
+        return (str(user_id), *values, updated)
+
+    @staticmethod
+    def _from_row(row: Tuple) -> Dict[str, Any]:
+        data = {key: value for (_, _, key), value in zip(COLUMNS, row)}
+        data["equipment"] = {
+            slot: json.loads(value) for slot, value in zip(EQUIPMENT_SLOTS, row[len(COLUMNS):])
+        }
+        return data
+
+    # ---------------------------
+    # Reads and writes
+    # ---------------------------
+    def load(self, user_id: str) -> Optional[Dict[str, Any]]:
+        row = self._db.execute(_SELECT, (str(user_id),)).fetchone()
+        return None if row is None else self._from_row(row)
+
+    def load_many(self, user_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Characters for every ID that has one, in a single query"""
+        ids = json.dumps([str(user_id) for user_id in user_ids])
+        return {row[0]: self._from_row(row[1:]) for row in self._db.execute(_SELECT_MANY, (ids,))}
+
+    def save(self, user_id: str, data: Mapping[str, Any]) -> None:
+        self.save_many([(user_id, data)])
+
+    def save_many(self, items: Union[Mapping[str, Mapping[str, Any]], Iterable[Tuple[str, Mapping[str, Any]]]]) -> int:
+        """Upsert many characters in one transaction; returns how many were written"""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        now = time.time()
+        rows = [self._to_row(user_id, data, now) for user_id, data in pairs]
+        with self._db:
+            self._db.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def delete(self, user_id: str) -> bool:
+        with self._db:
+            cursor = self._db.execute(_DELETE, (str(user_id),))
+        return cursor.rowcount > 0
+
+    def __contains__(self, user_id: str) -> bool:
+        return self._db.execute(_SELECT, (str(user_id),)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute(_COUNT).fetchone()[0]
+
+    def user_ids(self) -> List[str]:
+        return [user_id for (user_id,) in self._db.execute(_USER_IDS)]
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ---------------------------
+    # JSON migration
+    # ---------------------------
+    def migrate_json(self, directory: str = "characters", force: bool = False) -> int:
+        """Import every `<user_id>.json` in `directory` in one transaction.
+
+        Runs once per database (recorded in the meta table) unless `force` is
+        set, so characters deleted later aren't brought back from old files.
+        Returns the number of characters imported.
+        """
+        if not force and self._db.execute(_GET_META, ("json_migrated",)).fetchone():
+            return 0
+
+        now = time.time()
+        rows = []
+        for filename in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            try:
+                with open(filename, "r") as f:
+                    rows.append(self._to_row(os.path.splitext(os.path.basename(filename))[0], json.load(f), now))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                log.warning("Skipping %s: %s", filename, e)
+
+        with self._db:
+            self._db.executemany(_UPSERT, rows)
+            self._db.execute(_SET_META, ("json_migrated", str(now)))
+        log.info("Imported %d characters from %s", len(rows), directory)
+        return len(rows)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    directory = sys.argv[1] if len(sys.argv) > 1 else "characters"
+    store = CharacterStore(sys.argv[2] if len(sys.argv) > 2 else "characters.db")
+    store.migrate_json(directory, force=True)
+    print(f"{len(store)} characters stored in {store.path}")
+    store.close()
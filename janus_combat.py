@@ -0,0 +1,51 @@
+"""Turn rules shared by the encounter bot's `Combat` and the combat simulator.
+
+The damage functions use NumPy ufuncs, so the same code handles one plain
+number from `Combat` and whole arrays of fights from janus_combat_sim.py.
+Both `round` and `np.rint` round halves to even, so a single fight and its
+simulated twin roll the same damage numbers.
+"""
+import numpy as np
+from typing import NamedTuple
+
+# Share of the defender's DEF subtracted from a basic attack (both ways)
+DEFENSE_FACTOR = 0.7
+# Share of the monster's DEF subtracted from a damage skill
+SKILL_DEFENSE_FACTOR = 0.5
+# Every hit is scaled by a uniform roll in this range
+DAMAGE_ROLL = (0.9, 1.1)
+# Ice or Lightning against a Wet target
+REACTION_MULTIPLIER = 1.5
+FLEE_CHANCE = 0.5
+
+class SkillSpec(NamedTuple):
+    name: str
+    power: float
+    element: str  # `Element` member name
+    healing: bool
+    mp_cost: int
+    description: str
+
+# Every new character starts with these, in `!skills` order
+DEFAULT_SKILLS = (
+    SkillSpec("Power Slap", 1.5, "NONE", False, 2, "Basic attack"),
+    SkillSpec("Fireball", 1.8, "FIRE", False, 10, "Fire damage"),
+    SkillSpec("Heal", 0.5, "NONE", True, 15, "Restores HP"),
+    SkillSpec("Ice Shard", 1.6, "ICE", False, 8, "Ice damage"),
+    SkillSpec("Water Blast", 1.7, "WATER", False, 9, "Water damage"),
+)
+
+def attack_base(atk, defense):
+    """Basic attack damage before the roll"""
+    return np.maximum(1, atk - defense * DEFENSE_FACTOR)
+
+def skill_base(atk, power, defense):
+    """Damage skill damage before the roll"""
+    return np.maximum(1, atk * power - defense * SKILL_DEFENSE_FACTOR)
+
+def rolled(base, roll):
+    """Damage dealt for a base value and a `DAMAGE_ROLL` draw"""
+    return np.rint(base * roll)
+
+def heal_amount(max_hp, power):
+    return np.maximum(1, np.rint(max_hp * power))
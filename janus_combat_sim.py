@@ -0,0 +1,295 @@
+"""Headless batch combat simulator.
+
+Plays encounter-bot fights without Discord or message strings, using the
+same turn rules as `Combat.do_player_turn` / `do_monster_turn` (janus_combat)
+and the real monster stats (janus_monsters), and reports win rate, turns
+and damage per species and level.
+
+Each round the player acts first and the monster answers if still alive:
+
+* `attack` policy: basic attacks only.
+* `skills` policy: Heal below `heal_below` of max HP if there's MP for it,
+  otherwise the hardest-hitting attack or damage skill the player can pay for.
+
+Fights start at full HP and MP. Status effects, elemental reactions and
+fleeing are left out: nothing in the encounter bot applies a status yet, so
+they never change a fight. The player is a stat calculator build
+(janus_stats) with its status points allocated by `optimize_allocation` at
+each level. Every (species, level) cell plays all its fights in lockstep
+as array operations, and cells are spread over a process pool.
+
+    python janus_combat_sim.py --fights 2000 --policy skills --csv combat.csv
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from janus_combat import DAMAGE_ROLL, DEFAULT_SKILLS, attack_base, heal_amount, rolled, skill_base
+from janus_monsters import SPECIES, encounter_level, get_species, monster_stats_batch
+from janus_progression import MAX_LEVEL
+from janus_stats import OPTIMIZE_OBJECTIVES, POINT_PARAMETERS, decode_build, optimize_allocation
+
+POLICIES = ("attack", "skills")
+DEFAULT_LEVELS = (1, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100)
+PERCENTILES = (10, 50, 90)
+DEFAULT_MAX_TURNS = 500
+DEFAULT_HEAL_BELOW = 0.3
+# Fights per pool task; bounds worker memory for large runs
+TASK_FIGHTS = 1 << 18
+
+WIN, LOSS, TIMEOUT = 0, 1, 2
+
+def player_stats(levels: Sequence[int], build: Optional[Mapping[str, float]] = None,
+                 objective: str = "mix") -> Dict[str, np.ndarray]:
+    """HP, MP, ATK and DEF of `build`'s gear at each level, with the best allocation for `objective`"""
+    gear = {
+        param: value for param, value in (build or {}).items()
+        if param != "character_level" and param not in POINT_PARAMETERS
+    }
+    builds = [optimize_allocation(dict(gear, character_level=level), objective) for level in levels]
+    return {
+        stat: np.array([build[source] for build in builds])
+        for stat, source in (("max_hp", "final_hp"), ("max_mp", "final_mp"), ("atk", "final_atk"), ("defense", "final_def"))
+    }
+
+def fight_batch(player: Mapping[str, np.ndarray], monster: Mapping[str, np.ndarray], fights: int,
+                policy: str = "attack", max_turns: int = DEFAULT_MAX_TURNS,
+                heal_below: float = DEFAULT_HEAL_BELOW, seed=None) -> Dict[str, np.ndarray]:
+    """Play `fights` fights for every cell and summarize them per cell.
+
+    `player` and `monster` hold one stat array entry per cell (`monster` also
+    needs `miss_chance`). Fights still going after `max_turns` rounds count
+    as timeouts. Runs in pool workers, so everything in and out is arrays.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'. Use one of: {', '.join(POLICIES)}")
+    rng = np.random.default_rng(seed)
+    low, high = DAMAGE_ROLL
+    cells = len(player["max_hp"])
+    cell = np.repeat(np.arange(cells), fights)
+
+    # Player options per cell: basic attack first, then every damage skill
+    skills = [spec for spec in DEFAULT_SKILLS if not spec.healing] if policy == "skills" else []
+    costs = np.array([0] + [spec.mp_cost for spec in skills], dtype=float)
+    bases = np.stack([attack_base(player["atk"], monster["defense"])] +
+                     [skill_base(player["atk"], spec.power, monster["defense"]) for spec in skills])
+    heal = next((spec for spec in DEFAULT_SKILLS if spec.healing), None) if policy == "skills" else None
+    monster_base = attack_base(monster["atk"], player["defense"])
+
+    hp = player["max_hp"][cell].astype(float)
+    mp = player["max_mp"][cell].astype(float)
+    monster_hp = monster["max_hp"][cell].astype(float)
+    turns = np.zeros(cell.size, dtype=np.int32)
+    dealt = np.zeros(cell.size)
+    taken = np.zeros(cell.size)
+    outcome = np.full(cell.size, TIMEOUT, dtype=np.int8)
+
+    live = np.arange(cell.size)
+    for turn in range(1, max_turns + 1):
+        if not live.size:
+            break
+        at = cell[live]
+        turns[live] = turn
+
+        # Player turn
+        if len(costs) > 1:
+            affordable = mp[live] >= costs[:, None]
+            choice = np.argmax(np.where(affordable, bases[:, at], -np.inf), axis=0)
+        else:
+            choice = np.zeros(live.size, dtype=np.intp)
+        damage = rolled(bases[choice, at], rng.uniform(low, high, live.size))
+        cost = costs[choice]
+        if heal is not None:
+            max_hp = player["max_hp"][at]
+            healing = (hp[live] < heal_below * max_hp) & (mp[live] >= heal.mp_cost)
+            damage[healing] = 0
+            cost[healing] = heal.mp_cost
+            hp[live] = np.where(healing, np.minimum(max_hp, hp[live] + heal_amount(max_hp, heal.power)), hp[live])
+        mp[live] -= cost
+        monster_hp[live] -= damage
+        dealt[live] += damage
+
+        won = monster_hp[live] <= 0
+        outcome[live[won]] = WIN
+        live, at = live[~won], at[~won]
+
+        # Monster turn
+        hits = rng.random(live.size) >= monster["miss_chance"][at]
+        damage = rolled(monster_base[at], rng.uniform(low, high, live.size)) * hits
+        hp[live] -= damage
+        taken[live] += damage
+
+        lost = hp[live] <= 0
+        outcome[live[lost]] = LOSS
+        live = live[~lost]
+
+    outcome = outcome.reshape(cells, fights)
+    turns = turns.reshape(cells, fights)
+    summary = {
+        "win_rate": (outcome == WIN).mean(axis=1),
+        "timeout_rate": (outcome == TIMEOUT).mean(axis=1),
+        "mean_turns": turns.mean(axis=1),
+    }
+    for percentile, values in zip(PERCENTILES, np.percentile(turns, PERCENTILES, axis=1)):
+        summary[f"p{percentile}_turns"] = values
+    summary["damage_dealt"] = dealt.reshape(cells, fights).mean(axis=1)
+    summary["damage_taken"] = taken.reshape(cells, fights).mean(axis=1)
+    return summary
+
+def _run_task(args) -> Dict[str, np.ndarray]:
+    return fight_batch(*args)
+
+def simulate(
+    species: Sequence[str] = SPECIES,
+    levels: Sequence[int] = DEFAULT_LEVELS,
+    fights: int = 1000,
+    policy: str = "attack",
+    build: Optional[Mapping[str, float]] = None,
+    objective: str = "mix",
+    level_offset: int = 0,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    heal_below: float = DEFAULT_HEAL_BELOW,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Dict[str, object]:
+    """Play `fights` fights against every species at every player level.
+
+    Monsters are `level_offset` levels above the player (clamped like
+    `!explore` spawns). `workers` is the process count (default: one per
+    CPU; 1 runs in this process). Returns the per-cell statistics as arrays
+    of shape (len(species), len(levels)) and the settings used.
+    """
+    if fights <= 0:
+        raise ValueError("Fight count must be positive")
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'. Use one of: {', '.join(POLICIES)}")
+    for level in levels:
+        if not 1 <= level <= MAX_LEVEL:
+            raise ValueError(f"Level must be between 1 and {MAX_LEVEL}, got {level}")
+    species = tuple(get_species(name).name for name in species)
+    levels = np.asarray(levels, dtype=int)
+    monster_levels = np.array([encounter_level(level, level_offset) for level in levels])
+
+    player = player_stats(levels, build, objective)
+    monsters = monster_stats_batch(species, monster_levels)
+    monsters["miss_chance"] = 1.0 - monsters["hit_chance"]
+
+    # One task per species and run of levels, each with its own random stream
+    per_task = max(1, TASK_FIGHTS // fights)
+    slices = [(row, slice(start, start + per_task)) for row in range(len(species)) for start in range(0, len(levels), per_task)]
+    seeds = np.random.SeedSequence(seed).spawn(len(slices))
+    tasks = [
+        (
+            {stat: values[columns] for stat, values in player.items()},
+            {stat: monsters[stat][row, columns] for stat in ("max_hp", "atk", "defense", "miss_chance")},
+            fights, policy, max_turns, heal_below, task_seed,
+        )
+        for (row, columns), task_seed in zip(slices, seeds)
+    ]
+
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            summaries = list(pool.map(_run_task, tasks))
+    else:
+        summaries = [_run_task(task) for task in tasks]
+    elapsed = time.perf_counter() - started
+
+    stats = {key: np.zeros((len(species), len(levels))) for key in summaries[0]}
+    for (row, columns), summary in zip(slices, summaries):
+        for key, values in summary.items():
+            stats[key][row, columns] = values
+
+    return {
+        "species": species,
+        "levels": levels,
+        "monster_levels": monster_levels,
+        "stats": stats,
+        "elapsed": elapsed,
+        "settings": {
+            "fights": fights, "policy": policy, "objective": objective, "level_offset": level_offset,
+            "max_turns": max_turns, "heal_below": heal_below, "workers": workers, "seed": seed,
+        },
+    }
+
+def report(result: Dict[str, object]) -> List[Dict[str, object]]:
+    """One row per species and player level"""
+    stats = result["stats"]
+    rows = []
+    for i, name in enumerate(result["species"]):
+        for j, level in enumerate(result["levels"]):
+            row = {"species": name, "level": int(level), "monster_level": int(result["monster_levels"][j])}
+            row.update((key, float(values[i, j])) for key, values in stats.items())
+            rows.append(row)
+    return rows
+
+def _cell(column: str, value: object) -> str:
+    if column.endswith("_rate"):
+        return f"{value:.1%}"
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    return str(value)
+
+def format_table(rows: List[Dict[str, object]]) -> str:
+    """Report rows as a text table, species left-aligned and numbers right-aligned"""
+    columns = list(rows[0])
+    cells = [[_cell(column, row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+
+    def line(values):
+        return "  ".join(
+            value.ljust(width) if column == "species" else value.rjust(width)
+            for column, value, width in zip(columns, values, widths)
+        )
+    return "\n".join([line(columns)] + [line(values) for values in cells])
+
+def write_csv(rows: List[Dict[str, object]], path: str) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate encounter fights and report win rates per species and level")
+    parser.add_argument("--fights", type=int, default=1000, help="fights per species and level")
+    parser.add_argument("--species", nargs="+", default=list(SPECIES))
+    parser.add_argument("--levels", type=int, nargs="+", default=list(DEFAULT_LEVELS), help="player levels")
+    parser.add_argument("--offset", type=int, default=0, help="monster level relative to the player")
+    parser.add_argument("--policy", choices=POLICIES, default="attack")
+    parser.add_argument("--heal-below", type=float, default=DEFAULT_HEAL_BELOW, help="HP share under which the skills policy heals")
+    parser.add_argument("--build", help="stat calculator build code for the player's gear (status points are re-allocated per level)")
+    parser.add_argument("--objective", choices=OPTIMIZE_OBJECTIVES, default="mix", help="how status points are allocated")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--csv", help="also write the report to this CSV file")
+    args = parser.parse_args(argv)
+
+    try:
+        build = decode_build(args.build) if args.build else None
+        result = simulate(
+            species=args.species, levels=args.levels, fights=args.fights, policy=args.policy,
+            build=build, objective=args.objective, level_offset=args.offset, max_turns=args.max_turns,
+            heal_below=args.heal_below, workers=args.workers, seed=args.seed,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    rows = report(result)
+    print(format_table(rows))
+
+    total = args.fights * len(rows)
+    print(f"\n{total:,} fights in {result['elapsed']:.2f}s ({total / result['elapsed']:,.0f} fights/s)")
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"Report written to {args.csv}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Declarative stat formulas shared by all Janus Penthos bots.
+
+Formulas live in stat_formulas.json as one group per system, each an ordered
+mapping of output name -> arithmetic expression. Expressions may use numbers,
++ - * / // % **, parentheses, `max`, `min`, `round`, the group's inputs and
+any output defined above them. Anything else is rejected when the spec is
+loaded.
+
+Every group is compiled once at import into a plain Python function (for
+single characters) and the same function bound to NumPy ufuncs (for batches),
+so evaluating a formula never re-parses it.
+"""
+import ast
+import json
+import os
+
+import numpy as np
+from typing import Any, Dict, Mapping, Tuple
+
+FORMULA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stat_formulas.json")
+
+_SCALAR_FUNCTIONS = {"max": max, "min": min, "round": round}
+_BATCH_FUNCTIONS = {"max": np.maximum, "min": np.minimum, "round": np.round}
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+)
+
+def _parse(group: str, output: str, expression: str, known: set) -> Tuple[ast.Expression, list]:
+    """Validate one expression; returns its tree and the input names it introduces"""
+    where = f"{group}.{output}"
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"{where}: invalid expression {expression!r} ({e.msg})") from None
+
+    new_inputs = []
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"{where}: {type(node).__name__} is not allowed in formulas")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"{where}: only numeric constants are allowed")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _SCALAR_FUNCTIONS or node.keywords:
+                raise ValueError(f"{where}: only max(), min() and round() can be called")
+            if node.func.id in ("max", "min") and len(node.args) != 2:
+                raise ValueError(f"{where}: {node.func.id}() takes exactly two arguments")
+        if isinstance(node, ast.Name) and node.id not in _SCALAR_FUNCTIONS:
+            if node.id == output:
+                raise ValueError(f"{where}: formula refers to itself")
+            if node.id not in known:
+                known.add(node.id)
+                new_inputs.append(node.id)
+    return tree, new_inputs
+
+class CompiledFormulas:
+    """One formula group compiled into a scalar function and a NumPy batch function.
+
+    Call it with keyword inputs to get a dict of every output in spec order;
+    use `batch` with array (or scalar) inputs to get NumPy arrays instead.
+    """
+    __slots__ = ("name", "description", "inputs", "outputs", "_scalar", "_batch")
+
+    def __init__(self, name: str, formulas: Mapping[str, str], description: str = ""):
+        if not name.isidentifier():
+            raise ValueError(f"{name!r} is not a valid formula group name")
+        inputs = []
+        known = set()
+        lines = []
+        for output, expression in formulas.items():
+            if not output.isidentifier() or output in _SCALAR_FUNCTIONS:
+                raise ValueError(f"{name}: {output!r} is not a valid output name")
+            if output in inputs:
+                raise ValueError(f"{name}: {output} is used before it is defined")
+            if output in known:
+                raise ValueError(f"{name}: {output} is defined twice")
+            tree, new_inputs = _parse(name, output, expression, known)
+            inputs.extend(new_inputs)
+            known.add(output)
+            lines.append(f"    {output} = {ast.unparse(tree)}")
+
+        outputs = tuple(formulas)
+        source = (
+            f"def {name}({', '.join(inputs)}):\n"
+            + "\n".join(lines)
+            + f"\n    return {{{', '.join(f'{output!r}: {output}' for output in outputs)}}}\n"
+        )
+        code = compile(source, f"<formula {name}>", "exec")
+
+        scalar_namespace = {"__builtins__": {}, **_SCALAR_FUNCTIONS}
+        batch_namespace = {"__builtins__": {}, **_BATCH_FUNCTIONS}
+        exec(code, scalar_namespace)
+        exec(code, batch_namespace)
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "inputs", tuple(inputs))
+        object.__setattr__(self, "outputs", outputs)
+        object.__setattr__(self, "_scalar", scalar_namespace[name])
+        object.__setattr__(self, "_batch", batch_namespace[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledFormulas is read-only")
+
+    def __call__(self, **inputs: float) -> Dict[str, Any]:
+        return self._scalar(**inputs)
+
+    def batch(self, **columns: Any) -> Dict[str, np.ndarray]:
+        return self._batch(**{key: np.asarray(value, dtype=float) for key, value in columns.items()})
+
+    def __repr__(self) -> str:
+        return f"<CompiledFormulas {self.name}({', '.join(self.inputs)}) -> {', '.join(self.outputs)}>"
+
+def load_formulas(path: str = FORMULA_FILE) -> Dict[str, CompiledFormulas]:
+    """Read and compile every formula group in a spec file"""
+    with open(path, "r") as f:
+        spec = json.load(f)
+    return {
+        name: CompiledFormulas(name, group["formulas"], group.get("description", ""))
+        for name, group in spec.items()
+    }
+
+# Compiled once at startup and shared by every bot
+FORMULAS = load_formulas()
@@ -0,0 +1,79 @@
+"""Compiled loot tables shared by the encounter and autobattle bots.
+
+A loot table is a list of independent entries (item, drop chance, min
+quantity, max quantity). `LootTable` turns one into NumPy arrays once: a
+chance per entry plus each entry's quantity values and cumulative
+probabilities. A single kill is then two vector draws, and `roll_batch`
+aggregates the drops of any number of kills with one binomial and one
+multinomial draw per entry, so its cost doesn't grow with the kill count.
+"""
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+
+# (item, chance per kill 0-1, min quantity, max quantity)
+LootSpec = Tuple[str, float, int, int]
+
+_rng = np.random.default_rng()
+
+class LootTable:
+    """Independent drops, each with its own chance and a uniform quantity range"""
+    __slots__ = ("items", "chance", "values", "pmf", "cdf", "_entry_item")
+
+    def __init__(self, entries: Iterable[LootSpec]):
+        entries = list(entries)
+        for item, chance, low, high in entries:
+            if not 0 <= chance <= 1:
+                raise ValueError(f"{item}: drop chance must be between 0 and 1")
+            if not 0 <= low <= high:
+                raise ValueError(f"{item}: quantity range must satisfy 0 <= min <= max")
+
+        items = tuple(dict.fromkeys(item for item, _, _, _ in entries))
+        width = max((high - low + 1 for _, _, low, high in entries), default=1)
+        values = np.zeros((len(entries), width), dtype=np.int64)
+        pmf = np.zeros((len(entries), width))
+        cdf = np.ones((len(entries), width))
+        for index, (_, _, low, high) in enumerate(entries):
+            span = high - low + 1
+            values[index, :span] = np.arange(low, high + 1)
+            pmf[index, :span] = 1 / span
+            cdf[index, :span - 1] = np.arange(1, span) / span
+
+        self.items = items
+        self.chance = np.array([chance for _, chance, _, _ in entries], dtype=float)
+        self.values = values
+        self.pmf = pmf
+        self.cdf = cdf
+        self._entry_item = np.array([items.index(item) for item, _, _, _ in entries], dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.chance)
+
+    def roll(self, rng: Optional[np.random.Generator] = None) -> Dict[str, int]:
+        """Drops from one kill, in table order"""
+        rng = rng or _rng
+        hits = np.flatnonzero(rng.random(len(self.chance)) < self.chance)
+        if not hits.size:
+            return {}
+        columns = (self.cdf[hits] < rng.random(hits.size)[:, None]).sum(axis=1)
+        drops = {}
+        for entry, quantity in zip(hits, self.values[hits, columns]):
+            item = self.items[self._entry_item[entry]]
+            drops[item] = drops.get(item, 0) + int(quantity)
+        return drops
+
+    def roll_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> Dict[str, int]:
+        """Total drops from `n` kills, drawn in one vectorized step"""
+        if n < 0:
+            raise ValueError("Kill count can't be negative")
+        rng = rng or _rng
+        hits = rng.binomial(n, self.chance)
+        counts = rng.multinomial(hits, self.pmf)
+        per_entry = (counts * self.values).sum(axis=1)
+        per_item = np.bincount(self._entry_item, weights=per_entry, minlength=len(self.items))
+        return {item: int(total) for item, total in zip(self.items, per_item) if total}
+
+    def expected(self, n: int = 1) -> Dict[str, float]:
+        """Average drops from `n` kills"""
+        per_entry = self.chance * (self.pmf * self.values).sum(axis=1) * n
+        per_item = np.bincount(self._entry_item, weights=per_entry, minlength=len(self.items))
+        return dict(zip(self.items, per_item.tolist()))
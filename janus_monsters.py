@@ -0,0 +1,185 @@
+"""Monster species registry shared by the encounter bot, the stat calculator and the simulators.
+
+Every species is an entry in monsters.json keyed by its exact name, holding
+its stat curve (a "monster_<family>" formula group in stat_formulas.json),
+miss chance, EXP table, loot table and encounter odds. The file is loaded
+and checked once at import, so every lookup is a dict access and adding a
+monster is a data change only. Loot tables are compiled per species and
+level on first use (see janus_loot.py).
+"""
+import json
+import os
+
+import numpy as np
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from janus_formulas import FORMULAS, CompiledFormulas
+from janus_loot import LootTable
+
+MONSTER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monsters.json")
+
+MONSTER_STATS = ("max_hp", "atk", "defense", "speed")
+
+# Monsters spawn up to this many levels above or below the player
+ENCOUNTER_LEVEL_SPREAD = 2
+MAX_MONSTER_LEVEL = 100
+
+class LevelTable:
+    """Value by monster level, with a default for levels not listed.
+
+    `spec` is a plain value (same at every level) or a mapping of level
+    ("3") or inclusive level range ("5-7") to value, plus an optional
+    "default" key. Ranges are expanded when the table is built.
+    """
+    __slots__ = ("_values", "default")
+
+    def __init__(self, spec: Any, where: str, default: Any = None, convert: Optional[Callable[[Any], Any]] = None):
+        convert = convert or (lambda value: value)
+        values = {}
+        if isinstance(spec, dict):
+            for key, value in spec.items():
+                if key == "default":
+                    default = convert(value)
+                    continue
+                low, _, high = key.partition("-")
+                try:
+                    low, high = int(low), int(high or low)
+                except ValueError:
+                    raise ValueError(f"{where}: {key!r} is not a level or level range") from None
+                for level in range(low, high + 1):
+                    values[level] = convert(value)
+        else:
+            default = convert(spec)
+        self._values = values
+        self.default = default
+
+    def __getitem__(self, level: int) -> Any:
+        return self._values.get(level, self.default)
+
+    def values(self) -> List[Any]:
+        """Every distinct entry, the default included"""
+        return list(self._values.values()) + [self.default]
+
+class LootEntry(NamedTuple):
+    item: str
+    chance: LevelTable  # chance per kill
+    quantity: LevelTable  # (min, max), inclusive
+
+class Species(NamedTuple):
+    name: str
+    family: str
+    formulas: CompiledFormulas
+    miss_chance: float
+    exp: LevelTable
+    loot: Tuple[LootEntry, ...]
+    encounter_weight: int
+    min_player_level: int
+
+def _load_species(name: str, spec: Mapping[str, Any]) -> Species:
+    where = f"monsters.{name}"
+    if spec.get("stats") not in FORMULAS:
+        raise ValueError(f"{where}: unknown stat formula group {spec.get('stats')!r}")
+
+    loot = []
+    for index, entry in enumerate(spec.get("loot", [])):
+        entry_where = f"{where}.loot[{index}]"
+        chance = LevelTable(entry["chance"], entry_where, default=0.0)
+        quantity = LevelTable(entry.get("quantity", [1, 1]), entry_where, default=(1, 1), convert=tuple)
+        if any(not 0 <= value <= 1 for value in chance.values()):
+            raise ValueError(f"{entry_where}: chance must be between 0 and 1")
+        if any(len(value) != 2 or not 1 <= value[0] <= value[1] for value in quantity.values()):
+            raise ValueError(f"{entry_where}: quantity must be [min, max] with 1 <= min <= max")
+        loot.append(LootEntry(entry["item"], chance, quantity))
+
+    miss_chance = spec.get("miss_chance", 0.0)
+    if not 0 <= miss_chance < 1:
+        raise ValueError(f"{where}: miss_chance must be at least 0 and below 1")
+    return Species(
+        name=name,
+        family=spec["family"],
+        formulas=FORMULAS[spec["stats"]],
+        miss_chance=miss_chance,
+        exp=LevelTable(spec.get("exp", {}), f"{where}.exp", default=0),
+        loot=tuple(loot),
+        encounter_weight=spec.get("encounter_weight", 0),
+        min_player_level=spec.get("min_player_level", 1),
+    )
+
+def load_monsters(path: str = MONSTER_FILE) -> Dict[str, Species]:
+    """Read and check every species in a monster data file"""
+    with open(path, "r") as f:
+        spec = json.load(f)
+    return {name: _load_species(name, entry) for name, entry in spec["species"].items()}
+
+# Loaded once at startup and shared by every bot
+MONSTERS = load_monsters()
+
+# Every species, in data file order
+SPECIES = tuple(MONSTERS)
+
+# (species, weight) for everything `!explore` can spawn
+ENCOUNTER_WEIGHTS = tuple((name, species.encounter_weight) for name, species in MONSTERS.items() if species.encounter_weight)
+
+def get_species(name: str) -> Species:
+    try:
+        return MONSTERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown monster species: {name}") from None
+
+def monster_family(name: str) -> str:
+    return get_species(name).family
+
+def hit_chance(name: str) -> float:
+    """Chance per turn that a species actually attacks"""
+    return 1.0 - get_species(name).miss_chance
+
+def monster_stats(name: str, level: int) -> Dict[str, int]:
+    """Stats of one monster as plain numbers"""
+    return get_species(name).formulas(level=level)
+
+def monster_stats_batch(species: Sequence[str], levels: Sequence[int]) -> Dict[str, np.ndarray]:
+    """Stats for every (species, level) pair as arrays of shape (len(species), len(levels))"""
+    curves = [get_species(name).formulas for name in species]
+    by_curve = {formulas.name: formulas.batch(level=levels) for formulas in curves}
+    stats = {
+        stat: np.stack([np.broadcast_to(by_curve[formulas.name][stat], np.shape(levels)) for formulas in curves])
+        for stat in MONSTER_STATS
+    }
+    stats["hit_chance"] = np.array([hit_chance(name) for name in species])[:, None] * np.ones(np.shape(levels))
+    return stats
+
+def exp_reward(name: str, level: int) -> int:
+    """EXP for defeating a monster; 0 for levels its EXP table doesn't list"""
+    return get_species(name).exp[level]
+
+# (species, level) -> compiled loot table
+_LOOT_TABLES: Dict[Tuple[str, int], LootTable] = {}
+
+def loot_table(name: str, level: int) -> LootTable:
+    table = _LOOT_TABLES.get((name, level))
+    if table is None:
+        table = LootTable((entry.item, entry.chance[level], *entry.quantity[level]) for entry in get_species(name).loot)
+        _LOOT_TABLES[(name, level)] = table
+    return table
+
+def roll_loot(name: str, level: int, rng: Optional[np.random.Generator] = None) -> Dict[str, int]:
+    """Drops from one kill; every loot entry is rolled on its own"""
+    return loot_table(name, level).roll(rng)
+
+def roll_loot_batch(name: str, level: int, n: int, rng: Optional[np.random.Generator] = None) -> Dict[str, int]:
+    """Total drops from `n` kills of one species and level"""
+    return loot_table(name, level).roll_batch(n, rng)
+
+# ---------------------------
+# Encounters (`!explore`)
+# ---------------------------
+def encounter_weights(player_level: int) -> List[Tuple[str, int]]:
+    """Species a player can meet and their relative weights"""
+    return [
+        (name, weight) for name, weight in ENCOUNTER_WEIGHTS
+        if player_level >= MONSTERS[name].min_player_level
+    ]
+
+def encounter_level(player_level: int, offset: int) -> int:
+    """Level of a monster spawned `offset` levels from the player (offsets are uniform in +-ENCOUNTER_LEVEL_SPREAD)"""
+    return max(1, min(player_level + offset, MAX_MONSTER_LEVEL))
@@ -0,0 +1,132 @@
+"""Non-blocking persistence for the Janus Penthos bots.
+
+Command handlers hand their save/load work to an `AsyncWriter`, which runs
+serialization and disk I/O on one dedicated writer thread and returns an
+awaitable. Jobs run in submission order, so two saves of the same file can
+never land out of order, and a slow disk only delays the awaiting command
+instead of the whole event loop.
+
+Pass snapshots (fresh dicts such as `to_dict()` results) rather than live
+objects, since they are serialized on the writer thread. A load -> modify ->
+save of a whole file spans two awaits, so hold `writer.lock(path)` around it
+or two overlapping commands will each save their own copy and one change is
+lost.
+"""
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class AsyncWriter:
+    """Single writer thread with queue-depth and latency metrics"""
+    def __init__(self, name: str = "janus-writer"):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._file_locks: Dict[Hashable, asyncio.Lock] = {}
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+
+    # ---------------------------
+    # Jobs
+    # ---------------------------
+    def _track(self, func: Callable, args: tuple, kwargs: dict, submitted: float):
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            latency = time.perf_counter() - submitted
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.total_latency += latency
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+
+    def submit(self, func: Callable, *args, **kwargs) -> "asyncio.Future":
+        """Queue `func(*args, **kwargs)` on the writer thread; await the result"""
+        with self._lock:
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        submitted = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, lambda: self._track(func, args, kwargs, submitted))
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        return await self.submit(func, *args, **kwargs)
+
+    def write_json(self, path: str, data: Any, indent: Optional[int] = 2) -> "asyncio.Future":
+        """Serialize `data` and atomically replace `path` on the writer thread"""
+        return self.submit(write_json_file, path, data, indent)
+
+    def read_json(self, path: str, default: Any = None) -> "asyncio.Future":
+        """Read and parse `path` on the writer thread; `default` if it doesn't exist"""
+        return self.submit(read_json_file, path, default)
+
+    def lock(self, key: Hashable) -> asyncio.Lock:
+        """Event loop lock for one file (or any key), for read-modify-write sequences"""
+        lock = self._file_locks.get(key)
+        if lock is None:
+            lock = self._file_locks[key] = asyncio.Lock()
+        return lock
+
+    async def flush(self) -> None:
+        """Wait for every job submitted so far"""
+        await self.submit(lambda: None)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    # ---------------------------
+    # Metrics
+    # ---------------------------
+    @property
+    def queue_depth(self) -> int:
+        return self.pending
+
+    def info(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "queue_depth": self.pending,
+                "max_queue_depth": self.max_pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_latency_ms": 1000 * self.total_latency / self.completed if self.completed else 0.0,
+                "max_latency_ms": 1000 * self.max_latency,
+                "last_latency_ms": 1000 * self.last_latency,
+            }
+
+def write_json_file(path: str, data: Any, indent: Optional[int] = 2) -> str:
+    """Write JSON through a temp file + rename, so readers never see half a file"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    payload = json.dumps(data, indent=indent)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return path
+
+def read_json_file(path: str, default: Any = None) -> Any:
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as f:
+        return json.load(f)
+
+# Shared by everything in one bot process
+writer = AsyncWriter()
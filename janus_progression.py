@@ -0,0 +1,146 @@
+"""Level and ascension lookup tables shared by all Janus Penthos bots.
+
+Everything that depends only on a character's level (base stats, ascension
+boost, EXP limits and status point totals) is computed once at import time
+for levels 1-100. `PROGRESSION[level]` gives one level as plain Python
+numbers and `PROGRESSION.<column>[levels]` gives read-only NumPy columns for
+batch math.
+"""
+from bisect import bisect_right
+
+import numpy as np
+from typing import Dict, NamedTuple, Tuple
+
+MAX_LEVEL = 100
+MAX_STATUS_POINTS = 300
+STATUS_POINTS_PER_LEVEL = 3
+ASCENSION_LEVELS = (25, 50, 75, 100)
+ASCENSION_BOOST = 0.10  # +10% base stats (except speed) per ascension
+
+# (highest level in bracket, EXP limit per level) -- EXP limit is level * multiplier
+EXP_LIMIT_BRACKETS = (
+    (5, 500), (10, 600), (15, 700), (20, 800), (25, 900),
+    (30, 1000), (35, 1100), (40, 1200), (45, 1300), (50, 1400),
+    (55, 1500), (60, 1600), (65, 1700), (70, 1800), (75, 1900),
+    (80, 2000), (85, 2100), (90, 2200), (95, 2300), (MAX_LEVEL, 2500),
+)
+
+class LevelStats(NamedTuple):
+    level: int
+    # Level formulas before ascension
+    raw_hp: int
+    raw_mp: int
+    raw_atk: int
+    raw_def: int
+    # Ascension
+    ascension: int
+    ascension_multiplier: float
+    # Base stats with every ascension reached so far applied
+    base_hp: int
+    base_mp: float
+    base_atk: float
+    base_def: float
+    # EXP needed to clear this level, and total EXP to reach it from level 1
+    exp_limit: int
+    cumulative_exp: int
+    # Status points earned by this level (capped at 300)
+    status_points: int
+
+def exp_limit_for(level: int) -> int:
+    """EXP needed to go from `level` to the next one"""
+    for top, multiplier in EXP_LIMIT_BRACKETS:
+        if level <= top:
+            return level * multiplier
+    return level * EXP_LIMIT_BRACKETS[-1][1]
+
+def _build_level(level: int, cumulative_exp: int) -> LevelStats:
+    raw_hp = 100 * level
+    raw_mp = 3 * level + 20
+    raw_atk = 3 * level + 5
+    raw_def = 3 * level + 5
+    ascension = sum(1 for ascension_level in ASCENSION_LEVELS if level >= ascension_level)
+    multiplier = round(1 + ascension * ASCENSION_BOOST, 2)
+    return LevelStats(
+        level=level,
+        raw_hp=raw_hp,
+        raw_mp=raw_mp,
+        raw_atk=raw_atk,
+        raw_def=raw_def,
+        ascension=ascension,
+        ascension_multiplier=multiplier,
+        base_hp=int(round(raw_hp * multiplier)),
+        base_mp=round(raw_mp * multiplier, 1),
+        base_atk=round(raw_atk * multiplier, 1),
+        base_def=round(raw_def * multiplier, 1),
+        exp_limit=exp_limit_for(level),
+        cumulative_exp=cumulative_exp,
+        status_points=min(STATUS_POINTS_PER_LEVEL * level, MAX_STATUS_POINTS),
+    )
+
+class ProgressionTable:
+    """Immutable per-level lookup table.
+
+    Rows are `LevelStats` tuples and columns are read-only NumPy arrays.
+    Both are indexed directly by level; column index 0 is an unused zero.
+    """
+    __slots__ = ("max_level", "_rows", "_columns", "_cumulative_exp")
+
+    def __init__(self, max_level: int = MAX_LEVEL):
+        rows = []
+        cumulative = 0
+        for level in range(1, max_level + 1):
+            rows.append(_build_level(level, cumulative))
+            cumulative += rows[-1].exp_limit
+
+        columns = {}
+        for index, field in enumerate(LevelStats._fields):
+            column = np.array([0] + [row[index] for row in rows])
+            column.flags.writeable = False
+            columns[field] = column
+
+        object.__setattr__(self, "max_level", max_level)
+        object.__setattr__(self, "_rows", tuple(rows))
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_cumulative_exp", tuple(row.cumulative_exp for row in rows))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ProgressionTable is read-only")
+
+    def __getitem__(self, level: int) -> LevelStats:
+        if not 1 <= level <= self.max_level:
+            raise IndexError(f"Level must be between 1 and {self.max_level}, got {level}")
+        return self._rows[level - 1]
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return self.max_level
+
+    def level_for_exp(self, total_exp: int) -> Tuple[int, int]:
+        """Level reached with `total_exp` EXP earned since level 1, plus the EXP into that level.
+
+        A binary search over the cumulative EXP column, so any grant resolves
+        in one step. EXP past the max level keeps accumulating there.
+        """
+        if total_exp < 0:
+            raise ValueError("Total EXP can't be negative")
+        level = min(bisect_right(self._cumulative_exp, total_exp), self.max_level)
+        return level, total_exp - self._cumulative_exp[level - 1]
+
+    def levels_for_exp(self, total_exp: np.ndarray) -> np.ndarray:
+        """`level_for_exp` for a whole array of total EXP values (levels only)"""
+        levels = np.searchsorted(self._columns["cumulative_exp"][1:], total_exp, side="right")
+        return np.minimum(levels, self.max_level)
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        return dict(self._columns)
+
+# Shared table, built once at import
+PROGRESSION = ProgressionTable()
@@ -0,0 +1,184 @@
+"""Offline progression simulator.
+
+Projects how many days a population of synthetic players needs to reach
+given levels, using the real level table (janus_progression) and the real
+encounter odds and EXP rewards (janus_monsters), so any change to EXP limits
+or monster rewards shows up here unchanged.
+
+Every player gets a personal encounter rate (gamma-distributed around the
+mean, so some players grind far more than others), plays on a given share
+of days and wins a given share of fights. Each simulated day is one batch
+of array operations over all players: the number of won encounters is
+Poisson, and the EXP they give is drawn from the normal approximation to the
+exact per-level reward distribution. Levels are updated once per day.
+
+    python janus_progression_sim.py --players 100000 --days 365 --encounters 20 --csv progression.csv
+"""
+import argparse
+import csv
+import sys
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence
+
+from janus_monsters import ENCOUNTER_LEVEL_SPREAD, encounter_level, encounter_weights, exp_reward
+from janus_progression import ASCENSION_LEVELS, PROGRESSION
+
+DEFAULT_TARGETS = ASCENSION_LEVELS
+PERCENTILES = (10, 25, 50, 75, 90)
+
+def reward_distribution(reward: Callable[[str, int], Optional[int]] = exp_reward) -> Dict[str, np.ndarray]:
+    """Mean and variance of the EXP one won encounter gives, per player level.
+
+    Arrays are indexed by level like `PROGRESSION` columns. `no_reward` is the
+    chance an encounter gives nothing (no reward defined for that monster).
+    """
+    size = PROGRESSION.max_level + 1
+    mean = np.zeros(size)
+    variance = np.zeros(size)
+    no_reward = np.zeros(size)
+    offsets = range(-ENCOUNTER_LEVEL_SPREAD, ENCOUNTER_LEVEL_SPREAD + 1)
+    for level in range(1, size):
+        weights = encounter_weights(level)
+        total_weight = sum(weight for _, weight in weights)
+        values, odds = [], []
+        for name, weight in weights:
+            for offset in offsets:
+                values.append(reward(name, encounter_level(level, offset)) or 0)
+                odds.append(weight / total_weight / len(offsets))
+        values, odds = np.array(values, dtype=float), np.array(odds)
+        mean[level] = odds @ values
+        variance[level] = odds @ (values - mean[level]) ** 2
+        no_reward[level] = odds[values == 0].sum()
+    return {"mean": mean, "variance": variance, "no_reward": no_reward}
+
+def simulate(
+    players: int = 100_000,
+    days: int = 365,
+    encounters_per_day: float = 20.0,
+    activity_spread: float = 1.0,
+    play_chance: float = 1.0,
+    win_rate: float = 1.0,
+    targets: Sequence[int] = DEFAULT_TARGETS,
+    seed: Optional[int] = None,
+    rewards: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, object]:
+    """Simulate `players` for `days` days.
+
+    `activity_spread` is the coefficient of variation of the per-player
+    encounter rate (0 gives everyone exactly `encounters_per_day`).
+    Returns the first day each player reached each target (-1 if never),
+    every player's final level and total EXP, and the settings used.
+    """
+    for target in targets:
+        if not 1 <= target <= PROGRESSION.max_level:
+            raise ValueError(f"Target level must be between 1 and {PROGRESSION.max_level}, got {target}")
+    rng = np.random.default_rng(seed)
+    rewards = rewards or reward_distribution()
+    mean, deviation = rewards["mean"], np.sqrt(rewards["variance"])
+
+    if activity_spread > 0:
+        shape = 1 / activity_spread ** 2
+        rates = rng.gamma(shape, encounters_per_day / shape, players)
+    else:
+        rates = np.full(players, float(encounters_per_day))
+    rates *= win_rate
+
+    total_exp = np.zeros(players, dtype=np.int64)
+    levels = np.ones(players, dtype=np.int64)
+    reached = {target: np.full(players, -1, dtype=np.int32) for target in targets}
+
+    for day in range(1, days + 1):
+        playing = rng.random(players) < play_chance
+        wins = rng.poisson(rates * playing)
+        gained = wins * mean[levels] + np.sqrt(wins) * deviation[levels] * rng.standard_normal(players)
+        total_exp += np.maximum(np.rint(gained), 0).astype(np.int64)
+        levels = PROGRESSION.levels_for_exp(total_exp)
+        for target, first_day in reached.items():
+            first_day[(first_day < 0) & (levels >= target)] = day
+
+    return {
+        "reached": reached,
+        "levels": levels,
+        "total_exp": total_exp,
+        "settings": {
+            "players": players, "days": days, "encounters_per_day": encounters_per_day,
+            "activity_spread": activity_spread, "play_chance": play_chance, "win_rate": win_rate, "seed": seed,
+        },
+    }
+
+def report(result: Dict[str, object]) -> List[Dict[str, object]]:
+    """One row per target level: how many players got there and the days-to-level percentiles"""
+    players = result["settings"]["players"]
+    rows = []
+    for target, first_day in result["reached"].items():
+        days = first_day[first_day >= 0]
+        row = {
+            "target_level": target,
+            "players_reached": int(days.size),
+            "share_reached": days.size / players,
+            "mean_days": float(days.mean()) if days.size else None,
+        }
+        for percentile, value in zip(PERCENTILES, np.percentile(days, PERCENTILES) if days.size else [None] * len(PERCENTILES)):
+            row[f"p{percentile}_days"] = None if value is None else float(value)
+        rows.append(row)
+    return rows
+
+def _cell(column: str, value: object) -> str:
+    if value is None:
+        return "-"
+    if column == "share_reached":
+        return f"{value:.1%}"
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    return f"{value:,}"
+
+def format_table(rows: List[Dict[str, object]]) -> str:
+    """Report rows as a right-aligned text table"""
+    columns = list(rows[0])
+    cells = [[_cell(column, row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines += ["  ".join(value.rjust(width) for value, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+def write_csv(rows: List[Dict[str, object]], path: str) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Project days-to-level for a synthetic player population")
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--encounters", type=float, default=20.0, help="mean encounters per active day")
+    parser.add_argument("--spread", type=float, default=1.0, help="variation of encounter rate between players (0 = identical)")
+    parser.add_argument("--play-chance", type=float, default=1.0, help="chance a player plays on any given day")
+    parser.add_argument("--win-rate", type=float, default=1.0, help="share of encounters won")
+    parser.add_argument("--targets", type=int, nargs="+", default=list(DEFAULT_TARGETS))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--csv", help="also write the report to this CSV file")
+    args = parser.parse_args(argv)
+
+    rewards = reward_distribution()
+    result = simulate(
+        players=args.players, days=args.days, encounters_per_day=args.encounters,
+        activity_spread=args.spread, play_chance=args.play_chance, win_rate=args.win_rate,
+        targets=args.targets, seed=args.seed, rewards=rewards,
+    )
+    rows = report(result)
+    print(format_table(rows))
+
+    levels = result["levels"]
+    print(f"\nAfter {args.days} days: median level {np.median(levels):.0f}, max level {levels.max()}")
+    stuck = np.flatnonzero(rewards["mean"][1:] == 0) + 1
+    if stuck.size:
+        print(f"Encounters give no EXP at level {stuck[0]}, so players who reach it stop there")
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"Report written to {args.csv}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
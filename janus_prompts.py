@@ -0,0 +1,140 @@
+"""Pending chat prompts for multi-step bot dialogs.
+
+`bot.wait_for('message', check=...)` keeps one check callback and one timer
+per waiting dialog, and runs every check on every message the bot sees.
+`PromptDispatcher` indexes pending prompts by (channel_id, author_id), so an
+incoming message is matched with one dict lookup, and expires them from a
+single timing wheel driven by one background task.
+
+Wire it up once per bot:
+
+    prompts = PromptDispatcher()
+
+    @bot.listen("on_message")
+    async def route_prompts(message):
+        prompts.dispatch(message)
+
+and replace `bot.wait_for('message', ...)` with `prompts.wait_for(ctx, ...)`.
+"""
+import asyncio
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+PromptKey = Tuple[int, int]  # (channel_id, author_id)
+
+class _Prompt:
+    __slots__ = ("key", "future", "check", "rounds")
+
+    def __init__(self, key: PromptKey, future: "asyncio.Future", check: Optional[Callable[[Any], bool]], rounds: int):
+        self.key = key
+        self.future = future
+        self.check = check
+        self.rounds = rounds  # full turns of the wheel left before expiry
+
+class PromptDispatcher:
+    """Routes messages to pending prompts and times them out in bulk.
+
+    Timeouts are accurate to one tick (`tick` seconds). Prompts that outlive
+    one turn of the wheel (`tick * slots`) simply stay for extra turns.
+    """
+    def __init__(self, tick: float = 1.0, slots: int = 64):
+        self.tick = tick
+        self.slots = slots
+        self._pending: Dict[PromptKey, Deque[_Prompt]] = {}
+        self._wheel: List[Set[_Prompt]] = [set() for _ in range(slots)]
+        self._cursor = 0
+        self._ticker: Optional["asyncio.Task"] = None
+        self.dispatched = 0
+        self.expired = 0
+
+    # ---------------------------
+    # Prompts
+    # ---------------------------
+    def ask(self, channel_id: int, author_id: int, timeout: float = 30.0,
+            check: Optional[Callable[[Any], bool]] = None) -> "asyncio.Future":
+        """Future for the next message from `author_id` in `channel_id` that passes `check`"""
+        loop = asyncio.get_running_loop()
+        key = (channel_id, author_id)
+        ticks = max(1, math.ceil(timeout / self.tick))
+        prompt = _Prompt(key, loop.create_future(), check, (ticks - 1) // self.slots)
+
+        self._pending.setdefault(key, deque()).append(prompt)
+        self._wheel[(self._cursor + ticks) % self.slots].add(prompt)
+        prompt.future.add_done_callback(lambda _: self._discard(prompt))
+
+        if self._ticker is None or self._ticker.done():
+            self._ticker = loop.create_task(self._run_wheel())
+        return prompt.future
+
+    async def wait_for(self, ctx, timeout: float = 30.0, check: Optional[Callable[[Any], bool]] = None):
+        """Drop-in for `bot.wait_for('message', ...)` scoped to the command's channel and author.
+
+        Raises `asyncio.TimeoutError` when nothing arrives in time.
+        """
+        return await self.ask(ctx.channel.id, ctx.author.id, timeout, check)
+
+    def dispatch(self, message) -> bool:
+        """Hand a message to the oldest matching prompt; returns whether one took it"""
+        queue = self._pending.get((message.channel.id, message.author.id))
+        if not queue:
+            return False
+        for prompt in list(queue):
+            if prompt.future.done():
+                continue
+            if prompt.check is None or prompt.check(message):
+                prompt.future.set_result(message)
+                self.dispatched += 1
+                return True
+        return False
+
+    def _discard(self, prompt: _Prompt) -> None:
+        """Remove a finished prompt from the index; the wheel drops it lazily"""
+        queue = self._pending.get(prompt.key)
+        if queue is None:
+            return
+        try:
+            queue.remove(prompt)
+        except ValueError:
+            pass
+        if not queue:
+            del self._pending[prompt.key]
+
+    # ---------------------------
+    # Timing wheel
+    # ---------------------------
+    def _advance(self) -> int:
+        """Move the wheel one tick and expire the prompts in the new slot"""
+        self._cursor = (self._cursor + 1) % self.slots
+        slot = self._wheel[self._cursor]
+        expired = 0
+        for prompt in list(slot):
+            if prompt.future.done():
+                slot.discard(prompt)
+            elif prompt.rounds > 0:
+                prompt.rounds -= 1
+            else:
+                slot.discard(prompt)
+                prompt.future.set_exception(asyncio.TimeoutError())
+                expired += 1
+        self.expired += expired
+        return expired
+
+    async def _run_wheel(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.tick)
+            self._advance()
+
+    # ---------------------------
+    # Introspection
+    # ---------------------------
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._pending.values())
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "pending": len(self),
+            "dialogs": len(self._pending),
+            "dispatched": self.dispatched,
+            "expired": self.expired,
+        }
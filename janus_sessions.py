@@ -0,0 +1,228 @@
+"""Bounded per-user session storage that spills idle sessions to SQLite."""
+import asyncio
+import copy
+import json
+import sqlite3
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+def _deep_sizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(key) + _deep_sizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_deep_sizeof(item) for item in obj)
+    return size
+
+class SessionStore:
+    """Dict-like store of per-user sessions (plain JSON-able dicts).
+
+    At most `max_resident` sessions stay in memory, and sessions untouched
+    for `ttl` seconds are spilled as well. Spilled sessions are written to a
+    single SQLite file as compressed JSON and loaded back lazily the next
+    time the user is looked up, so they also survive restarts.
+
+    All database work runs on one background thread in submission order, so
+    spills and `flush` never block the caller and a later read always sees
+    earlier writes. Call `preload` from async code before using the mapping
+    interface; a lookup that still misses waits for the read in place.
+    `evict_idle` and `flush` are meant to be called periodically.
+    """
+    def __init__(self, path: str = "stat_sessions.db", max_resident: int = 1000, ttl: float = 1800.0):
+        self.path = path
+        self.max_resident = max_resident
+        self.ttl = ttl
+        self._resident: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()  # least recently used first
+        self._last_used: Dict[int, float] = {}
+        self._written: Dict[int, Dict[str, Any]] = {}  # resident session as last loaded or written
+        self.loads = 0
+        self.spills = 0
+        self.write_errors = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="janus-sessions")
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "user_id INTEGER PRIMARY KEY, data BLOB NOT NULL, updated REAL NOT NULL)"
+        )
+        self._db.commit()
+        # Every user with a row on disk (or queued to get one), so misses never touch the database
+        self._stored = {user_id for (user_id,) in self._db.execute("SELECT user_id FROM sessions")}
+
+    # ---------------------------
+    # Mapping interface
+    # ---------------------------
+    def __contains__(self, user_id: int) -> bool:
+        return self._load(user_id) is not None
+
+    def __getitem__(self, user_id: int) -> Dict[str, Any]:
+        session = self._load(user_id)
+        if session is None:
+            raise KeyError(user_id)
+        return session
+
+    def __setitem__(self, user_id: int, session: Dict[str, Any]) -> None:
+        self._resident[user_id] = session
+        self._touch(user_id)
+        self._evict()
+
+    def __delitem__(self, user_id: int) -> None:
+        found = self._resident.pop(user_id, None) is not None
+        self._last_used.pop(user_id, None)
+        self._written.pop(user_id, None)
+        if user_id in self._stored:
+            self._stored.discard(user_id)
+            self._submit(self._delete_row, user_id)
+        elif not found:
+            raise KeyError(user_id)
+
+    def get(self, user_id: int, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        session = self._load(user_id)
+        return default if session is None else session
+
+    async def preload(self, user_id: int) -> None:
+        """Bring a spilled session back into memory without blocking the event loop"""
+        if user_id in self._resident or user_id not in self._stored:
+            return
+        session = await asyncio.wrap_future(self._executor.submit(self._read_row, user_id))
+        # A command may have created or loaded the session while this one waited
+        if session is not None and user_id not in self._resident:
+            self._admit(user_id, session)
+
+    # ---------------------------
+    # Residency
+    # ---------------------------
+    def _touch(self, user_id: int) -> None:
+        self._resident.move_to_end(user_id)
+        self._last_used[user_id] = time.monotonic()
+
+    def _admit(self, user_id: int, session: Dict[str, Any]) -> None:
+        self.loads += 1
+        self._resident[user_id] = session
+        self._written[user_id] = copy.deepcopy(session)
+        self._touch(user_id)
+        self._evict()
+
+    def _load(self, user_id: int) -> Optional[Dict[str, Any]]:
+        if user_id in self._resident:
+            self._touch(user_id)
+            self._evict()
+            return self._resident[user_id]
+        if user_id not in self._stored:
+            return None
+
+        session = self._executor.submit(self._read_row, user_id).result()
+        if session is None:
+            return None
+        self._admit(user_id, session)
+        return session
+
+    def _evict(self) -> int:
+        """Spill sessions over the size bound or idle past the TTL"""
+        cutoff = time.monotonic() - self.ttl
+        spilled = 0
+        changed = {}
+        while self._resident:
+            user_id = next(iter(self._resident))
+            if len(self._resident) <= self.max_resident and self._last_used[user_id] > cutoff:
+                break
+            session = self._resident.pop(user_id)
+            del self._last_used[user_id]
+            spilled += 1
+            # Unchanged since it was loaded or last written? The row on disk is current
+            if session != self._written.pop(user_id, None):
+                changed[user_id] = session
+        if changed:
+            self._write(changed)
+        self.spills += spilled
+        return spilled
+
+    def evict_idle(self) -> int:
+        """Spill every session idle past the TTL; returns how many were spilled"""
+        return self._evict()
+
+    def flush(self) -> int:
+        """Queue a write of every resident session changed since it was last written; returns how many"""
+        dirty = {
+            user_id: session for user_id, session in self._resident.items()
+            if session != self._written.get(user_id)
+        }
+        if dirty:
+            self._write(dirty)
+        return len(dirty)
+
+    def close(self) -> None:
+        """Write everything still in memory and wait for the database thread to finish"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._db.close()
+
+    # ---------------------------
+    # Database thread
+    # ---------------------------
+    def _submit(self, func, *args) -> None:
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._check_write)
+
+    def _check_write(self, future) -> None:
+        if future.exception() is not None:
+            self.write_errors += 1
+            print(f"Session write failed: {future.exception()}")
+
+    def _write(self, sessions: Dict[int, Dict[str, Any]]) -> None:
+        # Deep copies: sessions nest dicts (named builds) that commands edit in place,
+        # and the database thread serializes the snapshot while they do
+        snapshot = copy.deepcopy(sessions)
+        for user_id, session in snapshot.items():
+            if user_id in self._resident:
+                self._written[user_id] = session
+        self._stored.update(snapshot)
+        self._submit(self._write_rows, snapshot)
+
+    def _write_rows(self, sessions: Dict[int, Dict[str, Any]]) -> None:
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO sessions (user_id, data, updated) VALUES (?, ?, ?)",
+            [
+                (user_id, zlib.compress(json.dumps(session, separators=(",", ":")).encode()), now)
+                for user_id, session in sessions.items()
+            ]
+        )
+        self._db.commit()
+
+    def _read_row(self, user_id: int) -> Optional[Dict[str, Any]]:
+        found = self._db.execute("SELECT data FROM sessions WHERE user_id = ?", (user_id,)).fetchone()
+        return None if found is None else json.loads(zlib.decompress(found[0]))
+
+    def _delete_row(self, user_id: int) -> None:
+        self._db.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
+        self._db.commit()
+
+    # ---------------------------
+    # Introspection
+    # ---------------------------
+    @property
+    def resident_count(self) -> int:
+        return len(self._resident)
+
+    def stored_count(self) -> int:
+        return len(self._stored)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by resident sessions"""
+        return sum(_deep_sizeof(session) for session in self._resident.values())
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "resident": self.resident_count,
+            "max_resident": self.max_resident,
+            "stored": self.stored_count(),
+            "memory_bytes": self.memory_usage(),
+            "loads": self.loads,
+            "spills": self.spills,
+            "write_errors": self.write_errors,
+        }
@@ -0,0 +1,591 @@
+"""Discord-free stat engine for the Janus Penthos stat calculator.
+
+Every function here works on a batch of builds stored column-wise: a mapping
+from parameter name to a sequence (or NumPy array) with one entry per build.
+A single build is simply a batch of one.
+"""
+import base64
+import binascii
+import struct
+import zlib
+
+import numpy as np
+from typing import Dict, Mapping, Sequence
+
+from janus_combat import DEFENSE_FACTOR
+from janus_formulas import FORMULAS
+from janus_monsters import SPECIES, monster_stats_batch
+from janus_progression import ASCENSION_BOOST, MAX_LEVEL, MAX_STATUS_POINTS, PROGRESSION
+
+# ---------------------------
+# Parameters
+# ---------------------------
+# Same order as the `!stats set` parameter list
+STAT_PARAMETERS = (
+    'character_level', 'vit_points', 'def_points', 'str_points', 'int_points', 'agi_points',
+    'flat_weapon_atk', 'atk_percent', 'def_percent', 'hp_percent',
+    'crit_rate_weapon', 'crit_rate_armor', 'crit_rate_substats',
+    'crit_damage_weapon', 'crit_damage_armor', 'crit_damage_substats',
+    'elemental_dmg_bonus', 'speed_boots', 'speed_substats', 'mp_gear', 'mp_substats'
+)
+
+POINT_PARAMETERS = ('vit_points', 'def_points', 'str_points', 'int_points', 'agi_points')
+
+DEFAULT_PARAMETERS = {
+    # Character Progression
+    "character_level": 1,
+    "vit_points": 0,
+    "def_points": 0,
+    "str_points": 0,
+    "int_points": 0,
+    "agi_points": 0,
+
+    # Attack & Defense Stats
+    "flat_weapon_atk": 0.0,
+    "atk_percent": 0.0,
+    "def_percent": 0.0,
+    "hp_percent": 0.0,
+
+    # Critical Stats
+    "crit_rate_weapon": 0.0,
+    "crit_rate_armor": 0.0,
+    "crit_rate_substats": 0.0,
+    "crit_damage_weapon": 0.0,
+    "crit_damage_armor": 0.0,
+    "crit_damage_substats": 0.0,
+
+    # Special Bonuses
+    "elemental_dmg_bonus": 0.0,
+    "speed_boots": 0.0,
+    "speed_substats": 0.0,
+    "mp_gear": 0.0,
+    "mp_substats": 0.0,
+}
+
+BASE_SPEED = 10
+
+STAT_FORMULAS = FORMULAS["calculator"]
+
+# ---------------------------
+# Batch helpers
+# ---------------------------
+def builds_to_columns(builds: Sequence[Mapping[str, float]]) -> Dict[str, np.ndarray]:
+    """Turn a list of per-build parameter dicts into a columnar batch"""
+    return {
+        param: np.array([float(build.get(param, DEFAULT_PARAMETERS[param])) for build in builds])
+        for param in STAT_PARAMETERS
+    }
+
+def row(results: Mapping[str, np.ndarray], index: int = 0) -> Dict[str, float]:
+    """Extract one build from a batch result as plain Python numbers"""
+    return {key: values[index].item() for key, values in results.items()}
+
+def normalize_batch(columns: Mapping[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """Clamp every parameter column into its valid range.
+
+    Missing parameters take their default value and scalars are broadcast
+    against the other columns, so fixed gear can be combined with many
+    status point allocations without copying it per build.
+    """
+    unknown = set(columns) - set(STAT_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+    raw = [np.asarray(columns.get(param, DEFAULT_PARAMETERS[param]), dtype=float) for param in STAT_PARAMETERS]
+    raw = np.broadcast_arrays(*[np.atleast_1d(values) for values in raw])
+    data = dict(zip(STAT_PARAMETERS, raw))
+
+    normalized = {}
+    for param in STAT_PARAMETERS:
+        if param == "character_level":
+            # Whole levels only, so they can index the progression table
+            normalized[param] = np.floor(np.clip(data[param], 1, MAX_LEVEL))
+        elif param in POINT_PARAMETERS:
+            normalized[param] = np.clip(data[param], 0, MAX_STATUS_POINTS)
+        else:
+            normalized[param] = np.maximum(0.0, data[param])
+    return normalized
+
+def normalize_params(params: Mapping[str, float]) -> tuple:
+    """Scalar version of `normalize_batch` for one build, as a hashable tuple in `STAT_PARAMETERS` order"""
+    values = []
+    for param in STAT_PARAMETERS:
+        value = float(params.get(param, DEFAULT_PARAMETERS[param]))
+        if param == "character_level":
+            value = float(int(max(1, min(value, MAX_LEVEL))))
+        elif param in POINT_PARAMETERS:
+            value = max(0.0, min(value, MAX_STATUS_POINTS))
+        else:
+            value = max(0.0, value)
+        values.append(value)
+    return tuple(values)
+
+# ---------------------------
+# Stat engine
+# ---------------------------
+def compute_stats_batch(columns: Mapping[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """Calculate every derived stat for a batch of builds.
+
+    Returns the normalized inputs alongside the derived stats, all as NumPy
+    arrays of the batch size. Builds that allocate more status points than
+    their level allows are flagged with `valid == False` rather than raising,
+    so one bad row doesn't sink a whole comparison.
+    """
+    data = normalize_batch(columns)
+    results = dict(data)
+
+    level = data["character_level"]
+    vit = data["vit_points"]
+    defense = data["def_points"]
+    strength = data["str_points"]
+    intelligence = data["int_points"]
+    agility = data["agi_points"]
+
+    # Level-derived values come straight from the shared progression table
+    level_index = level.astype(int)
+
+    # Available and allocated SP
+    results["sp_available"] = PROGRESSION.status_points[level_index].astype(float)
+    results["sp_allocated"] = vit + defense + strength + intelligence + agility
+    results["valid"] = results["sp_allocated"] <= results["sp_available"]
+
+    # Base stats from level
+    results["base_hp"] = PROGRESSION.raw_hp[level_index].astype(float)
+    results["base_mp"] = PROGRESSION.raw_mp[level_index].astype(float)
+    results["base_atk"] = PROGRESSION.raw_atk[level_index].astype(float)
+    results["base_def"] = PROGRESSION.raw_def[level_index].astype(float)
+    results["base_speed"] = np.full_like(level, BASE_SPEED)
+
+    # Ascension boost, applied to everything except speed
+    results["ascension"] = PROGRESSION.ascension[level_index].astype(float)
+    results["ascension_boost"] = results["ascension"] * ASCENSION_BOOST
+    ascension_multiplier = PROGRESSION.ascension_multiplier[level_index]
+
+    # Everything else comes from the shared formula spec
+    results.update(STAT_FORMULAS.batch(
+        base_hp=results["base_hp"],
+        base_mp=results["base_mp"],
+        base_atk=results["base_atk"],
+        base_def=results["base_def"],
+        base_speed=results["base_speed"],
+        ascension_multiplier=ascension_multiplier,
+        **{param: data[param] for param in STAT_FORMULAS.inputs if param in data}
+    ))
+
+    return results
+
+def compute_stats(params: Mapping[str, float]) -> Dict[str, float]:
+    """Calculate one build; a thin wrapper around `compute_stats_batch`"""
+    return row(compute_stats_batch({key: params[key] for key in STAT_PARAMETERS if key in params}))
+
+# Stats the status points feed, in `!stats calculate` order
+EFFECTIVE_STATS = ("effective_hp", "effective_mp", "effective_atk", "effective_def", "effective_speed")
+
+def point_contributions(params: Mapping[str, float]) -> Dict[str, Dict[str, float]]:
+    """What each status point stat adds to the effective stats of one build.
+
+    Read off the engine by recomputing the build with each point stat moved
+    to 0 (or to 1 if it is already 0), all in one batch, so the figures
+    always follow stat_formulas.json. Returns `{point parameter: {effective
+    stat: amount}}` for every stat the parameter feeds, even at 0 points.
+    """
+    inputs = {key: params[key] for key in STAT_PARAMETERS if key in params}
+    current = normalize_params(inputs)
+    points = {param: current[STAT_PARAMETERS.index(param)] for param in POINT_PARAMETERS}
+    moved = {param: 0.0 if value else 1.0 for param, value in points.items()}
+    probe = dict(inputs)
+    for index, param in enumerate(POINT_PARAMETERS):
+        values = np.full(len(POINT_PARAMETERS) + 1, points[param])
+        values[index + 1] = moved[param]
+        probe[param] = values
+    results = compute_stats_batch(probe)
+
+    contributions = {}
+    for index, param in enumerate(POINT_PARAMETERS):
+        contributions[param] = {}
+        for stat in EFFECTIVE_STATS:
+            per_point = (results[stat][0] - results[stat][index + 1]) / (points[param] - moved[param])
+            if per_point:
+                contributions[param][stat] = float(per_point * points[param])
+    return contributions
+
+# ---------------------------
+# Status point optimizer
+# ---------------------------
+OPTIMIZE_OBJECTIVES = ("damage", "ehp", "mix")
+
+def ehp(results: Mapping[str, np.ndarray]) -> np.ndarray:
+    """HP weighted by defense: every 100 DEF counts as another full HP bar"""
+    return results["final_hp"] * (1 + results["final_def"] / 100)
+
+def optimize_allocation(params: Mapping[str, float], objective: str = "damage",
+                        damage_weight: float = 0.5) -> Dict[str, float]:
+    """Find the status point allocation that maximizes `objective` under the current gear.
+
+    Every derived stat is linear in the status points, which lets us prune
+    almost the whole search space instead of brute forcing it:
+
+    * AGI only feeds speed and STR gives the same ATK as INT without the MP,
+      so both are dominated and stay at 0.
+    * Every objective is non-decreasing in each point, so all available
+      points get spent.
+    * What's left is a split between INT (damage) and VIT/DEF (survival).
+      For a fixed survival budget, EHP is a concave quadratic in VIT, so its
+      best VIT/DEF split has a closed form.
+
+    That leaves one candidate per INT total (plus its rounding neighbour),
+    all evaluated in a single `compute_stats_batch` call.
+    """
+    if objective not in OPTIMIZE_OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Use one of: {', '.join(OPTIMIZE_OBJECTIVES)}")
+    damage_weight = min(1.0, max(0.0, damage_weight))
+
+    gear = {key: params[key] for key in STAT_PARAMETERS if key in params and key not in POINT_PARAMETERS}
+    zero = {param: 0.0 for param in POINT_PARAMETERS}
+
+    # Slopes of the linear terms, read off the engine with one unit of each point
+    probe = compute_stats_batch(dict(
+        gear,
+        vit_points=[0, 1, 0],
+        def_points=[0, 0, 1],
+        int_points=[0, 0, 0],
+    ))
+    budget = int(probe["sp_available"][0])
+    hp_0, hp_slope = probe["final_hp"][0], probe["final_hp"][1] - probe["final_hp"][0]
+    def_0, def_slope = probe["final_def"][0], probe["final_def"][2] - probe["final_def"][0]
+
+    # Survival budget t = budget - INT, best VIT for each t (rounded both ways)
+    survival = np.arange(budget + 1, dtype=float)
+    best_vit = (hp_slope * (100 + def_0 + def_slope * survival) - def_slope * hp_0) / (2 * hp_slope * def_slope)
+    vit = np.concatenate([np.floor(best_vit), np.ceil(best_vit)])
+    survival = np.concatenate([survival, survival])
+    vit = np.clip(vit, 0, survival)
+
+    candidates = compute_stats_batch(dict(
+        gear,
+        vit_points=vit,
+        def_points=survival - vit,
+        int_points=budget - survival,
+        str_points=0.0,
+        agi_points=0.0,
+    ))
+
+    if objective == "damage":
+        score = candidates["total_damage"]
+    elif objective == "ehp":
+        score = ehp(candidates)
+    else:
+        # Mix of both, each relative to the build with no points spent
+        baseline = compute_stats_batch(dict(gear, **zero))
+        score = (
+            damage_weight * candidates["total_damage"] / baseline["total_damage"][0] +
+            (1 - damage_weight) * ehp(candidates) / ehp(baseline)[0]
+        )
+
+    best = row(candidates, int(np.argmax(score)))
+    best["ehp"] = best["final_hp"] * (1 + best["final_def"] / 100)
+    best["score"] = float(np.max(score))
+    return best
+
+# ---------------------------
+# Gear substat optimizer
+# ---------------------------
+# Substat -> (calculator parameter, parameter units per 1% of the substat)
+SUBSTATS = {
+    "crit_rate": ("crit_rate_substats", 1.0),
+    "crit_damage": ("crit_damage_substats", 1.0),
+    "atk_percent": ("atk_percent", 0.01),
+    "elemental": ("elemental_dmg_bonus", 0.01),
+}
+
+# Budget cost of 1% of each substat
+DEFAULT_SUBSTAT_COSTS = {
+    "crit_rate": 2.0,
+    "crit_damage": 1.0,
+    "atk_percent": 1.5,
+    "elemental": 1.5,
+}
+
+MAX_CRIT_RATE = 100.0
+
+def _budget_splits(steps: int) -> np.ndarray:
+    """Every way to hand out at most `steps` budget steps across the substats, one row each"""
+    grid = np.arange(steps + 1)
+    a, b, c = np.meshgrid(grid, grid, grid, indexing="ij")
+    a, b, c = a.ravel(), b.ravel(), c.ravel()
+    keep = a + b + c <= steps
+    a, b, c = a[keep], b[keep], c[keep]
+
+    # The last substat takes every remaining amount from 0 up to the leftover
+    room = steps - (a + b + c) + 1
+    starts = np.repeat(np.cumsum(room) - room, room)
+    d = np.arange(room.sum()) - starts
+    return np.stack([np.repeat(a, room), np.repeat(b, room), np.repeat(c, room), d], axis=1)
+
+def optimize_substats(params: Mapping[str, float], budget: float,
+                      costs: Mapping[str, float] = None, steps: int = 20) -> Dict[str, object]:
+    """Split a substat budget across crit rate, crit damage, ATK% and elemental DMG.
+
+    The budget is cut into `steps` equal steps and every split of at most
+    `steps` steps is evaluated on top of the current build in one
+    `compute_stats_batch` pass. Splits that push crit rate past 100% are
+    discarded since the extra rate is wasted.
+
+    Returns the best full-budget split and the Pareto frontier of damage
+    against budget spent, i.e. the best split at every spending level.
+    """
+    costs = dict(DEFAULT_SUBSTAT_COSTS, **(costs or {}))
+    if budget <= 0:
+        raise ValueError("Budget must be positive")
+    if any(costs[name] <= 0 for name in SUBSTATS):
+        raise ValueError("Substat costs must be positive")
+
+    names = list(SUBSTATS)
+    splits = _budget_splits(steps)
+    spent = splits * (budget / steps)
+    gains = spent / np.array([costs[name] for name in names])
+
+    columns = {key: params[key] for key in STAT_PARAMETERS if key in params}
+    for index, name in enumerate(names):
+        param, unit = SUBSTATS[name]
+        columns[param] = columns.get(param, DEFAULT_PARAMETERS[param]) + gains[:, index] * unit
+    candidates = compute_stats_batch(columns)
+
+    score = candidates["total_damage"].copy()
+    wasted = (candidates["final_crit_rate"] > MAX_CRIT_RATE) & (gains[:, 0] > 0)
+    score[wasted] = -np.inf
+
+    # Best split for every number of steps spent
+    used = splits.sum(axis=1)
+    order = np.lexsort((-score, used))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = used[order][1:] != used[order][:-1]
+    frontier_rows = order[first]
+
+    def describe(index):
+        return {
+            "spent": float(spent[index].sum()),
+            "split": {name: float(spent[index, i]) for i, name in enumerate(names)},
+            "gains": {name: float(gains[index, i]) for i, name in enumerate(names)},
+            "total_damage": float(candidates["total_damage"][index]),
+            "final_crit_rate": float(candidates["final_crit_rate"][index]),
+            "final_crit_dmg": float(candidates["final_crit_dmg"][index]),
+        }
+
+    frontier = [describe(index) for index in frontier_rows]
+    best = frontier[-1]
+    best["baseline_damage"] = frontier[0]["total_damage"]
+    return {"best": best, "frontier": frontier, "candidates": len(splits)}
+
+# ---------------------------
+# Monte Carlo damage distribution
+# ---------------------------
+MAX_SIMULATED_HITS = 10_000_000
+SIMULATION_CHUNK = 1 << 18
+
+def simulate_damage(params: Mapping[str, float], hits: int, hp_threshold: float = None,
+                    burst: int = 1, seed: int = None) -> Dict[str, float]:
+    """Sample crit outcomes for `hits` hits, grouped into bursts of `burst` consecutive hits.
+
+    A burst's damage only depends on how many of its hits crit, so each burst
+    is one binomial draw and the samples are folded into a histogram of crit
+    counts chunk by chunk. Memory stays at O(burst) however many hits are
+    simulated, and percentiles and the kill probability come straight from
+    the histogram.
+    """
+    if not 1 <= hits <= MAX_SIMULATED_HITS:
+        raise ValueError(f"Hits must be between 1 and {MAX_SIMULATED_HITS:,}")
+    if not 1 <= burst <= hits:
+        raise ValueError("Burst size must be between 1 and the number of hits")
+
+    stats = compute_stats(params)
+    crit_chance = min(1.0, stats["final_crit_rate"] / 100)
+    normal_hit = stats["final_atk"] * (1 + stats["elemental_dmg_bonus"])
+    crit_extra = normal_hit * stats["final_crit_dmg"] / 100
+
+    rng = np.random.default_rng(seed)
+    bursts = hits // burst
+    crit_counts = np.zeros(burst + 1, dtype=np.int64)
+    remaining = bursts
+    while remaining:
+        size = min(remaining, SIMULATION_CHUNK)
+        crit_counts += np.bincount(rng.binomial(burst, crit_chance, size=size), minlength=burst + 1)
+        remaining -= size
+
+    damage = normal_hit * burst + np.arange(burst + 1) * crit_extra
+    cumulative = np.cumsum(crit_counts) / bursts
+
+    def percentile(q):
+        return float(damage[np.searchsorted(cumulative, q / 100)])
+
+    result = {
+        "hits": bursts * burst,
+        "bursts": bursts,
+        "burst": burst,
+        "crit_chance": crit_chance,
+        "normal_hit": normal_hit,
+        "crit_hit": normal_hit + crit_extra,
+        "mean": float(crit_counts @ damage / bursts),
+        "expected": stats["total_damage"] * burst,
+        "p50": percentile(50),
+        "p90": percentile(90),
+        "p99": percentile(99),
+        "crit_rate_observed": float(crit_counts @ np.arange(burst + 1) / (bursts * burst)),
+    }
+    if hp_threshold is not None:
+        result["hp_threshold"] = hp_threshold
+        result["kill_chance"] = float(crit_counts[damage >= hp_threshold].sum() / bursts)
+    return result
+
+# ---------------------------
+# Marginal values
+# ---------------------------
+MARGINAL_TARGETS = ("total_damage", "final_hp", "final_def")
+
+# Parameters stored as fractions (0.25 = 25%) are reported per 1%, everything else per point
+FRACTION_PARAMETERS = ("atk_percent", "def_percent", "hp_percent", "elemental_dmg_bonus")
+
+def parameter_step(param: str) -> float:
+    return 0.01 if param in FRACTION_PARAMETERS else 1.0
+
+def marginal_values_batch(columns: Mapping[str, Sequence[float]]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Gain in total_damage, final_hp and final_def from one more step of every input.
+
+    A step is 1 point, or 1% for fraction parameters. The gains are read off
+    the engine itself, so they follow stat_formulas.json: every parameter
+    gets a copy of the batch bumped by one step, and all copies go through a
+    single `compute_stats_batch` call. Every formula is linear in each single
+    input, so the difference is the exact derivative; level is discrete, so
+    its entry is the gain from one more level. Inputs pinned at their upper
+    clamp get 0.
+    """
+    base = compute_stats_batch(columns)
+    size = len(base["character_level"])
+    probe = {param: np.tile(base[param], len(STAT_PARAMETERS)) for param in STAT_PARAMETERS}
+    for index, param in enumerate(STAT_PARAMETERS):
+        probe[param][index * size:(index + 1) * size] += parameter_step(param)
+    bumped = compute_stats_batch(probe)
+
+    return {
+        target: {
+            param: bumped[target][index * size:(index + 1) * size] - base[target]
+            for index, param in enumerate(STAT_PARAMETERS)
+        }
+        for target in MARGINAL_TARGETS
+    }
+
+def marginal_values(params: Mapping[str, float]) -> Dict[str, list]:
+    """Marginal value of every input for one build, ranked best first per target.
+
+    Returns `{target: [(param, gain per step), ...]}`; this is the function
+    other cogs should call.
+    """
+    derivatives = marginal_values_batch({key: params[key] for key in STAT_PARAMETERS if key in params})
+    return {
+        target: sorted(
+            ((param, float(values[0])) for param, values in derivatives[target].items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        for target in MARGINAL_TARGETS
+    }
+
+# ---------------------------
+# Build codes
+# ---------------------------
+BUILD_CODE_VERSION = 1
+# version, level, VIT/DEF/STR/INT/AGI, bitmask of the non-zero gear values that follow
+_CODE_HEADER = struct.Struct(">BB5HH")
+_CODE_CHECKSUM = struct.Struct(">H")
+GEAR_PARAMETERS = tuple(param for param in STAT_PARAMETERS if param != "character_level" and param not in POINT_PARAMETERS)
+
+def encode_build(params: Mapping[str, float]) -> str:
+    """Pack a build into a short, URL-safe base64 code.
+
+    Level and status points are stored as integers and only non-zero gear
+    values are stored (as float32), followed by a 16-bit checksum.
+    """
+    values = dict(zip(STAT_PARAMETERS, normalize_params(params)))
+    mask = 0
+    gear = []
+    for bit, param in enumerate(GEAR_PARAMETERS):
+        if values[param]:
+            mask |= 1 << bit
+            gear.append(values[param])
+
+    payload = _CODE_HEADER.pack(
+        BUILD_CODE_VERSION,
+        int(values["character_level"]),
+        *(int(round(values[param])) for param in POINT_PARAMETERS),
+        mask
+    ) + struct.pack(f">{len(gear)}f", *gear)
+    payload += _CODE_CHECKSUM.pack(zlib.crc32(payload) & 0xFFFF)
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_build(code: str) -> Dict[str, float]:
+    """Unpack a code from `encode_build`; raises ValueError if it is malformed"""
+    try:
+        payload = base64.urlsafe_b64decode(code.strip() + "=" * (-len(code.strip()) % 4))
+    except (ValueError, binascii.Error):
+        raise ValueError("Build code is not valid base64") from None
+
+    if len(payload) < _CODE_HEADER.size + _CODE_CHECKSUM.size:
+        raise ValueError("Build code is too short")
+    body, (checksum,) = payload[:-_CODE_CHECKSUM.size], _CODE_CHECKSUM.unpack(payload[-_CODE_CHECKSUM.size:])
+    if zlib.crc32(body) & 0xFFFF != checksum:
+        raise ValueError("Build code checksum doesn't match (typo?)")
+
+    version, level, *points, mask = _CODE_HEADER.unpack(body[:_CODE_HEADER.size])
+    if version != BUILD_CODE_VERSION:
+        raise ValueError(f"Unsupported build code version {version}")
+
+    present = [param for bit, param in enumerate(GEAR_PARAMETERS) if mask & (1 << bit)]
+    gear_bytes = body[_CODE_HEADER.size:]
+    if len(gear_bytes) != 4 * len(present):
+        raise ValueError("Build code is corrupted")
+
+    build = dict(DEFAULT_PARAMETERS, character_level=level)
+    build.update(zip(POINT_PARAMETERS, points))
+    for param, value in zip(present, struct.unpack(f">{len(present)}f", gear_bytes)):
+        build[param] = round(value, 4)  # undo float32 noise
+    return build
+
+# ---------------------------
+# Time to kill
+# ---------------------------
+# Same defense scaling as `Combat.do_player_turn` / `do_monster_turn` in the encounter bot
+COMBAT_DEFENSE_FACTOR = DEFENSE_FACTOR
+
+def time_to_kill(params: Mapping[str, float], species: Sequence[str] = SPECIES,
+                 levels: Sequence[int] = None) -> Dict[str, np.ndarray]:
+    """Expected turns to kill / be killed by every species at every monster level.
+
+    Uses the encounter bot's basic attack: `max(1, atk - defense * 0.7)` each
+    way, with the +-10% damage roll averaged out. Monsters that sometimes
+    skip their attack (archers, thieves) take proportionally longer to kill
+    you. The player moves first, so a fight is won when `turns_to_kill` is
+    no more than `turns_to_die`. Arrays have shape (len(species), len(levels)).
+    """
+    levels = np.arange(1, MAX_LEVEL + 1) if levels is None else np.asarray(levels)
+    stats = compute_stats(params)
+    monsters = monster_stats_batch(species, levels)
+
+    player_damage = np.maximum(1.0, stats["final_atk"] - monsters["defense"] * COMBAT_DEFENSE_FACTOR)
+    monster_damage = np.maximum(1.0, monsters["atk"] - stats["final_def"] * COMBAT_DEFENSE_FACTOR)
+    turns_to_kill = np.ceil(monsters["max_hp"] / player_damage)
+    turns_to_die = np.ceil(stats["final_hp"] / monster_damage) / monsters["hit_chance"]
+
+    wins = turns_to_kill <= turns_to_die
+    # Highest monster level (in `levels`) beaten by every level up to it; 0 if the first is lost
+    streak = np.cumprod(wins, axis=1).astype(bool)
+    max_level = np.where(streak.any(axis=1), levels[np.maximum(streak.sum(axis=1) - 1, 0)], 0)
+
+    return {
+        "species": tuple(species),
+        "levels": levels,
+        "turns_to_kill": turns_to_kill,
+        "turns_to_die": turns_to_die,
+        "wins": wins,
+        "max_level": max_level,
+        "valid": stats["valid"],
+    }
@@ -1,11 +1,15 @@
 import discord
 from discord.ext import commands
 import random
-import json
-import os
 from enum import Enum, auto
 from typing import List, Dict, Tuple, Optional, Any
 
+from janus_combat import (
+    DAMAGE_ROLL, DEFAULT_SKILLS, FLEE_CHANCE, REACTION_MULTIPLIER, attack_base, heal_amount, rolled, skill_base
+)
+from janus_monsters import ENCOUNTER_LEVEL_SPREAD, encounter_level, encounter_weights, get_species, roll_loot_batch
+from janus_persistence import writer
+
 # ---------------------------
 # Enums and Base Classes (keep these the same)
 # ---------------------------
@@ -149,11 +153,9 @@ class Character:
         self.inventory = Inventory()
         self.status_effects: List[StatusEffect] = []
         self.skills = [
-            Skill("Power Slap", 1.5, mp_cost=2, description="Basic attack"),
-            Skill("Fireball", 1.8, Element.FIRE, mp_cost=10, description="Fire damage"),
-            Skill("Heal", 0.5, healing=True, mp_cost=15, description="Restores HP"),
-            Skill("Ice Shard", 1.6, Element.ICE, mp_cost=8, description="Ice damage"),
-            Skill("Water Blast", 1.7, Element.WATER, mp_cost=9, description="Water damage")
+            Skill(spec.name, spec.power, Element[spec.element], healing=spec.healing,
+                  mp_cost=spec.mp_cost, description=spec.description)
+            for spec in DEFAULT_SKILLS
         ]
         self.in_combat = False
         self.current_combat = None
@@ -215,184 +217,36 @@ class Monster:
     def __init__(self, name: str, level: int):
         self.name = name
         self.level = level
+        self.species = get_species(name)  # registry entry from monsters.json
         self.set_stats()
         self.exp_reward = self.calculate_exp_reward()
         self.status_effects: List[StatusEffect] = []
         
     def set_stats(self):
         """Set monster stats based on type and level"""
-        if "Slime" in self.name:
-            self.max_hp = 50 + (self.level * 20)
-            self.atk = 5 + (self.level * 2)
-            self.defense = 3 + self.level
-            self.speed = 5 + self.level
-            self.element = Element.NONE
-        elif "Jelly" in self.name:
-            self.max_hp = 70 + (self.level * 25)
-            self.atk = 8 + (self.level * 3)
-            self.defense = 5 + self.level
-            self.speed = 7 + self.level
-            self.element = Element.NONE
-        elif "Goblin" in self.name:
-            self.max_hp = 100 + (self.level * 30)
-            self.atk = 15 + (self.level * 4)
-            self.defense = 8 + self.level
-            self.speed = 10 + self.level
-            self.element = Element.NONE
+        stats = self.species.formulas(level=self.level)
+        self.max_hp = stats["max_hp"]
+        self.atk = stats["atk"]
+        self.defense = stats["defense"]
+        self.speed = stats["speed"]
+        self.element = Element.NONE
             
         self.current_hp = self.max_hp
     
     def calculate_exp_reward(self) -> int:
         """Calculate EXP based on monster type and level"""
-        if "Slime" in self.name:
-            if self.level == 1: return 10
-            if self.level == 2: return 20
-            if self.level == 3: return 25
-        elif "Acid Slime" in self.name or "Poison Slime" in self.name:
-            if self.level == 2: return 15
-            if self.level == 3: return 25
-        elif "Pyro Slime" in self.name or "Cryo Slime" in self.name or "Hydro Slime" in self.name or "Geo Slime" in self.name or "Dendro Slime" in self.name:
-            if self.level == 2: return 15
-            if self.level == 3: return 25
-        elif "Jelly" in self.name and not any(x in self.name for x in ["Lava", "Sea", "Forest", "Desert", "Swamp", "Iron", "Silver", "Golden", "Diamond", "Lapis", "Emerald"]):
-            if self.level == 2: return 15
-            if self.level == 3: return 25
-        elif "Lava Jelly" in self.name or "Sea Jelly" in self.name or "Forest Jelly" in self.name or "Desert Jelly" in self.name or "Swamp Jelly" in self.name:
-            if self.level == 3: return 20
-            if self.level == 4: return 30
-        elif "Iron Jelly" in self.name or "Silver Jelly" in self.name or "Golden Jelly" in self.name or "Diamond Jelly" in self.name or "Lapis Jelly" in self.name or "Emerald Jelly" in self.name:
-            if self.level == 4: return 30
-            if self.level == 5: return 40
-        elif "Goblin" in self.name:
-            if self.level == 3: return 20
-            if self.level == 4: return 25
-            if self.level == 5: return 30
-            if self.level == 6: return 35
-            if self.level == 7: return 40
-            if self.level == 8: return 45
-            if self.level == 9: return 50
+        return self.species.exp[self.level]
     
     def roll_for_loot(self) -> Dict[str, int]:
         """Roll for loot based on monster type and level"""
-        drops = {}
-        
-        # All slimes drop monster essence
-        if "Slime" in self.name:
-            # Monster essence drops
-            if random.random() <= 0.5:
-                if self.level in [1, 2]:
-                    drops["Monster Essence"] = random.randint(1, 6)
-                else:
-                    drops["Monster Essence"] = random.randint(1, 10)
-            
-            # Type-specific drops
-            if random.random() <= 0.5:
-                if self.name == "Slime":
-                    if self.level == 1:
-                        drops["Slime Essence"] = random.randint(1, 3)
-                    else:
-                        drops["Slime Essence"] = random.randint(1, 6)
-                elif self.name == "Acid Slime":
-                    drops["Acidic Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Poison Slime":
-                    drops["Toxic Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Pyro Slime":
-                    drops["Pyro Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Cryo Slime":
-                    drops["Cryo Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Hydro Slime":
-                    drops["Hydro Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Geo Slime":
-                    drops["Geo Slime Essence"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Dendro Slime":
-                    drops["Dendro Seed"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-        
-        # Jelly drops
-        elif "Jelly" in self.name:
-            # Monster essence drops
-            if random.random() <= 0.5:
-                if self.level in [2, 3]:
-                    drops["Monster Essence"] = random.randint(1, 6)
-                else:
-                    drops["Monster Essence"] = random.randint(1, 10)
-            
-            # Type-specific drops
-            if random.random() <= 0.5:
-                if self.name == "Jelly":
-                    drops["Pale Gelatin"] = random.randint(1, 3) if self.level == 2 else random.randint(1, 6)
-                elif self.name == "Lava Jelly":
-                    drops["Red Gelatin"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                elif self.name == "Sea Jelly":
-                    drops["Blue Gelatin"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                elif self.name == "Forest Jelly":
-                    drops["Green Gelatin"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                elif self.name == "Desert Jelly":
-                    drops["Orange Gelatin"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                elif self.name == "Swamp Jelly":
-                    drops["Purple Gelatin"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                elif self.name == "Iron Jelly":
-                    drops["Iron Jelly's Fluid"] = random.randint(1, 3) if self.level == 4 else random.randint(1, 6)
-                elif self.name == "Silver Jelly":
-                    drops["Silver Jelly's Fluid"] = random.randint(1, 3) if self.level == 4 else random.randint(1, 6)
-                elif self.name == "Golden Jelly":
-                    drops["Golden Jelly's Fluid"] = random.randint(1, 3) if self.level == 4 else random.randint(1, 6)
-                elif self.name == "Diamond Jelly":
-                    drops["Diamond Jelly's Fluid"] = 1 if self.level == 4 else random.randint(1, 2)
-                elif self.name == "Lapis Jelly":
-                    drops["Lapis Jelly's Fluid"] = 1 if self.level == 4 else random.randint(1, 2)
-                elif self.name == "Emerald Jelly":
-                    drops["Emerald Jelly's Fluid"] = 1 if self.level == 4 else random.randint(1, 2)
-        
-        # Goblin drops
-        elif "Goblin" in self.name:
-            # Common drops
-            if "Tank" in self.name or "Warrior" in self.name or "Archer" in self.name or "Thief" in self.name:
-                if random.random() <= 0.3:
-                    drops["Goblin Bones"] = random.randint(1, 6)
-                if random.random() <= 0.3:
-                    drops["Monster Essence"] = random.randint(1, 10)
-                if random.random() <= 0.25:
-                    drops["Goblin Armor"] = 1
-                
-                # Specialized drops
-                if "Tank" in self.name:
-                    if random.random() <= 0.06:
-                        drops["Goblin Shield"] = 1
-                    if random.random() <= 0.06:
-                        drops["Goblin Mace"] = 1
-                elif "Warrior" in self.name:
-                    if random.random() <= 0.06:
-                        drops["Goblin Sword"] = 1
-                    if random.random() <= 0.06:
-                        drops["Goblin Spear"] = 1
-                elif "Archer" in self.name:
-                    if random.random() <= 0.06:
-                        drops["Goblin Bow"] = 1
-                    if random.random() <= 0.06:
-                        drops["Goblin Arrow"] = 1
-                elif "Thief" in self.name:
-                    if random.random() <= 0.06:
-                        drops["Goblin Knife"] = 1
-                    if random.random() <= 0.06:
-                        drops["Goblin Coin Pouch"] = 1
-            else:
-                # Regular goblins
-                if random.random() <= 0.49:
-                    drops["Goblin Bones"] = random.randint(1, 3) if self.level == 3 else random.randint(1, 6)
-                if random.random() <= 0.49:
-                    drops["Monster Essence"] = random.randint(1, 6) if self.level == 3 else random.randint(1, 10)
-            
-            # Rare drop (Bold Gaze)
-            if random.random() <= 0.02 if self.level in [3,4] else 0.03 if self.level in [5,6,7] else 0.04:
-                drops["Bold Gaze"] = 1
-        
-        return drops
+        return roll_loot_batch(self.name, self.level, 1)
 
 # ---------------------------
 # Game Systems (modified for Discord)
 # ---------------------------
 def create_monster(name: str, level: int) -> Monster:
-    # ... (keep this function the same, it already returns a Monster instance)
+    """Monster of a species registered in monsters.json (ValueError for unknown names)"""
+    return Monster(name, level)
 
 class Combat:
     def __init__(self, character: Character, monster: Monster):
@@ -422,19 +276,18 @@ class Combat:
             self.add_message(f"{self.character.name} uses {skill.name}!")
             
             if skill.healing:
-                heal_amount = max(1, round(self.character.max_hp * skill.power_multiplier))
+                healed = int(heal_amount(self.character.max_hp, skill.power_multiplier))
                 self.character.current_hp = min(self.character.max_hp, 
-                                              self.character.current_hp + heal_amount)
-                return False, f"{self.character.name} heals for {heal_amount} HP!"
+                                              self.character.current_hp + healed)
+                return False, f"{self.character.name} heals for {healed} HP!"
             else:
-                base_damage = max(1, (self.character.total_atk * skill.power_multiplier) - 
-                              (self.monster.defense * 0.5))
-                damage = round(base_damage * random.uniform(0.9, 1.1))
+                base_damage = skill_base(self.character.total_atk, skill.power_multiplier, self.monster.defense)
+                damage = int(rolled(base_damage, random.uniform(*DAMAGE_ROLL)))
                 
                 # Elemental reactions
                 if (skill.element in [Element.ICE, Element.LIGHTNING] and 
                     any(isinstance(s, WetStatus) for s in self.monster.status_effects)):
-                    damage = round(damage * 1.5)
+                    damage = round(damage * REACTION_MULTIPLIER)
                     self.add_message("Elemental reaction! Extra damage!")
                 
                 if skill.element == Element.FIRE:
@@ -464,8 +317,8 @@ class Combat:
         self.clear_messages()
         
         if action == "attack":
-            base_damage = max(1, self.character.total_atk - (self.monster.defense * 0.7))
-            damage = round(base_damage * random.uniform(0.9, 1.1))
+            base_damage = attack_base(self.character.total_atk, self.monster.defense)
+            damage = int(rolled(base_damage, random.uniform(*DAMAGE_ROLL)))
             self.monster.current_hp -= damage
             self.add_message(f"{self.character.name} attacks for {damage} damage!")
             
@@ -479,7 +332,7 @@ class Combat:
             return self.use_skill(skill_index)
         
         elif action == "flee":
-            if random.random() < 0.5:
+            if random.random() < FLEE_CHANCE:
                 self.add_message(f"{self.character.name} successfully fled from battle!")
                 return True, self.get_messages()
             self.add_message(f"{self.character.name} failed to flee!")
@@ -509,11 +362,11 @@ class Combat:
                 self.add_message(f"{monster.name} spawns a {new_monster.name}!")
             
             # Monster attack
-            base_damage = max(1, monster.atk - (self.character.total_def * 0.7))
-            damage = round(base_damage * random.uniform(0.9, 1.1))
+            base_damage = attack_base(monster.atk, self.character.total_def)
+            damage = int(rolled(base_damage, random.uniform(*DAMAGE_ROLL)))
             
             # Check for dodge chance
-            if ("Archer" in monster.name or "Thief" in monster.name) and random.random() < 0.3:
+            if random.random() < monster.species.miss_chance:
                 self.add_message(f"{monster.name} dodges your attack!")
                 continue
             
@@ -559,18 +412,22 @@ class Combat:
         self.add_message(f"Gained {total_exp} EXP!")
         self.character.add_exp(total_exp)
         
-        all_drops = []
+        # Roll every (species, level) group of kills in one batch
+        kills: Dict[Tuple[str, int], int] = {}
         for m in [self.monster] + self.additional_monsters:
             if m.current_hp <= 0:
-                drops = m.roll_for_loot()
-                if drops:
-                    all_drops.extend(drops)
+                kills[(m.name, m.level)] = kills.get((m.name, m.level), 0) + 1
+        
+        all_drops: Dict[str, int] = {}
+        for (name, level), count in kills.items():
+            for item, quantity in roll_loot_batch(name, level, count).items():
+                all_drops[item] = all_drops.get(item, 0) + quantity
         
         if all_drops:
             self.add_message("Loot Dropped:")
-            for item, rarity in all_drops:
-                self.add_message(f"- {item} ({rarity})")
-                self.character.inventory.add_item(item)
+            for item, quantity in all_drops.items():
+                self.add_message(f"- {quantity}x {item}")
+                self.character.inventory.add_item(item, quantity)
         else:
             self.add_message("No loot dropped.")
         
@@ -636,29 +493,7 @@ class JanusPenthos(commands.Bot):
             await ctx.send("You're already in combat! Use `!attack`, `!skill`, or `!flee`.")
             return
         
-        monster_weights = [
-            ("Slime", 30),
-            ("Pyro Slime", 15),
-            ("Hydro Slime", 15),
-            ("Geo Slime", 15),
-            ("Dendro Slime", 10),
-            ("Cryo Slime", 10),
-            ("Jelly", 5),
-            ("Forest Jelly", 3),
-            ("Goblin", 20),
-            ("Goblin Tank", 10),
-            ("Goblin Warrior", 10),
-            ("Goblin Archer", 10),
-            ("Goblin Thief", 10),
-            ("Goblin Shaman", 5)
-            
-        ]
-        
-        available_monsters = []
-        for name, weight in monster_weights:
-            if name.startswith("Goblin") and char.level < 5:
-                continue
-            available_monsters.append((name, weight))
+        available_monsters = encounter_weights(char.level)
         
         if not available_monsters:
             await ctx.send("No monsters available for encounter at your level!")
@@ -669,7 +504,7 @@ class JanusPenthos(commands.Bot):
             weights=[m[1] for m in available_monsters]
         )[0]
         
-        monster_level = max(1, min(char.level + random.randint(-2, 2), 100)
+        monster_level = encounter_level(char.level, random.randint(-ENCOUNTER_LEVEL_SPREAD, ENCOUNTER_LEVEL_SPREAD))
         monster = create_monster(monster_name, monster_level)
         
         char.in_combat = True
@@ -799,18 +634,17 @@ class JanusPenthos(commands.Bot):
             "skill_points": char.skill_points,
             "current_hp": char.current_hp,
             "current_mp": char.current_mp,
+            # Copies, since the writer thread serializes them after this returns
             "equipment": {
-                "weapon": char.equipment.weapon,
-                "armor": char.equipment.armor,
-                "accessory": char.equipment.accessory
+                "weapon": dict(char.equipment.weapon),
+                "armor": dict(char.equipment.armor),
+                "accessory": dict(char.equipment.accessory)
             },
-            "inventory": char.inventory.items
+            "inventory": dict(char.inventory.items)
         }
         
         try:
-            os.makedirs("saves", exist_ok=True)
-            with open(f"saves/{user_id}.json", "w") as f:
-                json.dump(data, f, indent=2)
+            await writer.write_json(f"saves/{user_id}.json", data)
             await ctx.send("Game saved successfully!")
         except Exception as e:
             await ctx.send(f"Error saving game: {e}")
@@ -820,13 +654,11 @@ class JanusPenthos(commands.Bot):
         user_id = ctx.author.id
         save_path = f"saves/{user_id}.json"
         
-        if not os.path.exists(save_path):
-            await ctx.send("No save file found for you. Use `!start` to begin a new game.")
-            return
-        
         try:
-            with open(save_path, "r") as f:
-                data = json.load(f)
+            data = await writer.read_json(save_path)
+            if data is None:
+                await ctx.send("No save file found for you. Use `!start` to begin a new game.")
+                return
             
             char = Character(data["name"], data["user_id"])
             char.level = data["level"]
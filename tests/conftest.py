@@ -0,0 +1,24 @@
+import importlib.util
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules live at the repository root, next to the bot scripts
+sys.path.insert(0, ROOT)
+
+@pytest.fixture
+def load_script(tmp_path, monkeypatch):
+    """Import a bot script by file name, with `tmp_path` as the working directory for its data files"""
+    monkeypatch.chdir(tmp_path)
+
+    def load(filename):
+        name = re.sub(r"\W+", "_", os.path.splitext(filename)[0]).lower()
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return load
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from janus_stats import DEFAULT_PARAMETERS, STAT_PARAMETERS, decode_build, encode_build
+
+def test_build_code_round_trip():
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        build = {param: round(float(rng.uniform(0, 80)), 2) for param in STAT_PARAMETERS}
+        build["character_level"] = int(rng.integers(1, 101))
+        for param in ("vit_points", "def_points", "str_points", "int_points", "agi_points"):
+            build[param] = int(rng.integers(0, 60))
+        decoded = decode_build(encode_build(build))
+        for param in STAT_PARAMETERS:
+            assert decoded[param] == pytest.approx(build[param], abs=1e-4), param
+
+def test_build_code_of_defaults_round_trips():
+    assert decode_build(encode_build(DEFAULT_PARAMETERS)) == pytest.approx(DEFAULT_PARAMETERS)
+
+@pytest.mark.parametrize("code", ["", "not a code!", "AAAA"])
+def test_malformed_build_code_is_rejected(code):
+    with pytest.raises(ValueError):
+        decode_build(code)
+
+def test_build_code_typo_fails_checksum():
+    code = encode_build({"character_level": 50, "str_points": 120, "flat_weapon_atk": 150})
+    typo = code[:5] + ("B" if code[5] != "B" else "C") + code[6:]
+    with pytest.raises(ValueError):
+        decode_build(typo)
@@ -0,0 +1,46 @@
+import pytest
+
+from janus_cache import LRUCache
+
+def test_evicts_least_recently_used():
+    evicted = []
+    cache = LRUCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert evicted == [("b", 2)]
+    assert list(cache) == ["a", "c"]
+    assert cache.evictions == 1
+
+def test_peek_does_not_touch_recency_or_counters():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.peek("a") == 1
+    cache.put("c", 3)
+    assert "a" not in cache
+    assert cache.hits == cache.misses == 0
+
+def test_hit_rate():
+    cache = LRUCache(4)
+    assert cache.hit_rate == 0.0
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing", "default") == "default"
+    assert cache.hit_rate == 0.5
+    assert cache.info()["size"] == 1
+
+def test_pop_and_clear_do_not_call_on_evict():
+    evicted = []
+    cache = LRUCache(4, on_evict=lambda key, value: evicted.append(key))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.pop("a") == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert evicted == []
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(0)
@@ -0,0 +1,104 @@
+import json
+import logging
+
+import pytest
+
+from janus_character_store import CharacterStore
+
+def character(name="Aric", level=1):
+    return {
+        "name": name, "level": level, "exp": 120,
+        "base_hp": 100 * level, "base_mp": 3 * level + 20, "base_atk": 3 * level + 5,
+        "base_def": 3 * level + 5, "base_speed": 10,
+        "vit": 1, "int": 2, "str": 3, "def_stat": 4, "agi": 5,
+        "unallocated_points": 0, "ascension_count": 0,
+        "equipment": {
+            "weapon": {"name": "Sword", "atk": 5},
+            "armor": None,
+            "accessory": {"name": "Ring", "hp": 10},
+        },
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = CharacterStore(str(tmp_path / "characters.db"))
+    yield store
+    store.close()
+
+def write_json(directory, user_id, data):
+    with open(directory / f"{user_id}.json", "w") as f:
+        if isinstance(data, str):
+            f.write(data)
+        else:
+            json.dump(data, f)
+
+def test_save_and_load_round_trip(store):
+    store.save("1", character())
+    assert store.load("1") == character()
+    assert store.load("2") is None
+    assert "1" in store and len(store) == 1
+
+def test_save_many_and_load_many(store):
+    assert store.save_many({str(user_id): character(level=user_id) for user_id in range(1, 6)}) == 5
+    loaded = store.load_many(["2", "4", "missing"])
+    assert set(loaded) == {"2", "4"}
+    assert loaded["4"]["level"] == 4
+    assert store.user_ids() == ["1", "2", "3", "4", "5"]
+
+def test_save_replaces_existing_character(store):
+    store.save("1", character(level=1))
+    store.save("1", character(level=7))
+    assert len(store) == 1
+    assert store.load("1")["level"] == 7
+
+def test_delete(store):
+    store.save("1", character())
+    assert store.delete("1")
+    assert not store.delete("1")
+    assert "1" not in store
+
+def test_migrate_json_imports_once(store, tmp_path):
+    directory = tmp_path / "characters"
+    directory.mkdir()
+    write_json(directory, "1", character("Aric"))
+    write_json(directory, "2", character("Liana", level=30))
+
+    assert store.migrate_json(str(directory)) == 2
+    assert store.load("2") == character("Liana", level=30)
+
+    # Deleted characters stay deleted on the next start
+    store.delete("1")
+    assert store.migrate_json(str(directory)) == 0
+    assert "1" not in store
+
+    assert store.migrate_json(str(directory), force=True) == 2
+    assert "1" in store
+
+def test_migrate_json_skips_bad_files(store, tmp_path, caplog, capsys):
+    directory = tmp_path / "characters"
+    directory.mkdir()
+    write_json(directory, "1", character())
+    write_json(directory, "2", "{not json")
+    write_json(directory, "3", {"name": "Incomplete"})
+
+    with caplog.at_level(logging.INFO, logger="janus_character_store"):
+        assert store.migrate_json(str(directory)) == 1
+    assert store.user_ids() == ["1"]
+    skipped = [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING]
+    assert len(skipped) == 2
+    assert capsys.readouterr().out == ""
+
+def test_migration_is_recorded_in_the_database(tmp_path):
+    path = str(tmp_path / "characters.db")
+    directory = tmp_path / "characters"
+    directory.mkdir()
+    write_json(directory, "1", character())
+
+    store = CharacterStore(path)
+    assert store.migrate_json(str(directory)) == 1
+    store.close()
+
+    store = CharacterStore(path)
+    assert store.migrate_json(str(directory)) == 0
+    assert store.load("1") == character()
+    store.close()
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from janus_combat_sim import fight_batch, player_stats, report, simulate
+from janus_monsters import monster_stats_batch
+
+def arrays(**stats):
+    return {stat: np.array(values, dtype=float) for stat, values in stats.items()}
+
+def test_one_sided_fights():
+    player = arrays(max_hp=[100, 100], max_mp=[0, 0], atk=[1000, 1], defense=[0, 0])
+    monster = arrays(max_hp=[50, 1000], atk=[10, 500], defense=[0, 0], miss_chance=[0, 0])
+    summary = fight_batch(player, monster, fights=200, seed=0)
+    assert summary["win_rate"].tolist() == [1.0, 0.0]
+    assert summary["mean_turns"].tolist() == [1.0, 1.0]
+    assert summary["damage_taken"][0] == 0
+
+def test_turns_follow_the_damage_rules():
+    # 20 ATK against 0 DEF hits for 18-22, so a 100 HP monster takes 5 or 6 turns
+    player = arrays(max_hp=[10_000], max_mp=[0], atk=[20], defense=[0])
+    monster = arrays(max_hp=[100], atk=[1], defense=[0], miss_chance=[0])
+    summary = fight_batch(player, monster, fights=1000, seed=1)
+    assert summary["win_rate"][0] == 1.0
+    assert 5 <= summary["p10_turns"][0] <= summary["p90_turns"][0] <= 6
+
+def test_fights_that_run_too_long_time_out():
+    player = arrays(max_hp=[1000], max_mp=[0], atk=[1], defense=[1000])
+    monster = arrays(max_hp=[1000], atk=[1], defense=[1000], miss_chance=[0])
+    summary = fight_batch(player, monster, fights=10, max_turns=20, seed=2)
+    assert summary["timeout_rate"][0] == 1.0
+    assert summary["mean_turns"][0] == 20
+
+def test_skills_policy_beats_basic_attacks():
+    player = player_stats([20])
+    monster = {stat: values[0] for stat, values in monster_stats_batch(["Goblin Tank"], [22]).items()}
+    monster["miss_chance"] = 1 - monster["hit_chance"]
+    attack = fight_batch(player, monster, fights=2000, policy="attack", seed=3)
+    skills = fight_batch(player, monster, fights=2000, policy="skills", seed=3)
+    assert skills["mean_turns"][0] < attack["mean_turns"][0]
+
+def test_simulate_is_reproducible():
+    kwargs = dict(species=["Slime", "Goblin"], levels=[1, 50], fights=200, workers=1, seed=4)
+    first, second = simulate(**kwargs), simulate(**kwargs)
+    for key, values in first["stats"].items():
+        assert values.shape == (2, 2)
+        assert np.array_equal(values, second["stats"][key])
+    rows = report(first)
+    assert [(row["species"], row["level"]) for row in rows] == [("Slime", 1), ("Slime", 50), ("Goblin", 1), ("Goblin", 50)]
+
+@pytest.mark.parametrize("kwargs", [{"fights": 0}, {"policy": "flee"}, {"levels": [0]}, {"species": ["Dragon"]}])
+def test_bad_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        simulate(**dict({"species": ["Slime"], "levels": [1], "fights": 1, "workers": 1}, **kwargs))
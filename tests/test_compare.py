@@ -0,0 +1,22 @@
+import pytest
+
+from janus_stats import DEFAULT_PARAMETERS, STAT_PARAMETERS, builds_to_columns, compute_stats, compute_stats_batch, row
+
+BUILDS = [
+    {"character_level": 10, "str_points": 30},
+    {"character_level": 50, "vit_points": 100, "hp_percent": 0.3},
+    {"character_level": 100, "int_points": 300, "flat_weapon_atk": 400, "crit_rate_weapon": 50, "crit_damage_weapon": 150},
+]
+
+def test_builds_become_one_column_per_parameter():
+    columns = builds_to_columns(BUILDS)
+    assert set(columns) == set(STAT_PARAMETERS)
+    assert columns["character_level"].tolist() == [10, 50, 100]
+    assert columns["speed_boots"].tolist() == [DEFAULT_PARAMETERS["speed_boots"]] * 3
+
+def test_one_pass_comparison_matches_single_builds():
+    results = compute_stats_batch(builds_to_columns(BUILDS))
+    for index, build in enumerate(BUILDS):
+        single = compute_stats(build)
+        for stat, value in row(results, index).items():
+            assert value == pytest.approx(single[stat]), (index, stat)
@@ -0,0 +1,49 @@
+import json
+
+import numpy as np
+import pytest
+
+from janus_formulas import FORMULA_FILE, FORMULAS, CompiledFormulas, load_formulas
+
+def test_scalar_and_batch_agree():
+    group = CompiledFormulas("sample", {
+        "hp": "base_hp + vit * 30",
+        "capped": "min(hp, 1000)",
+        "rounded": "round(hp / 3)",
+    })
+    assert group.inputs == ("base_hp", "vit")
+    assert group.outputs == ("hp", "capped", "rounded")
+    assert group(base_hp=500, vit=20) == {"hp": 1100, "capped": 1000, "rounded": 367}
+
+    batch = group.batch(base_hp=[100, 500], vit=[1, 20])
+    assert batch["hp"].tolist() == [130, 1100]
+    assert batch["capped"].tolist() == [130, 1000]
+    assert batch["rounded"].tolist() == [43, 367]
+
+@pytest.mark.parametrize("formulas", [
+    {"hp": "__import__('os')"},
+    {"hp": "base_hp.real"},
+    {"hp": "abs(base_hp)"},
+    {"hp": "max(base_hp)"},
+    {"hp": "'100'"},
+    {"hp": "hp + 1"},
+    {"hp": "atk * 2", "atk": "base_atk"},
+    {"hp": "base_hp +"},
+    {"max": "1"},
+])
+def test_bad_formulas_are_rejected(formulas):
+    with pytest.raises(ValueError):
+        CompiledFormulas("bad", formulas)
+
+def test_output_shadowing_an_input_is_rejected():
+    with pytest.raises(ValueError):
+        CompiledFormulas("bad", {"hp": "base_hp", "atk": "hp", "base_hp": "1"})
+
+def test_compiled_group_is_read_only():
+    with pytest.raises(AttributeError):
+        FORMULAS["calculator"].outputs = ()
+
+def test_shipped_spec_compiles():
+    with open(FORMULA_FILE) as f:
+        spec = json.load(f)
+    assert set(load_formulas()) == set(spec) == set(FORMULAS)
@@ -0,0 +1,276 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+from discord.ext import commands
+
+from janus_progression import ASCENSION_LEVELS, MAX_LEVEL, PROGRESSION
+
+@pytest.fixture
+def growth(load_script):
+    return load_script("DISCORD Character GROWTH.py")
+
+class Context:
+    """Just enough of `commands.Context` for `level_up` and calling command callbacks directly"""
+    def __init__(self, user_id=1):
+        self.author = SimpleNamespace(id=user_id)
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(dict(kwargs, content=content))
+
+class Response:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, content=None, **kwargs):
+        self.sent.append(dict(kwargs, content=content))
+
+    async def defer(self):
+        pass
+
+class Interaction:
+    """A modal submission: the response plus the followup webhook"""
+    def __init__(self, user_id=1):
+        self.user = SimpleNamespace(id=user_id)
+        self.response = Response()
+        self.followup = Context(user_id)
+
+def fill(modal, *values):
+    for item, value in zip(modal.children, values):
+        item._value = value
+
+def grant_one_level_at_a_time(character, amount):
+    """Feed `amount` EXP in chunks that never clear more than one level"""
+    while amount > 0:
+        step = min(amount, character.exp_limit - character.exp) if character.level < MAX_LEVEL else amount
+        character.add_exp(step)
+        amount -= step
+
+def test_large_grant_matches_level_by_level(growth):
+    big = growth.Character("Janus")
+    result = big.add_exp(10_000_000)
+    small = growth.Character("Janus")
+    grant_one_level_at_a_time(small, 10_000_000)
+
+    assert result.old_level == 1
+    assert result.new_level == big.level == small.level
+    assert big.exp == small.exp
+    assert big.exp_limit == small.exp_limit
+    assert big.base_stats() == small.base_stats()
+    assert big.ascension_count == small.ascension_count
+    assert big.unallocated_points == small.unallocated_points
+
+def test_grant_crossing_several_ascensions(growth):
+    character = growth.Character("Janus")
+    character.add_exp(PROGRESSION[24].cumulative_exp)
+    assert character.level == 24
+
+    result = character.add_exp(PROGRESSION[76].cumulative_exp - PROGRESSION[24].cumulative_exp + 10)
+    assert (result.old_level, result.new_level) == (24, 76)
+    assert result.ascension_levels == (25, 50, 75)
+    assert result.points_gained == 3 * 52
+    assert result.old_stats == growth.level_base_stats(24)
+    assert character.ascension_count == 3
+    assert character.exp == 10
+    assert character.base_stats() == growth.level_base_stats(76)
+    assert character.unallocated_points == 3 + 3 * 75
+
+def test_exp_past_max_level_accumulates(growth):
+    character = growth.Character("Janus")
+    overflow = 123_456
+    result = character.add_exp(PROGRESSION[MAX_LEVEL].cumulative_exp + overflow)
+    assert character.level == result.new_level == MAX_LEVEL
+    assert character.exp == overflow
+    assert character.ascension_count == len(ASCENSION_LEVELS)
+    assert result.ascension_levels == ASCENSION_LEVELS
+
+    result = character.add_exp(10_000_000)
+    assert character.level == MAX_LEVEL
+    assert character.exp == overflow + 10_000_000
+    assert result.points_gained == 0
+    assert result.ascension_levels == ()
+
+def test_grant_below_the_next_level(growth):
+    character = growth.Character("Janus")
+    result = character.add_exp(character.exp_limit - 1)
+    assert character.level == result.new_level == 1
+    assert character.exp == character.exp_limit - 1
+    assert character.unallocated_points == 3
+
+def test_negative_exp_is_rejected(growth):
+    character = growth.Character("Janus")
+    with pytest.raises(ValueError):
+        character.add_exp(-1)
+    assert (character.level, character.exp) == (1, 0)
+
+def test_summary_stays_within_the_embed_limit(growth):
+    character = growth.Character("Janus")
+    events = growth.ProgressionEvents(character)
+    events.collect(character.add_exp(PROGRESSION[MAX_LEVEL].cumulative_exp))
+    embeds = events.summary_embeds()
+    # Level-up, one per ascension, status points
+    assert len(embeds) == 2 + len(ASCENSION_LEVELS)
+    assert [embed.footer.text for embed in embeds[1:-1]] == [f"Ascension {n} at level {level}" for n, level in enumerate(ASCENSION_LEVELS, 1)]
+
+    # More ascensions than fit in one message: the status point embed is kept last
+    events.collect(character.add_exp(0)._replace(ascension_levels=ASCENSION_LEVELS * 3))
+    embeds = events.summary_embeds()
+    assert len(embeds) == growth.MAX_EMBEDS_PER_MESSAGE
+    assert embeds[-1].title == "Status Points Applied"
+
+def test_detail_pages_cover_every_level(growth):
+    character = growth.Character("Janus")
+    events = growth.ProgressionEvents(character)
+    events.collect(character.add_exp(PROGRESSION[MAX_LEVEL].cumulative_exp))
+    pages = events.detail_pages()
+    assert len(pages) == 10
+    assert pages[0].title == "Janus: Level 1 → 11"
+    assert pages[-1].footer.text == "Page 10/10"
+    assert pages[-1].description.count("Ascension") == 1
+    assert sum(page.description.count("**Lv ") for page in pages) == MAX_LEVEL - 1
+
+def test_level_up_offers_details_only_for_several_levels(growth):
+    async def main():
+        character = growth.Character("Janus")
+        ctx = Context()
+        await character.level_up(ctx, character.add_exp(character.exp_limit))
+        assert ctx.sent[-1]["view"] is None
+        assert ctx.sent[-1]["embeds"][0].footer.text is None
+
+        await character.level_up(ctx, character.add_exp(PROGRESSION[30].cumulative_exp))
+        view = ctx.sent[-1]["view"]
+        assert isinstance(view, growth.ProgressionDetailView)
+        assert ctx.sent[-1]["embeds"][0].footer.text.startswith(f"+{character.level - 2} levels")
+
+        interaction = SimpleNamespace(user=ctx.author, response=Response())
+        await view.details.callback(interaction)
+        sent = interaction.response.sent[-1]
+        assert sent["ephemeral"]
+        assert sent["embed"].title == "Janus: Level 2 → 12"
+        assert isinstance(sent["view"], growth.ProgressionPageView)
+    asyncio.run(main())
+
+def test_equipment_edits_are_written_back(growth):
+    async def main():
+        await growth.save_character("1", growth.Character("Janus"))
+        await growth.save_character("2", growth.Character("Penthos"))
+
+        cache = growth.CharacterCache()
+        character = await cache.get("1")
+        character.equipment.set_item("armor", name="Chainmail", defense=12)
+        assert cache.is_dirty("1")
+        assert await cache.flush() == 1
+        assert not cache.is_dirty("1")
+        assert (await growth.load_character("1")).equipment.armor == {"name": "Chainmail", "defense": 12}
+
+        # Eviction writes back as well
+        cache = growth.CharacterCache(maxsize=1)
+        character = await cache.get("1")
+        character.equipment.set_item("weapon", name="Spear", attack=7)
+        await cache.get("2")
+        await growth.writer.run(lambda: None)
+        assert cache.write_backs == 1
+        assert (await growth.load_character("1")).equipment.weapon == {"name": "Spear", "attack": 7}
+    asyncio.run(main())
+
+def test_grant_rewards_members_and_rejects_roles_without_the_intent(growth):
+    async def main():
+        await growth.save_character("1", growth.Character("Janus"))
+        ctx = Context()
+        ctx.bot = growth.bot
+        ctx.guild = SimpleNamespace(chunked=False)
+        members = [SimpleNamespace(id=1, bot=False), SimpleNamespace(id=2, bot=False), SimpleNamespace(id=3, bot=True)]
+
+        await growth.grant_rewards_cmd.callback(ctx, 600, 2, *members)
+        embed = ctx.sent[-1]["embed"]
+        assert embed.description == "600 EXP and 2 status points to 1 character(s)."
+        assert embed.fields[0].value == "Janus: Lv 1 → 2"
+        assert embed.fields[-1].value == "1 user(s) without a character"
+        character = await growth.characters.get("1")
+        assert (character.level, character.unallocated_points) == (2, 3 + 3 + 2)
+
+        assert not growth.bot.intents.members
+        role = discord.Role.__new__(discord.Role)
+        await growth.grant_rewards_cmd.callback(ctx, 600, 0, role)
+        assert "Server Members intent" in ctx.sent[-1]["content"]
+        assert character.level == 2
+    asyncio.run(main())
+
+def test_grant_is_guild_only(growth):
+    async def main():
+        ctx = Context()
+        ctx.bot, ctx.guild, ctx.command = growth.bot, None, None
+        with pytest.raises(commands.NoPrivateMessage):
+            await growth.grant_rewards_cmd.can_run(ctx)
+    asyncio.run(main())
+
+def test_allocation_modal_spends_points_in_one_submission(growth):
+    async def main():
+        character = growth.Character("Janus")
+        character.add_exp(PROGRESSION[3].cumulative_exp)
+        growth.characters.put("1", character)
+        assert character.unallocated_points == 9
+
+        modal = growth.AllocationModal(character, 1)
+        assert len(modal.children) == len(growth.ALLOCATION_STATS)
+        fill(modal, "4", "", "x", "0", "0")
+        interaction = Interaction()
+        await modal.on_submit(interaction)
+        assert interaction.response.sent[-1]["content"] == "STR must be a whole number of points."
+
+        fill(modal, "4", "", "3", "0", "5")
+        await modal.on_submit(interaction)
+        assert "have 9, requested 12" in interaction.response.sent[-1]["content"]
+        assert character.vit == 0
+
+        fill(modal, "4", "", "3", "0", "2")
+        await modal.on_submit(interaction)
+        assert (character.vit, character.int, character.str, character.agi) == (4, 0, 3, 2)
+        assert character.unallocated_points == 0
+        assert [embed.title for embed in interaction.followup.sent[-1]["embeds"]] == ["Janus's Stat Allocation", "New Stats"]
+    asyncio.run(main())
+
+def test_equipment_modal_updates_the_slot(growth):
+    async def main():
+        character = growth.Character("Janus")
+        growth.characters.put("1", character)
+        modal = growth.EquipmentModal(character.equipment, 1, "weapon")
+        edited = []
+        interaction = Interaction()
+        async def edit_message(**kwargs):
+            edited.append(kwargs["embed"])
+        interaction.response.edit_message = edit_message
+
+        fill(modal, "Spear", "sharp")
+        await modal.on_submit(interaction)
+        assert interaction.response.sent[-1]["content"] == "Please enter a valid number. Equipment unchanged."
+        assert character.equipment.weapon == {"name": "None", "attack": 0}
+
+        fill(modal, "Spear", " 7 ")
+        await modal.on_submit(interaction)
+        assert character.equipment.weapon == {"name": "Spear", "attack": 7}
+        assert edited[-1].fields[0].value == "Spear (ATK +7)"
+    asyncio.run(main())
+
+def test_derived_stats_are_reused_until_something_changes(growth):
+    character = growth.Character("Janus")
+    stats = character.derived_stats()
+    assert character.derived_stats() is stats
+    assert character.total_hp() == stats["total_hp"]
+
+    character.equipment.set_item("weapon", name="Spear", attack=7)
+    stats = character.derived_stats()
+    assert stats["total_atk"] == growth.Character("Janus").total_atk() + 7
+    assert character.derived_stats() is stats
+
+    character.add_exp(character.exp_limit)
+    assert character.derived_stats() is not stats
+    stats = character.derived_stats()
+
+    async def main():
+        await character.allocate_stats(Context(), vit=2)
+    asyncio.run(main())
+    assert character.derived_stats() is not stats
+    assert character.total_hp() > stats["total_hp"]
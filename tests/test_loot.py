@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from janus_loot import LootTable
+
+TABLE = LootTable([
+    ("Gold", 1.0, 5, 15),
+    ("Potion", 0.3, 1, 2),
+    ("Gold", 0.1, 100, 100),
+    ("Dragon Scale", 0.0, 1, 1),
+])
+
+def test_single_roll_respects_ranges():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        drops = TABLE.roll(rng)
+        assert 5 <= drops["Gold"] <= 115
+        assert drops.get("Potion", 1) in (1, 2)
+        assert "Dragon Scale" not in drops
+
+def test_batch_totals_match_expectation():
+    rng = np.random.default_rng(1)
+    kills = 200_000
+    drops = TABLE.roll_batch(kills, rng)
+    expected = TABLE.expected(kills)
+    assert expected == pytest.approx({"Gold": 20.0 * kills, "Potion": 0.45 * kills, "Dragon Scale": 0.0})
+    assert drops["Gold"] == pytest.approx(expected["Gold"], rel=0.01)
+    assert drops["Potion"] == pytest.approx(expected["Potion"], rel=0.02)
+    assert "Dragon Scale" not in drops
+
+def test_batch_and_single_rolls_agree():
+    rng = np.random.default_rng(2)
+    kills = 20_000
+    singles = {}
+    for _ in range(kills):
+        for item, quantity in TABLE.roll(rng).items():
+            singles[item] = singles.get(item, 0) + quantity
+    batch = TABLE.roll_batch(kills, rng)
+    for item in singles:
+        assert batch[item] == pytest.approx(singles[item], rel=0.05)
+
+def test_zero_kills_drop_nothing():
+    assert TABLE.roll_batch(0) == {}
+    with pytest.raises(ValueError):
+        TABLE.roll_batch(-1)
+
+@pytest.mark.parametrize("entry", [("Gold", 1.5, 1, 2), ("Gold", -0.1, 1, 2), ("Gold", 0.5, 3, 2), ("Gold", 0.5, -1, 2)])
+def test_bad_entries_are_rejected(entry):
+    with pytest.raises(ValueError):
+        LootTable([entry])
+
+def test_empty_table():
+    table = LootTable([])
+    assert len(table) == 0
+    assert table.roll() == {}
+    assert table.roll_batch(10) == {}
@@ -0,0 +1,34 @@
+import pytest
+
+from janus_stats import STAT_PARAMETERS, compute_stats, marginal_values, parameter_step
+
+BUILD = {"character_level": 50, "vit_points": 30, "str_points": 60, "int_points": 20,
+         "flat_weapon_atk": 120, "atk_percent": 0.25, "crit_rate_weapon": 25, "crit_damage_weapon": 60,
+         "hp_percent": 0.1, "def_percent": 0.2}
+
+def test_gains_match_finite_differences():
+    base = compute_stats(BUILD)
+    values = marginal_values(BUILD)
+    for target, ranking in values.items():
+        gains = dict(ranking)
+        assert set(gains) == set(STAT_PARAMETERS)
+        for param in STAT_PARAMETERS:
+            bumped = compute_stats(dict(BUILD, **{param: base[param] + parameter_step(param)}))
+            assert gains[param] == pytest.approx(bumped[target] - base[target], abs=1e-9), (target, param)
+
+def test_rankings_are_sorted_best_first():
+    for ranking in marginal_values(BUILD).values():
+        gains = [gain for _, gain in ranking]
+        assert gains == sorted(gains, reverse=True)
+
+def test_known_slopes():
+    values = {target: dict(ranking) for target, ranking in marginal_values(BUILD).items()}
+    assert values["final_hp"]["vit_points"] == pytest.approx(30 * 1.1)
+    assert values["final_def"]["def_points"] == pytest.approx(1.2)
+    assert values["total_damage"]["agi_points"] == 0
+    assert parameter_step("atk_percent") == 0.01
+    assert parameter_step("str_points") == 1.0
+
+def test_clamped_inputs_gain_nothing():
+    values = {target: dict(ranking) for target, ranking in marginal_values(dict(BUILD, character_level=100)).items()}
+    assert values["final_hp"]["character_level"] == 0
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from janus_monsters import (
+    ENCOUNTER_LEVEL_SPREAD, MONSTERS, SPECIES, LevelTable, encounter_level, encounter_weights, exp_reward,
+    get_species, hit_chance, load_monsters, monster_family, monster_stats, monster_stats_batch
+)
+
+def test_lookups_use_exact_names():
+    assert monster_family("Acid Slime") == "Slime"
+    assert monster_family("Goblin Archer") == "Goblin"
+    with pytest.raises(ValueError):
+        get_species("Slime King")
+    with pytest.raises(ValueError):
+        get_species("slime")
+
+def test_exp_and_miss_chance_come_from_the_data_file():
+    assert exp_reward("Slime", 2) == 20
+    assert exp_reward("Slime", 50) == 0
+    assert hit_chance("Goblin Thief") == pytest.approx(0.7)
+    assert hit_chance("Slime") == 1.0
+
+def test_batch_stats_match_single_lookups():
+    levels = [1, 7, 50, 100]
+    batch = monster_stats_batch(SPECIES, levels)
+    for i, name in enumerate(SPECIES):
+        for j, level in enumerate(levels):
+            for stat, value in monster_stats(name, level).items():
+                assert batch[stat][i, j] == value, (name, level, stat)
+
+def test_encounters_respect_min_player_level():
+    low = dict(encounter_weights(1))
+    high = dict(encounter_weights(50))
+    assert "Slime" in low and "Goblin" not in low
+    assert "Goblin" in high
+    assert all(MONSTERS[name].encounter_weight == weight for name, weight in high.items())
+
+def test_encounter_levels_are_clamped():
+    assert encounter_level(1, -ENCOUNTER_LEVEL_SPREAD) == 1
+    assert encounter_level(100, ENCOUNTER_LEVEL_SPREAD) == 100
+    assert encounter_level(50, 2) == 52
+
+def test_level_tables():
+    table = LevelTable({"1": 5, "3-5": 7, "default": 9}, "test")
+    assert [table[level] for level in range(1, 7)] == [5, 9, 7, 7, 7, 9]
+    assert LevelTable(4, "test")[80] == 4
+    with pytest.raises(ValueError):
+        LevelTable({"first": 1}, "test")
+
+def write_species(tmp_path, **spec):
+    species = dict({"family": "Test", "stats": "monster_slime", "exp": 1}, **spec)
+    path = tmp_path / "monsters.json"
+    path.write_text(json.dumps({"species": {"Test": species}}))
+    return str(path)
+
+def test_new_species_only_need_data(tmp_path):
+    monsters = load_monsters(write_species(tmp_path, exp={"1-3": 4}, loot=[{"item": "Gel", "chance": 0.5}]))
+    species = monsters["Test"]
+    assert species.exp[2] == 4 and species.exp[4] == 0
+    assert species.loot[0].quantity[10] == (1, 1)
+
+@pytest.mark.parametrize("spec", [
+    {"stats": "no_such_group"},
+    {"miss_chance": 1.0},
+    {"loot": [{"item": "Gel", "chance": 1.5}]},
+    {"loot": [{"item": "Gel", "chance": 0.5, "quantity": [3, 2]}]},
+])
+def test_bad_species_are_rejected(tmp_path, spec):
+    with pytest.raises(ValueError):
+        load_monsters(write_species(tmp_path, **spec))
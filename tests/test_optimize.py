@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from janus_stats import POINT_PARAMETERS, compute_stats, compute_stats_batch, ehp, optimize_allocation
+
+def all_allocations(budget):
+    """Every way to spend at most `budget` points over the five stats"""
+    grid = np.indices((budget + 1,) * 5).reshape(5, -1)
+    return grid[:, grid.sum(axis=0) <= budget]
+
+@pytest.mark.parametrize("objective", ["damage", "ehp", "mix"])
+@pytest.mark.parametrize("gear", [
+    {"character_level": 4},
+    {"character_level": 7, "flat_weapon_atk": 40, "atk_percent": 0.3, "def_percent": 0.5, "hp_percent": 0.2,
+     "crit_rate_weapon": 20, "crit_damage_weapon": 80},
+])
+def test_optimizer_matches_brute_force(objective, gear):
+    best = optimize_allocation(gear, objective, damage_weight=0.3)
+
+    budget = 3 * gear["character_level"]
+    columns = dict(gear, **dict(zip(POINT_PARAMETERS, all_allocations(budget))))
+    results = compute_stats_batch(columns)
+    if objective == "damage":
+        score = results["total_damage"]
+    elif objective == "ehp":
+        score = ehp(results)
+    else:
+        baseline = compute_stats(dict(gear, **{param: 0 for param in POINT_PARAMETERS}))
+        score = (
+            0.3 * results["total_damage"] / baseline["total_damage"] +
+            0.7 * ehp(results) / (baseline["final_hp"] * (1 + baseline["final_def"] / 100))
+        )
+
+    assert best["score"] == pytest.approx(float(score.max()), rel=1e-12)
+    assert sum(best[param] for param in POINT_PARAMETERS) == budget
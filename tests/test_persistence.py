@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from janus_persistence import AsyncWriter, read_json_file, write_json_file
+
+def test_json_files_are_replaced_atomically(tmp_path):
+    path = str(tmp_path / "data" / "characters.json")
+    assert read_json_file(path, default={}) == {}
+    write_json_file(path, {"Aric": 1})
+    write_json_file(path, {"Aric": 2})
+    assert read_json_file(path) == {"Aric": 2}
+    assert [entry.name for entry in (tmp_path / "data").iterdir()] == ["characters.json"]
+
+def test_jobs_run_in_submission_order(tmp_path):
+    path = str(tmp_path / "characters.json")
+
+    async def main():
+        writer = AsyncWriter()
+        try:
+            writes = [writer.write_json(path, {"version": version}) for version in range(20)]
+            await asyncio.gather(*writes)
+            assert await writer.read_json(path) == {"version": 19}
+            info = writer.info()
+            assert info["completed"] == 21 and info["failed"] == 0 and info["queue_depth"] == 0
+        finally:
+            writer.shutdown()
+    asyncio.run(main())
+
+def test_failures_reach_the_caller():
+    async def main():
+        writer = AsyncWriter()
+        try:
+            with pytest.raises(ZeroDivisionError):
+                await writer.run(lambda: 1 / 0)
+            assert writer.info()["failed"] == 1
+        finally:
+            writer.shutdown()
+    asyncio.run(main())
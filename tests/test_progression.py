@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from janus_progression import MAX_LEVEL, PROGRESSION, exp_limit_for
+
+def level_by_level(total_exp):
+    """The bots' original loop: clear one level at a time"""
+    level, exp = 1, total_exp
+    while level < MAX_LEVEL and exp >= exp_limit_for(level):
+        exp -= exp_limit_for(level)
+        level += 1
+    return level, exp
+
+def test_exp_limits_follow_brackets():
+    assert exp_limit_for(1) == 500
+    assert exp_limit_for(5) == 2500
+    assert exp_limit_for(6) == 3600
+    assert exp_limit_for(100) == 250000
+
+def test_rows_and_columns_agree():
+    assert len(PROGRESSION) == MAX_LEVEL
+    for level in (1, 24, 25, 50, 99, 100):
+        row = PROGRESSION[level]
+        assert row.level == level
+        assert PROGRESSION.base_hp[level] == row.base_hp
+        assert PROGRESSION.exp_limit[level] == row.exp_limit
+
+def test_ascension_boost():
+    assert PROGRESSION[24].ascension == 0
+    assert PROGRESSION[25].ascension == 1
+    assert PROGRESSION[25].base_hp == 2750
+    assert PROGRESSION[100].ascension_multiplier == pytest.approx(1.4)
+    assert PROGRESSION[100].status_points == 300
+
+@pytest.mark.parametrize("level", [0, MAX_LEVEL + 1])
+def test_levels_out_of_range(level):
+    with pytest.raises(IndexError):
+        PROGRESSION[level]
+
+def test_level_for_exp_matches_level_by_level():
+    samples = [0, 499, 500, 501, 1499, 1500] + list(np.random.default_rng(0).integers(0, 15_000_000, 200))
+    samples.append(int(PROGRESSION.cumulative_exp[MAX_LEVEL]) + 10**6)
+    for total in samples:
+        assert PROGRESSION.level_for_exp(int(total)) == level_by_level(int(total))
+
+def test_levels_for_exp_matches_scalar_lookup():
+    totals = np.random.default_rng(1).integers(0, 15_000_000, 500)
+    expected = [PROGRESSION.level_for_exp(int(total))[0] for total in totals]
+    assert PROGRESSION.levels_for_exp(totals).tolist() == expected
+
+def test_negative_exp_is_rejected():
+    with pytest.raises(ValueError):
+        PROGRESSION.level_for_exp(-1)
+
+def test_table_is_read_only():
+    with pytest.raises(AttributeError):
+        PROGRESSION.max_level = 5
+    with pytest.raises(ValueError):
+        PROGRESSION.base_hp[1] = 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from janus_progression import PROGRESSION
+from janus_progression_sim import format_table, report, reward_distribution, simulate
+
+def constant_rewards(exp):
+    size = PROGRESSION.max_level + 1
+    return {"mean": np.full(size, float(exp)), "variance": np.zeros(size), "no_reward": np.zeros(size)}
+
+def test_constant_reward_distribution():
+    rewards = reward_distribution(lambda name, level: 40)
+    assert rewards["mean"][1:] == pytest.approx(40.0)
+    assert rewards["variance"][1:] == pytest.approx(0.0)
+    assert rewards["no_reward"][1:] == pytest.approx(0.0)
+
+def test_missing_rewards_count_as_nothing():
+    rewards = reward_distribution(lambda name, level: None)
+    assert rewards["mean"][1:] == pytest.approx(0.0)
+    assert rewards["no_reward"][1:] == pytest.approx(1.0)
+
+def test_players_level_like_the_table_says():
+    # Everyone wins exactly 10 fights a day worth 100 EXP each, so 1000 EXP/day
+    result = simulate(players=50, days=30, encounters_per_day=10, activity_spread=0, targets=(2, 5),
+                      seed=0, rewards=constant_rewards(100))
+    total = result["total_exp"]
+    assert total.mean() == pytest.approx(30_000, rel=0.05)
+    assert result["levels"].tolist() == PROGRESSION.levels_for_exp(total).tolist()
+    for target, first_day in result["reached"].items():
+        assert (first_day > 0).all()
+        expected = PROGRESSION.cumulative_exp[target] / 1000
+        assert np.median(first_day) == pytest.approx(expected, abs=2)
+
+def test_no_rewards_means_no_levels():
+    result = simulate(players=20, days=10, seed=1, rewards=constant_rewards(0))
+    assert (result["levels"] == 1).all()
+    rows = report(result)
+    assert [row["target_level"] for row in rows] == [25, 50, 75, 100]
+    assert all(row["players_reached"] == 0 and row["mean_days"] is None for row in rows)
+    assert "target_level" in format_table(rows)
+
+def test_bad_targets_are_rejected():
+    with pytest.raises(ValueError):
+        simulate(players=1, days=1, targets=(101,), rewards=constant_rewards(1))
@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from janus_prompts import PromptDispatcher
+
+def message(channel_id, author_id, content=""):
+    return SimpleNamespace(channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id), content=content)
+
+def run(test):
+    """Run `test(prompts)` on a dispatcher whose wheel is turned by hand"""
+    async def main():
+        prompts = PromptDispatcher(tick=3600, slots=4)
+        try:
+            await test(prompts)
+        finally:
+            if prompts._ticker is not None:
+                prompts._ticker.cancel()
+    asyncio.run(main())
+
+def test_message_goes_to_matching_prompt():
+    async def test(prompts):
+        future = prompts.ask(1, 10)
+        assert not prompts.dispatch(message(1, 11))
+        assert not prompts.dispatch(message(2, 10))
+        assert prompts.dispatch(message(1, 10, "yes"))
+        assert (await future).content == "yes"
+        await asyncio.sleep(0)  # let the done callback drop the prompt
+        assert len(prompts) == 0
+        assert prompts.info()["dispatched"] == 1
+    run(test)
+
+def test_check_filters_messages():
+    async def test(prompts):
+        future = prompts.ask(1, 10, check=lambda m: m.content.isdigit())
+        assert not prompts.dispatch(message(1, 10, "abc"))
+        assert prompts.dispatch(message(1, 10, "42"))
+        assert (await future).content == "42"
+    run(test)
+
+def test_oldest_prompt_is_answered_first():
+    async def test(prompts):
+        first = prompts.ask(1, 10)
+        second = prompts.ask(1, 10)
+        prompts.dispatch(message(1, 10, "a"))
+        prompts.dispatch(message(1, 10, "b"))
+        assert (await first).content == "a"
+        assert (await second).content == "b"
+    run(test)
+
+def test_prompts_expire_after_timeout():
+    async def test(prompts):
+        future = prompts.ask(1, 10, timeout=2 * 3600)
+        assert prompts._advance() == 0
+        assert prompts._advance() == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await future
+        assert not prompts.dispatch(message(1, 10))
+        assert prompts.info()["expired"] == 1
+    run(test)
+
+def test_long_timeouts_wait_extra_turns():
+    async def test(prompts):
+        future = prompts.ask(1, 10, timeout=6 * 3600)
+        expired = [prompts._advance() for _ in range(6)]
+        assert expired == [0, 0, 0, 0, 0, 1]
+        with pytest.raises(asyncio.TimeoutError):
+            await future
+    run(test)
+
+def test_cancelled_prompt_is_forgotten():
+    async def test(prompts):
+        future = prompts.ask(1, 10)
+        future.cancel()
+        await asyncio.sleep(0)
+        assert len(prompts) == 0
+        assert not prompts.dispatch(message(1, 10))
+    run(test)
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from janus_sessions import SessionStore
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "sessions.db")
+
+def test_spills_past_max_resident_and_loads_back(path):
+    store = SessionStore(path, max_resident=2)
+    for user_id in range(5):
+        store[user_id] = {"character_level": user_id + 1}
+    assert store.resident_count == 2
+    assert store.spills == 3
+    assert store[0] == {"character_level": 1}
+    assert store.loads == 1
+    store.close()
+
+def test_idle_sessions_are_spilled(path):
+    store = SessionStore(path, ttl=0.0)
+    store[1] = {"vit_points": 3}
+    assert store.resident_count == 0
+    assert store.get(1) == {"vit_points": 3}
+    store.close()
+
+def test_sessions_survive_restart(path):
+    store = SessionStore(path)
+    store[1] = {"str_points": 10}
+    store[2] = {"str_points": 20}
+    store.close()
+
+    store = SessionStore(path)
+    assert store.stored_count() == 2
+    assert store[2] == {"str_points": 20}
+    store.close()
+
+def test_flush_writes_only_changed_sessions(path):
+    store = SessionStore(path)
+    store[1] = {"agi_points": 1}
+    assert store.flush() == 1
+    assert store.flush() == 0
+    store[1]["agi_points"] = 2
+    assert store.flush() == 1
+    store.close()
+
+def test_delete_removes_stored_row(path):
+    store = SessionStore(path, max_resident=1)
+    store[1] = {"int_points": 5}
+    store[2] = {"int_points": 6}
+    del store[1]
+    assert 1 not in store
+    with pytest.raises(KeyError):
+        del store[1]
+    store.close()
+
+    store = SessionStore(path)
+    assert store.get(1) is None
+    store.close()
+
+def test_preload(path):
+    store = SessionStore(path, max_resident=1)
+    store[1] = {"def_points": 7}
+    store[2] = {"def_points": 8}
+    asyncio.run(store.preload(1))
+    assert store.resident_count == 1
+    assert store.loads == 1
+    assert store[1] == {"def_points": 7}
+    assert store.loads == 1
+    assert store.info()["write_errors"] == 0
+    store.close()
+
+def test_nested_edits_count_as_changes(path):
+    store = SessionStore(path)
+    store[1] = {"builds": {}}
+    assert store.flush() == 1
+    store[1]["builds"]["tank"] = {"vit_points": 30}
+    assert store.flush() == 1
+    del store[1]["builds"]["tank"]
+    assert store.flush() == 1
+    assert store.flush() == 0
+    store.close()
@@ -0,0 +1,36 @@
+import pytest
+
+from janus_stats import compute_stats, simulate_damage
+
+BUILD = {"character_level": 40, "str_points": 60, "flat_weapon_atk": 80,
+         "crit_rate_weapon": 30, "crit_damage_weapon": 100, "elemental_dmg_bonus": 0.2}
+
+def test_mean_converges_to_expected_damage():
+    result = simulate_damage(BUILD, 1_000_000, seed=0)
+    assert result["mean"] == pytest.approx(result["expected"], rel=0.005)
+    assert result["expected"] == pytest.approx(compute_stats(BUILD)["total_damage"])
+    assert result["crit_rate_observed"] == pytest.approx(0.3, abs=0.005)
+
+def test_percentiles_are_hit_values():
+    result = simulate_damage(BUILD, 10_000, seed=1)
+    assert result["p50"] == pytest.approx(result["normal_hit"])
+    assert result["p99"] == pytest.approx(result["crit_hit"])
+    assert result["crit_hit"] == pytest.approx(result["normal_hit"] * 2)
+
+def test_bursts_and_kill_chance():
+    result = simulate_damage(BUILD, 100_000, hp_threshold=0, burst=10, seed=2)
+    assert result["bursts"] == 10_000
+    assert result["hits"] == 100_000
+    assert result["kill_chance"] == 1.0
+    assert result["p50"] <= result["p90"] <= result["p99"]
+
+    unreachable = simulate_damage(BUILD, 1000, hp_threshold=result["crit_hit"] * 11, burst=10, seed=2)
+    assert unreachable["kill_chance"] == 0.0
+
+def test_same_seed_same_result():
+    assert simulate_damage(BUILD, 5000, 1000, burst=5, seed=3) == simulate_damage(BUILD, 5000, 1000, burst=5, seed=3)
+
+@pytest.mark.parametrize("hits, burst", [(0, 1), (10, 0), (10, 11), (10_000_001, 1)])
+def test_bad_hit_counts_are_rejected(hits, burst):
+    with pytest.raises(ValueError):
+        simulate_damage(BUILD, hits, burst=burst)
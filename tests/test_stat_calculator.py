@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+from discord.ext import commands
+
+class Context:
+    """Just enough of `commands.Context` for calling command callbacks directly"""
+    def __init__(self, user_id=1):
+        self.author = SimpleNamespace(id=user_id, mention=f"<@{user_id}>")
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+def test_setup_registers_the_cog_and_starts_the_sweep(load_script):
+    calculator = load_script("Janus Stat Calculator.py")
+
+    async def main():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.default())
+        await calculator.setup(bot)
+        cog = bot.get_cog("JanusPenthosStatBot")
+        assert cog is not None
+        assert bot.get_command("stats calculate") is not None
+        assert cog.sweep_sessions.is_running()
+
+        await bot.remove_cog("JanusPenthosStatBot")
+        await asyncio.sleep(0)
+        assert not cog.sweep_sessions.is_running()
+    asyncio.run(main())
+
+def test_saved_builds_survive_flush_and_restart(load_script):
+    calculator = load_script("Janus Stat Calculator.py")
+    ctx = Context()
+
+    async def main():
+        cog = calculator.JanusPenthosStatBot(bot=None)
+        await cog.new_calculation.callback(cog, ctx)
+        cog.user_data.flush()
+        await cog.set_value.callback(cog, ctx, "vit_points", 30)
+        await cog.save_build.callback(cog, ctx, "Tank")
+        await cog.save_build.callback(cog, ctx, "spare")
+        assert cog.user_data.flush() == 1
+        await cog.delete_build.callback(cog, ctx, "spare")
+        assert cog.user_data.flush() == 1
+        cog.user_data.close()
+
+        cog = calculator.JanusPenthosStatBot(bot=None)
+        assert set(cog.user_data[ctx.author.id]["builds"]) == {"tank"}
+        assert cog.user_data[ctx.author.id]["builds"]["tank"]["vit_points"] == 30
+        cog.user_data.close()
+    asyncio.run(main())
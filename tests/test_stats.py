@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from janus_stats import DEFAULT_PARAMETERS, STAT_PARAMETERS, compute_stats, compute_stats_batch
+
+def baseline_stats(params):
+    """The original `!stats calculate` math, one build at a time"""
+    data = dict(DEFAULT_PARAMETERS, **params)
+    level = max(1, min(data["character_level"], 100))
+    vit, defense, strength, intelligence, agility = (
+        max(0, min(data[param], 300)) for param in ("vit_points", "def_points", "str_points", "int_points", "agi_points")
+    )
+    ascension = sum(1 for threshold in (25, 50, 75, 100) if level >= threshold) * 0.10
+    effective_hp = 100 * level * (1 + ascension) + vit * 30
+    effective_mp = (3 * level + 20) * (1 + ascension) + intelligence * 5
+    effective_atk = (3 * level + 5) * (1 + ascension) + strength * 2 + intelligence * 2
+    effective_def = (3 * level + 5) * (1 + ascension) + defense
+    crit_rate = sum(max(0.0, data[f"crit_rate_{source}"]) for source in ("weapon", "armor", "substats"))
+    crit_dmg = sum(max(0.0, data[f"crit_damage_{source}"]) for source in ("weapon", "armor", "substats"))
+    final_atk = (effective_atk + max(0.0, data["flat_weapon_atk"])) * (1 + max(0.0, data["atk_percent"]))
+    avg_damage = final_atk * (1 + crit_rate / 100 * crit_dmg / 100)
+    return {
+        "sp_available": min(3 * level, 300),
+        "final_hp": effective_hp * (1 + max(0.0, data["hp_percent"])),
+        "final_mp": effective_mp + max(0.0, data["mp_gear"]) + max(0.0, data["mp_substats"]),
+        "final_atk": final_atk,
+        "final_def": effective_def * (1 + max(0.0, data["def_percent"])),
+        "final_speed": 10 + agility + max(0.0, data["speed_boots"]) + max(0.0, data["speed_substats"]),
+        "final_crit_rate": crit_rate,
+        "final_crit_dmg": crit_dmg,
+        "avg_damage": avg_damage,
+        "total_damage": avg_damage * (1 + max(0.0, data["elemental_dmg_bonus"])),
+    }
+
+def random_builds(count, seed=0):
+    rng = np.random.default_rng(seed)
+    builds = []
+    for _ in range(count):
+        build = {param: float(rng.uniform(0, 80)) for param in STAT_PARAMETERS}
+        build["character_level"] = int(rng.integers(1, 101))
+        for param in ("atk_percent", "def_percent", "hp_percent", "elemental_dmg_bonus"):
+            build[param] = float(rng.uniform(0, 1))
+        for param in ("vit_points", "def_points", "str_points", "int_points", "agi_points"):
+            build[param] = int(rng.integers(0, 60))
+        builds.append(build)
+    return builds
+
+def test_batch_matches_baseline_formula():
+    builds = random_builds(200)
+    columns = {param: [build[param] for build in builds] for param in STAT_PARAMETERS}
+    results = compute_stats_batch(columns)
+    for index, build in enumerate(builds):
+        for stat, expected in baseline_stats(build).items():
+            assert results[stat][index] == pytest.approx(expected, rel=1e-9), (index, stat)
+
+def test_single_build_matches_batch_row():
+    build = random_builds(1, seed=1)[0]
+    single = compute_stats(build)
+    batch = compute_stats_batch({param: [build[param]] for param in STAT_PARAMETERS})
+    for stat, value in single.items():
+        assert value == pytest.approx(batch[stat][0])
+
+def test_inputs_are_clamped():
+    results = compute_stats({"character_level": 250, "vit_points": -5, "atk_percent": -1})
+    assert results["character_level"] == 100
+    assert results["vit_points"] == 0
+    assert results["atk_percent"] == 0
+
+def test_over_allocated_builds_are_flagged():
+    results = compute_stats_batch({"character_level": [1, 1], "vit_points": [3, 4]})
+    assert results["valid"].tolist() == [True, False]
@@ -0,0 +1,48 @@
+import itertools
+
+import pytest
+
+from janus_stats import DEFAULT_SUBSTAT_COSTS, SUBSTATS, compute_stats, optimize_substats
+
+BUILD = {"character_level": 60, "str_points": 120, "flat_weapon_atk": 150, "crit_rate_weapon": 20, "crit_damage_weapon": 50}
+
+def damage_with(spent, budget=60.0):
+    """Total damage of BUILD with `spent` budget per substat, the slow way"""
+    build = dict(BUILD)
+    for name, amount in spent.items():
+        param, unit = SUBSTATS[name]
+        build[param] = build.get(param, 0.0) + amount / DEFAULT_SUBSTAT_COSTS[name] * unit
+    return compute_stats(build)
+
+def test_best_split_matches_exhaustive_search():
+    budget, steps = 60.0, 6
+    result = optimize_substats(BUILD, budget, steps=steps)
+
+    best = -1.0
+    for split in itertools.product(range(steps + 1), repeat=len(SUBSTATS)):
+        if sum(split) != steps:
+            continue
+        stats = damage_with({name: count * budget / steps for name, count in zip(SUBSTATS, split)})
+        if stats["final_crit_rate"] <= 100 or split[0] == 0:
+            best = max(best, stats["total_damage"])
+
+    assert result["best"]["spent"] == pytest.approx(budget)
+    assert result["best"]["total_damage"] == pytest.approx(best)
+    assert result["best"]["baseline_damage"] == pytest.approx(compute_stats(BUILD)["total_damage"])
+
+def test_frontier_has_one_row_per_spending_level():
+    result = optimize_substats(BUILD, 40.0, steps=8)
+    frontier = result["frontier"]
+    assert [row["spent"] for row in frontier] == pytest.approx([5.0 * step for step in range(9)])
+    damage = [row["total_damage"] for row in frontier]
+    assert damage == sorted(damage)
+
+def test_crit_rate_is_not_pushed_past_the_cap():
+    build = dict(BUILD, crit_rate_weapon=95)
+    result = optimize_substats(build, 100.0, steps=10)
+    assert result["best"]["final_crit_rate"] <= 100
+
+@pytest.mark.parametrize("budget, costs", [(0, None), (-5, None), (10, {"crit_rate": 0})])
+def test_bad_budget_or_costs_are_rejected(budget, costs):
+    with pytest.raises(ValueError):
+        optimize_substats(BUILD, budget, costs)
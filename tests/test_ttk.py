@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+import pytest
+
+from janus_monsters import SPECIES, hit_chance, monster_stats
+from janus_stats import compute_stats, time_to_kill
+
+BUILD = {"character_level": 30, "str_points": 60, "vit_points": 30, "flat_weapon_atk": 60, "def_percent": 0.3}
+
+def test_matrix_matches_single_fights():
+    levels = [1, 5, 30, 60, 100]
+    result = time_to_kill(BUILD, levels=levels)
+    stats = compute_stats(BUILD)
+    assert result["turns_to_kill"].shape == (len(SPECIES), len(levels))
+    for i, name in enumerate(SPECIES):
+        for j, level in enumerate(levels):
+            monster = monster_stats(name, level)
+            to_kill = math.ceil(monster["max_hp"] / max(1.0, stats["final_atk"] - monster["defense"] * 0.7))
+            to_die = math.ceil(stats["final_hp"] / max(1.0, monster["atk"] - stats["final_def"] * 0.7)) / hit_chance(name)
+            assert result["turns_to_kill"][i, j] == to_kill, (name, level)
+            assert result["turns_to_die"][i, j] == pytest.approx(to_die), (name, level)
+            assert result["wins"][i, j] == (to_kill <= to_die)
+
+def test_max_level_is_the_end_of_the_winning_streak():
+    result = time_to_kill(BUILD)
+    assert result["levels"].tolist() == list(range(1, 101))
+    for wins, max_level in zip(result["wins"], result["max_level"]):
+        streak = int(np.argmin(wins)) if not wins.all() else len(wins)
+        assert max_level == streak
+
+def test_stronger_builds_beat_higher_levels():
+    weak = time_to_kill({"character_level": 10})
+    strong = time_to_kill(dict(BUILD, character_level=100, str_points=300, flat_weapon_atk=500))
+    assert (strong["max_level"] >= weak["max_level"]).all()